@@ -0,0 +1,62 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Python script to measure the time and the memory taken by the as_xarray method.
+
+For each data file, `Data(filepath).as_xarray()` is run `--repeat` times (the data file being
+opened beforehand), and the median time is reported, with the peak memory allocated by the
+method (as traced by tracemalloc in an extra run, numpy arrays included).
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+import warnings
+
+from maser.data import Data
+
+
+def measure(filepath: str, dataset: str, repeat: int):
+    """Get the median time (in seconds) and the peak memory (in bytes) of as_xarray."""
+    times = []
+    for run in range(repeat + 1):
+        with Data(filepath, dataset=dataset) as data:
+            # the times and frequencies may be read once and for all by a dataset
+            data.times, data.frequencies
+            if run == repeat:
+                # the memory is traced in a separate run, tracemalloc slowing down the
+                # allocations
+                tracemalloc.start()
+                data.as_xarray()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            else:
+                start = time.perf_counter()
+                data.as_xarray()
+                times.append(time.perf_counter() - start)
+    return statistics.median(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filepaths", nargs="+", help="Data files")
+    parser.add_argument(
+        "-d", "--dataset", default="__auto__", help="Dataset of the data files"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Number of runs per file"
+    )
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    # import xarray before the first measure
+    import xarray  # noqa: F401
+
+    for filepath in args.filepaths:
+        median, peak = measure(filepath, args.dataset, args.repeat)
+        print(f"{filepath}: {median:.3f} s, {peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
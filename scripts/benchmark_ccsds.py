@@ -0,0 +1,106 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Python script to measure the throughput of the CCSDS time code decoders.
+
+For each time code format (CUC level 1, CDS level 1 and 2, CCS), `--count` random time codes
+are decoded with `decode_ccsds_date` (one CCSDSDate object per time code) and with
+`decode_ccsds_dates` (all the time codes at once). The results of both decoders are checked
+to be identical, and the number of time codes decoded per second is reported (best of
+`--repeat` runs).
+"""
+
+import argparse
+import datetime
+import time
+
+import numpy
+
+from maser.data.cdpp.ccsds import decode_ccsds_date, decode_ccsds_dates
+
+EPOCH = datetime.datetime(1950, 1, 1)
+
+
+def cuc_time_codes(rng, count):
+    """CUC level 1, 4 bytes of coarse time and 2 bytes of fine time."""
+    t_fields = rng.integers(0, 256, (count, 6), dtype=numpy.uint8)
+    t_fields[:, 0] &= 0x7F
+    return 0b10110010, t_fields
+
+
+def cds_time_codes(rng, count, level=1):
+    """CDS level 1 or 2, 2 bytes of day, 4 bytes of ms of day and 2 bytes of sub-ms."""
+    t_fields = rng.integers(0, 256, (count, 8), dtype=numpy.uint8)
+    t_fields[:, 0] &= 0x7F
+    t_fields[:, 2] = 0
+    return 0b01001000 | (16 if level == 2 else 0), t_fields
+
+
+def ccs_time_codes(rng, count):
+    """CCS, year, month, day of month, hour, minute, second and 2 sub-second bytes."""
+    year = rng.integers(1960, 2100, count)
+    columns = [
+        year // 256,
+        year % 256,
+        rng.integers(1, 13, count),
+        rng.integers(1, 29, count),
+        rng.integers(0, 24, count),
+        rng.integers(0, 60, count),
+        rng.integers(0, 60, count),
+        rng.integers(0, 100, count),
+        rng.integers(0, 100, count),
+    ]
+    return 0b01001010, numpy.stack(columns, axis=1).astype(numpy.uint8)
+
+
+CASES = {
+    "CUC level 1": cuc_time_codes,
+    "CDS level 1": cds_time_codes,
+    "CDS level 2": lambda rng, count: cds_time_codes(rng, count, level=2),
+    "CCS": ccs_time_codes,
+}
+
+
+def best_time(function, repeat):
+    """Get the best time (in seconds) and the result of a function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n", "--count", type=int, default=100000, help="Number of time codes"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Number of runs per case"
+    )
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(0)
+    print(f"{'':<12} {'scalar':>14} {'array':>14}")
+    for name, time_codes in CASES.items():
+        p_field, t_fields = time_codes(rng, args.count)
+        scalar, expected = best_time(
+            lambda: [
+                decode_ccsds_date(p_field, t_field, EPOCH).datetime
+                for t_field in t_fields.tolist()
+            ],
+            args.repeat,
+        )
+        array, result = best_time(
+            lambda: decode_ccsds_dates(p_field, t_fields, EPOCH), args.repeat
+        )
+        if result.astype("M8[us]").tolist() != expected:
+            raise ValueError(f"{name}: the decoders give different times")
+        print(
+            f"{name:<12} {args.count / scalar:10.3g} /s {args.count / array:10.3g} /s"
+        )
+
+
+if __name__ == "__main__":
+    main()
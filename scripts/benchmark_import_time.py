@@ -0,0 +1,71 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Python script to measure the import time of maser.data.
+
+Each case is run in a fresh Python interpreter, `--repeat` times, and the median time is
+reported:
+
+* `import maser.data` only (the dataset classes are imported on demand),
+* `import maser.data` and one dataset class, as a worker reading one dataset would do,
+* `import maser.data`, all the dataset classes and xarray (what `import maser.data` used to
+  do).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+REGISTRY = "from maser.data.base.base import BaseData; registry = BaseData._registry"
+
+CASES = {
+    "import maser.data": "import maser.data",
+    "one dataset class": f"import maser.data; {REGISTRY}; registry['{{dataset}}']",
+    "all dataset classes": f"import maser.data; {REGISTRY}; registry.load_all(); "
+    "import xarray",
+}
+
+TIMER = """
+import time, warnings
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, repeat: int) -> float:
+    """Get the median time (in seconds) of a statement run in fresh interpreters."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="Number of runs per case"
+    )
+    parser.add_argument(
+        "-d",
+        "--dataset",
+        default="co_rpws_hfr_kronos_n1",
+        help="Dataset of the 'one dataset class' case",
+    )
+    args = parser.parse_args()
+
+    for name, statement in CASES.items():
+        median = measure(statement.format(dataset=args.dataset), args.repeat)
+        print(f"{name:<24} {median * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
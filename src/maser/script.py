@@ -71,6 +71,16 @@ def main():
         add_cdfcompare_subparser(subparsers)
         add_cdfvalidator_subparser(subparsers)
 
+    try:
+        from maser.data.parallel import ingest
+        from maser.data.subparser import add_ingest_subparser
+    except ImportError:
+        print(
+            "WARNING: maser-data submodule is not installed. Run 'pip install maser4py[data] first, then retry'"
+        )
+    else:
+        add_ingest_subparser(subparsers)
+
     # Parse args
     args = parser.parse_args()
 
@@ -236,6 +246,21 @@ def main():
             except Exception:
                 logger.error("cannot run cdf_validator, aborting!")
                 sys.exit(-1)
+        # ingest sub-command
+        elif "ingest" in args.maser:
+            failed = ingest(
+                args.filepaths,
+                args.output_dir[0],
+                dataset=args.dataset[0],
+                workers=args.workers[0],
+                chunksize=args.chunksize[0],
+                ordered=not args.unordered,
+            )
+            if len(failed) > 0:
+                logger.warning("Following files have not been converted correctly:")
+                for bad in failed:
+                    logger.warning(bad)
+                sys.exit(-1)
         else:
             print("Unknown maser sub-command")
             parser.print_help()
@@ -1,77 +1,33 @@
 # -*- coding: utf-8 -*-
 from .base import Data
+from .base import DataCollection  # noqa: F401
+from .base.registry import _dataset_manifest, _lazy_exports
 from pathlib import Path
 
-from .cdpp import (  # noqa: F401
-    WindWavesRad1L260sV2BinData,
-    WindWavesRad1L2BinData,
-    WindWavesRad2L260sV2BinData,
-    WindWavesTnrL260sV2BinData,
-    WindWavesTnrL3Bqt1mnBinData,
-    WindWavesTnrL3NnBinData,
-    WindWavesRad1L260sV1BinData,
-    WindWavesRad2L260sV1BinData,
-    WindWavesTnrL260sV1BinData,
-    VikingV4nE5BinData,
-    InterballAuroralPolradRspBinData,
-    StereoAWavesL2HighResLfrBinData,
+# The dataset classes (and the subpackages defining them) are only imported when they are
+# used, either by name (e.g. `from maser.data import RpwTnrSurv`) or through the registry of
+# the datasets (e.g. `Data(filepath)`), see base/dataset_registry.json
+__getattr__, __dir__ = _lazy_exports(
+    __name__,
+    {
+        **{
+            path.split(":")[1]: path.split(":")[0]
+            for path in _dataset_manifest().values()
+        },
+        **{
+            subpackage: f".{subpackage}"
+            for subpackage in [
+                "cdpp",
+                "ecallisto",
+                "nancay",
+                "padc",
+                "pds",
+                "psa",
+                "radiojove",
+            ]
+        },
+    },
 )
-from .ecallisto import (  # noqa: F401
-    ECallistoFitsData,
-)
-from .nancay import (  # noqa: F401
-    OrnNdaRoutineJupEdrCdfData,
-    OrnNdaRoutineSunEdrCdfData,
-    OrnNdaNewRoutineJupEdrFitsData,
-    OrnNdaNewRoutineSunEdrFitsData,
-    OrnNdaNewRoutineTransitEdrFitsData,
-    OrnNenufarBstFitsData,
-)
-from .padc import (  # noqa: F401
-    JnoWavLesiaL3aV02Data,
-    CoRpwsHfrKronosN1Data,
-    CoRpwsHfrKronosN2Data,
-    StaWavLfrL3DfCdf,
-    StbWavLfrL3DfCdf,
-    StaWavHfrL3DfCdf,
-    StbWavHfrL3DfCdf,
-    WindWavesRad1L3DfV01Data,
-    WindWavesRad1L3DfV02Data,
-    SorbetL1CdfDbsc,
-    SorbetL1CdfTnr,
-    RpwLfrSurvBp1,
-    RpwHfrSurv,
-    RpwTnrSurv,
-    RpwTnrL3Cdf,
-    RpwHfrL3Cdf,
-    JuiceRPWIhfL1aCdfSID2,
-    JuiceRPWIhfL1aCdfSID3,
-    JuiceRPWIhfL1aCdfSID4,
-    JuiceRPWIhfL1aCdfSID20,
-    JuiceRPWIhfL1aCdfSID5,
-    JuiceRPWIhfL1aCdfSID21,
-    JuiceRPWIhfL1aCdfSID6,
-    JuiceRPWIhfL1aCdfSID22,
-    JuiceRPWIhfL1aCdfSID7,
-    JuiceRPWIhfL1aCdfSID23,
-    JuiceRPWIhfL1bCdf,
-)
-
-from .pds import (  # noqa: F401
-    Pds3Data,
-    Vg1JPra3RdrLowband6secV1Data,
-    Vg1JPra4SummBrowse48secV1Data,
-    Vg1SPra3RdrLowband6secV1Data,
-    Vg2JPra4SummBrowse48secV1Data,
-    Vg2NPra2RdrHighrate60msV1Data,
-    Vg2NPra3RdrLowband6secV1Data,
-    Vg2NPra4SummBrowse48secV1Data,
-    Vg2UPra3RdrLowband6secV1Data,
-    Vg2UPra4SummBrowse48secV1Data,
-    CoVEJSSSRpws2RefdrWbrFullV1Data,
-    CoVEJSSSRpws3RdrLrFullV1Data,
-)
-from .psa import MexMMarsis3RdrAisExt4V1Data  # noqa: F401
 
 if __name__ == "__main__":
     data = Data(filepath=Path("toto.txt"), dataset="cdf")
@@ -14,6 +14,10 @@ Defined in base.
 * `CdfData` Class: Generic class for CDF formatted data products.
 * `FitsData` Class: Generic class for FITS formatted data products.
 
+Defined in collection.
+
+* `DataCollection` Class: Class to load a time series of data files of a same dataset.
+
 Iterator classes
 ----------------
 
@@ -38,6 +42,7 @@ from .base import (  # noqa: F401
     CdfData,
     FitsData,
 )
+from .collection import DataCollection  # noqa: F401
 from .mixins import (  # noqa: F401
     RecordsOnly,
     FixedFrequencies,
@@ -12,27 +12,70 @@ Data object classes
 * `FitsData` Class: Generic class for FITS formatted data products.
 """
 
-from typing import Union, Dict, Type, cast
+from typing import TYPE_CHECKING, Any, Union, Dict, List, Tuple, Type, cast
 
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from pathlib import Path
+import hashlib
+import os
 import re
 import math
+import zipfile
 from astropy.io import fits
 import numpy
 import warnings
 from .sweeps import Sweeps
 from .records import Records
+from .registry import _DatasetRegistry
 
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity, Unit
-import xarray
+
+if TYPE_CHECKING:  # xarray is only imported when it is used
+    import xarray
+
+
+@lru_cache(maxsize=None)
+def _filename_regex(kind: str) -> List[Tuple[str, "re.Pattern"]]:
+    """Get the (dataset, compiled regex) pairs used to identify the datasets of the `kind` files
+    from their names (loaded once from dataset_filename_regex.json)."""
+    import json
+
+    with open(Path(__file__).parent / "dataset_filename_regex.json") as f:
+        filename_regex = json.load(f)
+    return [(dataset, re.compile(regex)) for dataset, regex in filename_regex[kind]]
+
+
+def _datetime64_to_time(values) -> Time:
+    """Build a Time object from a datetime64 array, through its calendar fields (much faster
+    than parsing the datetime64 values one by one)."""
+    values = numpy.asarray(values, dtype="M8[ns]")
+    years = values.astype("M8[Y]")
+    months = values.astype("M8[M]")
+    days = values.astype("M8[D]")
+    seconds = values - days
+    times = Time(
+        {
+            "year": years.astype(int) + 1970,
+            "month": (months - years).astype(int) + 1,
+            "day": (days - months).astype(int) + 1,
+            "hour": seconds // numpy.timedelta64(1, "h"),
+            "minute": seconds % numpy.timedelta64(1, "h") // numpy.timedelta64(1, "m"),
+            "second": seconds % numpy.timedelta64(1, "m") / numpy.timedelta64(1, "s"),
+        },
+        format="ymdhms",
+        scale="utc",
+    )
+    times.format = "datetime"
+    return times
 
 
 class BaseData:
     """Base class for all data classes."""
 
     dataset: str
-    _registry: Dict[str, Type["BaseData"]] = {}
+    _registry: Dict[str, Type["BaseData"]] = _DatasetRegistry()
     _access_modes = ["sweeps", "records", "file"]
     _iter_sweep_class = Sweeps
     _iter_record_class = Records
@@ -67,8 +110,14 @@ class BaseData:
         else:
             self.access_mode = access_mode
 
-        # a reference to the file object
-        self._file = None
+        # a reference to the file object (which may have been opened to identify the dataset)
+        self._file = getattr(self, "_file", None)
+
+        # the variables read from the file (see `Data._cached_variable`), with their total size
+        self._variables: "OrderedDict[Any, Any]" = getattr(
+            self, "_variables", OrderedDict()
+        )
+        self._variables_size: int = getattr(self, "_variables_size", 0)
 
         # store the computed times/frequencies to avoid computing them again
         self._times = None
@@ -91,6 +140,18 @@ class BaseData:
     def get_dataset(cls, filepath):
         pass
 
+    @classmethod
+    def _get_dataset(cls, filepath):
+        """Dataset selector also returning the file object opened to identify the dataset (None
+        if the file is not opened by the selector)."""
+        return cls.get_dataset(filepath), None
+
+    @classmethod
+    def _dataset_warnings(cls, dataset):
+        """Emit the warnings of a detected dataset (also when it is taken from the dataset
+        cache, which only keeps the dataset names)."""
+        pass
+
 
 class Data(BaseData, dataset="default"):
     """Generic Data class
@@ -100,8 +161,17 @@ class Data(BaseData, dataset="default"):
     dataset and provide adequate support. If the file is not recognized, an NotImplementedError is
     raised.
 
+    The detected datasets are kept in a LRU cache (of `dataset_cache_size` files, 0 to disable
+    it) keyed by the path, size and modification time of the files, so that a file is not opened
+    again to identify its dataset.
     """
 
+    dataset_cache_size: int = 1024
+    _dataset_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
+    # total size (in bytes) of the variables kept by each instance, 0 to disable the cache
+    variable_cache_size: int = 256 * 2**20
+
     def __new__(
         cls, filepath: Path, dataset: Union[None, str] = "__auto__", *args, **kwargs
     ) -> "Data":
@@ -110,15 +180,30 @@ class Data(BaseData, dataset="default"):
             return super().__new__(cls)
         elif dataset == "__auto__":
             # try to guess the dataset
-            dataset = cls.get_dataset(cls, filepath)
+            dataset, file, selector = Data._detect_dataset(filepath)
 
             # get the dataset class from the registry
             # we need an explicit cast to make mypy happy
             dataset_class = BaseData._registry[cast(str, dataset)]
 
-            # create a new instance of the dataset class
-            # ignore 'gets multiple values for keyword argument "dataset"'
-            return dataset_class(filepath, dataset=None, *args, **kwargs)  # type: ignore
+            try:
+                # create a new instance of the dataset class
+                # ignore 'gets multiple values for keyword argument "dataset"'
+                data = dataset_class(filepath, dataset=None, *args, **kwargs)  # type: ignore
+
+                # hand the file object opened to identify the dataset on to the instance, if
+                # it would have opened the file the same way
+                if (
+                    file is not None
+                    and data._file is None
+                    and getattr(dataset_class.open, "__func__", None)
+                    is getattr(selector.open, "__func__", None)
+                ):
+                    data._file, file = file, None
+            finally:
+                if file is not None:
+                    selector.close(file)
+            return data
         else:
             # get the dataset class from the registry
             dataset_class = BaseData._registry[cast(str, dataset)]
@@ -147,14 +232,12 @@ class Data(BaseData, dataset="default"):
     @property
     def sweeps(self):
         """Generic iterator method to access sweeps."""
-        for sweep in self._iter_sweep_class(data_instance=self):
-            yield sweep
+        return self._iter_sweep_class(data_instance=self)
 
     @property
     def records(self):
         """Generic iterator method to access records."""
-        for record in self._iter_record_class(data_instance=self):
-            yield record
+        return self._iter_record_class(data_instance=self)
 
     @property
     def meta(self) -> dict:
@@ -189,10 +272,64 @@ class Data(BaseData, dataset="default"):
         """Generic method to get the data as a numpy.array."""
         return numpy.ndarray([])
 
-    def as_xarray(self) -> xarray.Dataset:
-        """Generic method to get the data as a xarray.Dataset object (an efficient "dict", filled with xarray.DataArray)"""
+    def as_xarray(self, time_range=None, freq_range=None) -> "xarray.Dataset":
+        """Generic method to get the data as a xarray.Dataset object (an efficient "dict", filled with xarray.DataArray)
+
+        If given, `time_range` and `freq_range` are (start, end) and (min, max) pairs (None for
+        an open end) selecting the data to be read. Times can be given as astropy Time objects,
+        datetime objects or ISO strings, and frequencies as Quantity objects or as values in the
+        dataset frequency unit.
+        """
+        import xarray
+
         return xarray.Dataset()
 
+    @staticmethod
+    def _parse_time_range(time_range) -> Tuple[Union[None, numpy.datetime64], ...]:
+        """Convert a (start, end) time range into a pair of numpy.datetime64 (or None)."""
+        if time_range is None:
+            return None, None
+        start, end = time_range
+        return tuple(None if t is None else Time(t).datetime64 for t in (start, end))
+
+    @staticmethod
+    def _parse_freq_range(freq_range, unit) -> Tuple[Union[None, float], ...]:
+        """Convert a (min, max) frequency range into a pair of values in `unit` (or None)."""
+        if freq_range is None:
+            return None, None
+        return tuple(
+            None if f is None else Quantity(f, unit).to_value(unit) for f in freq_range
+        )
+
+    @staticmethod
+    def _range_mask(values, start, end) -> numpy.ndarray:
+        """Get the mask of the values within [start, end] (None for an open end)."""
+        mask = numpy.ones(len(values), dtype=bool)
+        if start is not None:
+            mask &= values >= start
+        if end is not None:
+            mask &= values <= end
+        return mask
+
+    def _select_range(
+        self, dataset: "xarray.Dataset", time_range=None, freq_range=None
+    ) -> "xarray.Dataset":
+        """Select the data within the time and frequency ranges in a xarray.Dataset, along its
+        "time" and "frequency" dimensions."""
+        if time_range is not None and "time" in dataset.dims:
+            start, end = self._parse_time_range(time_range)
+            times = dataset["time"].values.astype("datetime64[ns]")
+            dataset = dataset.isel(time=self._range_mask(times, start, end))
+        if freq_range is not None and "frequency" in dataset.dims:
+            frequency = dataset["frequency"]
+            fmin, fmax = self._parse_freq_range(
+                freq_range, Unit(frequency.attrs.get("units", ""))
+            )
+            dataset = dataset.isel(
+                frequency=self._range_mask(frequency.values, fmin, fmax)
+            )
+        return dataset
+
     def __enter__(self):
         if self.access_mode == "file":
             return self.file
@@ -202,6 +339,8 @@ class Data(BaseData, dataset="default"):
     def __exit__(self, *args, **kwargs):
         if self._file:
             self.close(self._file)
+            # the file is opened again if it is accessed afterwards
+            self._file = None
 
     @property
     def file_size(self) -> Quantity:
@@ -465,17 +604,106 @@ class Data(BaseData, dataset="default"):
         This method identifies CdfData, FitsData and Pds3Data.
         Other datasets are treated as BinData.
         """
-        filepath = Path(filepath)
-        if filepath.suffix.lower() == ".cdf":
-            dataset = BaseData._registry["cdf"].get_dataset(filepath)
-        elif filepath.suffix.lower() in [".fits", ".fit"]:
-            dataset = BaseData._registry["fits"].get_dataset(filepath)
-        elif filepath.suffix.lower() == ".lbl":
-            dataset = BaseData._registry["pds3"].get_dataset(filepath)
-        else:
-            dataset = BaseData._registry["bin"].get_dataset(filepath)
+        dataset, file, selector = Data._detect_dataset(filepath)
+        if file is not None:
+            selector.close(file)
         return dataset
 
+    @staticmethod
+    def _dataset_selector(filepath: Path) -> Type[BaseData]:
+        """Get the class of the dataset selector of a file, given its extension."""
+        suffix = Path(filepath).suffix.lower()
+        if suffix == ".cdf":
+            return BaseData._registry["cdf"]
+        elif suffix in [".fits", ".fit"]:
+            return BaseData._registry["fits"]
+        elif suffix == ".lbl":
+            return BaseData._registry["pds3"]
+        else:
+            return BaseData._registry["bin"]
+
+    @staticmethod
+    def _detect_dataset(filepath) -> Tuple[str, Any, Type[BaseData]]:
+        """Identify the dataset of a file, using the dataset cache.
+
+        :return: the dataset, the file object opened to identify it (None if the dataset was
+                 in the cache, or if the file is not opened by the dataset selector) and the
+                 class of the dataset selector
+        """
+        filepath = Path(filepath)
+        selector = Data._dataset_selector(filepath)
+
+        try:
+            stat = filepath.stat()
+            key: Union[None, Tuple] = (
+                str(filepath.resolve()),
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+        except OSError:
+            key = None
+
+        cache = Data._dataset_cache
+        if key in cache:
+            cache.move_to_end(key)
+            selector._dataset_warnings(cache[key])
+            return cache[key], None, selector
+
+        dataset, file = selector._get_dataset(filepath)
+
+        if key is not None and Data.dataset_cache_size > 0:
+            cache[key] = dataset
+            while len(cache) > Data.dataset_cache_size:
+                cache.popitem(last=False)
+        return dataset, file, selector
+
+    def _cached_variable(self, key, read):
+        """Get a variable of the file, read by `read()` the first time only.
+
+        The variables are kept in a LRU cache of `variable_cache_size` bytes per instance, so
+        that the times, frequencies, as_xarray and quicklook methods do not read them again.
+        The cached arrays are made read-only, as they are shared between these calls (the
+        as_xarray methods of the CDF and FITS datasets give writeable copies of them, see
+        `Data._writeable_output`).
+        """
+        cache = self._variables
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        value = read()
+        nbytes = getattr(value, "nbytes", 0)
+        if 0 < self.variable_cache_size and nbytes <= self.variable_cache_size:
+            if isinstance(value, numpy.ndarray):
+                value.flags.writeable = False
+            cache[key] = value
+            self._variables_size += nbytes
+            while self._variables_size > self.variable_cache_size:
+                _, evicted = cache.popitem(last=False)
+                self._variables_size -= getattr(evicted, "nbytes", 0)
+        return value
+
+    @staticmethod
+    def _writeable_output(as_xarray):
+        """Decorator of the as_xarray methods, replacing the read-only arrays (i.e. the cached
+        variables, see `Data._cached_variable`) of the xarray.Dataset objects they return by
+        copies, so that the output can be modified in place."""
+
+        @wraps(as_xarray)
+        def wrapper(self, *args, **kwargs):
+            output = as_xarray(self, *args, **kwargs)
+            for dataset in output.values() if isinstance(output, dict) else [output]:
+                for name, variable in getattr(dataset, "variables", {}).items():
+                    if (
+                        name not in dataset.indexes
+                        and isinstance(variable.data, numpy.ndarray)
+                        and not variable.data.flags.writeable
+                    ):
+                        variable.values = variable.data.copy()
+            return output
+
+        return wrapper
+
     def check_input_param(self, keys, kwargs):
         """
         Method to test that all the inputs given to quicklook are consistent.
@@ -551,6 +779,8 @@ class CdfData(Data, dataset="cdf"):
     """Base class for CDF formatted data. Requires `spacepy`."""
 
     def __init_subclass__(cls, *args, dataset: str, **kwargs) -> None:
+        if "as_xarray" in cls.__dict__:
+            cls.as_xarray = Data._writeable_output(cls.as_xarray)
         return super().__init_subclass__(*args, dataset=dataset, **kwargs)
 
     @classmethod
@@ -563,7 +793,16 @@ class CdfData(Data, dataset="cdf"):
     @classmethod
     def get_dataset(cls, filepath):
         """Dataset selector for CDF files (must be ISTP compliant)"""
-        with cls.open(filepath) as c:
+        dataset, c = cls._get_dataset(filepath)
+        cls.close(c)
+        return dataset
+
+    @classmethod
+    def _get_dataset(cls, filepath):
+        """Dataset selector for CDF files, also returning the CDF file object opened to
+        identify the dataset"""
+        c = cls.open(filepath)
+        try:
             dataset = c.attrs["Logical_source"][...][0]
 
             # REQUIRED DATASET MAPPING AND WARNINGS
@@ -591,32 +830,139 @@ class CdfData(Data, dataset="cdf"):
                         "JUICE_L1a_RPWI-HF-SID"
                         + c.attrs["Logical_source_description"][...][0][40:]
                     )
-                    if (
-                        "SID6" in dataset
-                        or "SID7" in dataset
-                        or "SID22" in dataset
-                        or "SID23" in dataset
-                    ):
-                        warnings.warn("Dataset not fully supported yet")
                 elif dataset == "solo_l3_rpw-hfr":
                     if "tnr" in str(filepath):
                         dataset = "solo_L3_rpw-tnr-flux_"
                     else:
                         dataset = "solo_L3_rpw-hfr-flux_"
 
-                # warnings
-                if dataset == "wi_wav_rad1_l3_df_v01":
-                    warnings.warn(
-                        "Rad1 v01 dataset is deprecated, consider using Rad1 v02.",
-                        DeprecationWarning,
-                    )
+            cls._dataset_warnings(dataset)
+        except BaseException:
+            cls.close(c)
+            raise
+        return dataset, c
 
-        return dataset
+    @classmethod
+    def _dataset_warnings(cls, dataset):
+        """Emit the warnings of the CDF datasets requiring modification"""
+        if dataset.startswith("JUICE_L1a_RPWI-HF-SID") and any(
+            sid in dataset for sid in ["SID6", "SID7", "SID22", "SID23"]
+        ):
+            warnings.warn("Dataset not fully supported yet")
+        elif dataset == "wi_wav_rad1_l3_df_v01":
+            warnings.warn(
+                "Rad1 v01 dataset is deprecated, consider using Rad1 v02.",
+                DeprecationWarning,
+            )
 
     @property
     def mime_type(self) -> str:
         return "application/cdf"
 
+    def _variable(self, key: str, records=slice(None)) -> numpy.ndarray:
+        """Get the `records` of the `key` variable.
+
+        The whole variable is read once and kept (see `Data._cached_variable`): the records of
+        a kept variable are taken from it, other selections of records are read from the file.
+        """
+        all_records = isinstance(records, slice) and records == slice(None)
+        if all_records or key in self._variables:
+            variable = self._cached_variable(key, lambda: self.file[key][...])
+            return variable if all_records else variable[records]
+        return self.file[key][records]
+
+    def _epoch_slice(self, time_range, epoch_key: str = "Epoch") -> slice:
+        """Get the slice of the CDF records within `time_range`.
+
+        The records are found with a binary search on the `epoch_key` variable (assumed to be
+        sorted), so that only a few records of this variable are read.
+        """
+        start, end = self._parse_time_range(time_range)
+        epoch = self.file[epoch_key]
+        n_rec = len(epoch)
+
+        def bisect(t, right):
+            lo, hi = 0, n_rec
+            while lo < hi:
+                mid = (lo + hi) // 2
+                value = numpy.datetime64(epoch[mid])
+                if value < t or (right and value == t):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        return slice(
+            0 if start is None else bisect(start, right=False),
+            n_rec if end is None else bisect(end, right=True),
+        )
+
+    def _epoch_datetimes(self, indices, epoch_key: str = "Epoch") -> numpy.ndarray:
+        """Get the records of the `epoch_key` variable at `indices` as datetimes.
+
+        Only these records are converted (converting a whole epoch variable into datetimes is
+        slow, one record at a time).
+        """
+        from spacepy import pycdf
+
+        converters = {
+            pycdf.const.CDF_TIME_TT2000.value: pycdf.lib.v_tt2000_to_datetime,
+            pycdf.const.CDF_EPOCH.value: pycdf.lib.v_epoch_to_datetime,
+        }
+        converter = converters.get(self.file[epoch_key].type())
+        if converter is None:
+            return self._variable(epoch_key)[indices]
+        return converter(self.file.raw_var(epoch_key)[...][indices])
+
+    def _epoch_nanoseconds(self, records=slice(None), epoch_key: str = "Epoch"):
+        """Get the records of the `epoch_key` variable as integer nanoseconds, to compute time
+        differences without converting the records into datetimes."""
+        from spacepy import pycdf
+
+        cdf_type = self.file[epoch_key].type()
+        if cdf_type == pycdf.const.CDF_TIME_TT2000.value:
+            return self.file.raw_var(epoch_key)[records].astype("int64")
+        elif cdf_type == pycdf.const.CDF_EPOCH.value:
+            # milliseconds
+            raw = self.file.raw_var(epoch_key)[records]
+            return numpy.round(raw * 1e6).astype("int64")
+        epoch = numpy.asarray(self.file[epoch_key][records], dtype="datetime64[ns]")
+        return epoch.astype("int64")
+
+    def _epoch_datetime64(self, epoch_key: str = "Epoch") -> numpy.ndarray:
+        """Get the `epoch_key` variable as datetime64[ns] values, equal to the datetimes given by
+        `spacepy` (i.e. rounded to the microsecond).
+
+        TT2000 epochs are converted at once with the TT - UTC offset of the first record, unless
+        a leap second (or a fill value) is within the records, where the datetimes are used.
+        """
+        from spacepy import pycdf
+
+        if self.file[epoch_key].type() == pycdf.const.CDF_TIME_TT2000.value:
+            tt2000 = self.file.raw_var(epoch_key)[...].astype("int64")
+            if len(tt2000) == 0:
+                return numpy.array([], dtype="datetime64[ns]")
+
+            def tt_utc_offset(value):
+                # TT2000 value minus its UTC time in ns since 1970-01-01
+                seconds, picoseconds = pycdf.lib.tt2000_to_epoch16(value)
+                seconds = int(seconds) + int(
+                    numpy.datetime64("0000-01-01", "s").astype(int)
+                )
+                return value - (seconds * 1000000000 + int(picoseconds) // 1000)
+
+            # a second of margin, for the records within a leap second
+            first, last = int(tt2000.min()) - 1000000000, int(tt2000.max()) + 1000000000
+            if first > numpy.iinfo("int64").min + 2 and last < numpy.iinfo("int64").max:
+                offset = tt_utc_offset(first)
+                if tt_utc_offset(last) == offset:
+                    # rounded to the microsecond (half up) as spacepy does
+                    microseconds = (tt2000 - offset + 500) // 1000
+                    return microseconds.astype("datetime64[us]").astype(
+                        "datetime64[ns]"
+                    )
+        return numpy.asarray(self._variable(epoch_key), dtype="datetime64[ns]")
+
     def _convert_epncore_ranges(self, k, v, range_type):
         range_types = ["time_sampling_step", "spectral_range", "spectral_sampling_step"]
         range_units = {
@@ -693,6 +1039,8 @@ class FitsData(Data, dataset="fits"):
     """Base class for FITS formatted data."""
 
     def __init_subclass__(cls, *args, dataset: str, **kwargs) -> None:
+        if "as_xarray" in cls.__dict__:
+            cls.as_xarray = Data._writeable_output(cls.as_xarray)
         return super().__init_subclass__(*args, dataset=dataset, **kwargs)
 
     @classmethod
@@ -703,7 +1051,16 @@ class FitsData(Data, dataset="fits"):
     @classmethod
     def get_dataset(cls, filepath):
         """Dataset selector for FITS files"""
-        with cls.open(filepath) as f:
+        dataset, f = cls._get_dataset(filepath)
+        cls.close(f)
+        return dataset
+
+    @classmethod
+    def _get_dataset(cls, filepath):
+        """Dataset selector for FITS files, also returning the FITS file object opened to
+        identify the dataset"""
+        f = cls.open(filepath)
+        try:
             if f[0].header["INSTRUME"] == "NenuFar" and filepath.stem.endswith("_BST"):
                 dataset = "orn_nenufar_bst"
             elif (
@@ -728,24 +1085,185 @@ class FitsData(Data, dataset="fits"):
                 dataset = "ecallisto"
             else:
                 raise NotImplementedError()
-        return dataset
+        except BaseException:
+            cls.close(f)
+            raise
+        return dataset, f
 
     @property
     def mime_type(self) -> str:
         return "application/fits"
 
+    def _variable(self, hdu: Union[int, str], column: Union[None, str] = None):
+        """Get the data of an HDU, or one of its columns (read once, see
+        `Data._cached_variable`)."""
+
+        def read():
+            data = self.file[hdu].data
+            return data if column is None else data[column]
+
+        return self._cached_variable((hdu, column), read)
+
 
 class BinData(Data, dataset="bin"):
-    """Base class for custom binary data."""
+    """Base class for custom binary data.
+
+    If `memory_map` is True, the file content is accessed through a read-only `numpy.memmap`
+    (see the `buffer` property), so that data arrays are views into the mapping and are only
+    read from disk when they are used.
+
+    If `index_cache` is set, the record index of the file (see the `index` property) is
+    persisted, next to the file if `index_cache` is True, or in the `index_cache` directory
+    otherwise, so that it is not rebuilt the next time the file is opened.
+    """
+
+    # version of the persistent index format, to be incremented when the content of the
+    # indexes changes (the persistent indexes of another version are rebuilt)
+    _index_version = 1
+
+    # numpy structured dtype of the record headers held in the index (if any)
+    _header_dtype: Union[None, numpy.dtype] = None
 
     def __init_subclass__(cls, *args, dataset: str, **kwargs) -> None:
         return super().__init_subclass__(*args, dataset=dataset, **kwargs)
 
+    def __init__(
+        self,
+        filepath: Path,
+        dataset: Union[None, str] = "__auto__",
+        access_mode: str = "sweeps",
+        load_data: bool = True,
+        fixed_frequencies: bool = True,
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
+    ) -> None:
+        super().__init__(filepath, dataset, access_mode, load_data, fixed_frequencies)
+
+        # flag used to determine if the file content is memory-mapped or not
+        self.memory_map = memory_map
+
+        # a reference to the file content
+        self._buffer: Union[None, bytes, numpy.memmap] = None
+
+        # location of the persistent record index (None if it is not persisted)
+        self.index_cache = index_cache
+
+        # store the record index to avoid building it again
+        self._index: Union[None, numpy.ndarray] = None
+
     @classmethod
     def open(cls, filepath: Path, *args, mode: str = "rb", **kwargs):
         # ignore 'No overload variant of "open" ...'
         return filepath.open(*args, mode=mode, **kwargs)  # type: ignore
 
+    @property
+    def buffer(self) -> Union[bytes, numpy.memmap]:
+        """The whole file content, as a read-only `numpy.memmap` of bytes in memory-mapped
+        mode, or as `bytes` otherwise."""
+        if self._buffer is None:
+            if self.memory_map and self.file_size.value > 0:
+                self._buffer = numpy.memmap(self.filepath, dtype=numpy.uint8, mode="r")
+            else:
+                self.file.seek(0)
+                self._buffer = self.file.read()
+        return self._buffer
+
+    @property
+    def index_path(self) -> Union[None, Path]:
+        """Path of the persistent record index, or None if `index_cache` is not set.
+
+        The index is stored as `<file name>.idx.npz`, next to the file if `index_cache` is True,
+        or in the `index_cache` directory with a hash of the absolute file path in its name.
+        """
+        if not self.index_cache:
+            return None
+        elif self.index_cache is True:
+            return self.filepath.with_name(f"{self.filepath.name}.idx.npz")
+        else:
+            filepath = self.filepath.resolve()
+            digest = hashlib.sha1(str(filepath).encode()).hexdigest()[:16]
+            return Path(self.index_cache) / f"{filepath.name}.{digest}.idx.npz"
+
+    @property
+    def _index_key(self) -> numpy.ndarray:
+        """Key used to check that a persistent index matches the file and the index format
+        (i.e. `_index_version` and the layout of `_header_dtype`)."""
+        stat = self.filepath.stat()
+        header_dtype = self._header_dtype
+        return numpy.array(
+            [
+                str(self._index_version),
+                str(self.filepath.resolve()),
+                self.dataset,
+                "" if header_dtype is None else str(numpy.dtype(header_dtype).descr),
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+            ]
+        )
+
+    @property
+    def index(self) -> Union[None, numpy.ndarray]:
+        """Record index of the file, as a numpy structured array with one item per record.
+
+        The index holds the byte "offset" of each record payload, its start "time" (as
+        numpy.datetime64) and dataset specific header fields. It is built on first access
+        (see `_build_index`), or loaded from `index_path` if it was saved for the same file
+        path, size and modification time, and with the same index format.
+        """
+        if self._index is None:
+            index_path = self.index_path
+            if index_path is not None:
+                key = self._index_key
+                self._index = self._load_index(index_path, key)
+            if self._index is None:
+                self._index = self._build_index()
+                if index_path is not None and self._index is not None:
+                    self._save_index(index_path, key, self._index)
+        return self._index
+
+    def _build_index(self) -> Union[None, numpy.ndarray]:
+        """Dataset specific method to build the record index (see the `index` property)."""
+        raise NotImplementedError()
+
+    @staticmethod
+    def _load_index(index_path: Path, key: numpy.ndarray) -> Union[None, numpy.ndarray]:
+        """Load a persistent index, or return None if it is missing, unreadable or stale."""
+        try:
+            with numpy.load(index_path) as f:
+                if numpy.array_equal(f["key"], key):
+                    return f["index"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass
+        return None
+
+    @staticmethod
+    def _save_index(index_path: Path, key: numpy.ndarray, index: numpy.ndarray):
+        """Save a persistent index (the index file is replaced atomically)."""
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                numpy.savez(f, key=key, index=index)
+            tmp_path.replace(index_path)
+        except OSError as e:
+            warnings.warn(f"Unable to save the index file {index_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def index_slice(self, start_time=None, end_time=None) -> slice:
+        """Get the slice of the records (in the index) starting within [start_time, end_time].
+
+        The records are assumed to be sorted in time. Times can be given as astropy Time
+        objects, datetime objects or ISO strings.
+        """
+        times = self.index["time"]
+        start, end = self._parse_time_range((start_time, end_time))
+        return slice(
+            0 if start is None else int(numpy.searchsorted(times, start, side="left")),
+            len(times)
+            if end is None
+            else int(numpy.searchsorted(times, end, side="right")),
+        )
+
     @classmethod
     def get_dataset(cls, filepath):
         """Dataset selector for Binary files.
@@ -754,13 +1272,8 @@ class BinData(Data, dataset="bin"):
         """
         filepath = Path(filepath)
 
-        import json
-
-        with open(Path(__file__).parent / "dataset_filename_regex.json") as f:
-            filename_regex = json.load(f)
-
-        for dataset, regex in filename_regex["bin"]:
-            if re.match(regex, filepath.name) is not None:
+        for dataset, regex in _filename_regex("bin"):
+            if regex.match(filepath.name) is not None:
                 return dataset
         else:
             raise NotImplementedError()
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+
+"""
+Module to define the multi-file data collection class.
+
+Data collection class
+---------------------
+
+* `DataCollection` Class: A time series of data files (granules) of a same dataset.
+"""
+
+from typing import TYPE_CHECKING, Any, Union, Dict, Iterable, Iterator, List, Tuple
+from glob import glob
+from inspect import signature
+from pathlib import Path
+import json
+import os
+import re
+import warnings
+
+import numpy
+from astropy.time import Time
+
+from .base import BaseData, Data
+
+if TYPE_CHECKING:
+    import xarray
+
+# dates in the file names: YYYYMMDD, optionally followed by hhmm or hhmmss
+_FILENAME_DATE_REGEX = re.compile(r"(?<!\d)(\d{8})(?:T?(\d{6}|\d{4}))?(?!\d)")
+
+
+def _filename_span(filepath: Path) -> Union[None, Tuple[numpy.datetime64, ...]]:
+    """Get the time span given by the dates in a file name, or None if there is none.
+
+    A single date (without time) gives its day, and several dates give the span from the first
+    one to the last one (to the end of its day if it has no time).
+    """
+    dates = []
+    for date, time in _FILENAME_DATE_REGEX.findall(filepath.name):
+        time = (time + "00")[:6] if time else ""
+        try:
+            value = numpy.datetime64(
+                f"{date[:4]}-{date[4:6]}-{date[6:]}"
+                + (f"T{time[:2]}:{time[2:4]}:{time[4:]}" if time else ""),
+                "s",
+            )
+        except ValueError:
+            continue
+        if not 1950 <= int(date[:4]) <= 2100:
+            continue
+        dates.append((value, bool(time)))
+    if len(dates) == 0 or (len(dates) == 1 and dates[0][1]):
+        # (the span of a file named after its start time only is unknown)
+        return None
+    start = min(value for value, _ in dates)
+    end, has_time = max(dates)
+    return start, end if has_time else end + numpy.timedelta64(1, "D")
+
+
+class DataCollection:
+    """Data Collection class
+    ========================
+
+    A collection of data files (granules) of a same dataset, seen as a single time series.
+
+    The granules are given as a directory (scanned with `pattern`), a glob pattern or a list of
+    file paths. Only the file paths are listed when the collection is created: a granule is
+    opened when a query touches it, i.e. when its time span overlaps the query time range. The
+    time span of a granule is:
+
+    * its exact coverage, if the granule was already opened, or if it is in the `catalog`,
+    * otherwise, the day (or the span) given by the dates in its file name (if
+      `filename_dates` is True), widened by `filename_margin`,
+    * otherwise, it is unknown and the granule is opened by the first query.
+
+    Files which are not recognized (or which do not belong to `dataset`) are ignored when they
+    are opened. If `catalog` is set, the coverage and dataset of the opened granules are
+    persisted (keyed by the path, size and modification time of the files), in the `catalog`
+    file, or in a `.maser_catalog.json` file in the `source` directory if `catalog` is True.
+    """
+
+    # margin added to the time spans given by the file names
+    filename_margin = numpy.timedelta64(1, "h")
+
+    _catalog_version = 1
+
+    def __init__(
+        self,
+        source: Union[str, Path, Iterable[Union[str, Path]]],
+        dataset: Union[None, str] = "__auto__",
+        pattern: str = "*",
+        catalog: Union[None, bool, str, Path] = None,
+        filename_dates: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        :param source: a directory, a glob pattern or a list of file paths
+        :param dataset: the dataset of the granules (guessed from the first recognized file if
+                        "__auto__")
+        :param pattern: glob pattern of the files to look for, if `source` is a directory
+        :param catalog: file where the coverage of the granules is persisted (see above)
+        :param filename_dates: whether the dates in the file names give the day of their data
+        :param kwargs: keyword arguments passed to `Data` when opening the granules
+        """
+        self._kwargs = kwargs
+        self.filename_dates = filename_dates
+
+        if dataset not in [None, "__auto__"] and dataset not in BaseData._registry:
+            raise KeyError(f"Unknown dataset: {dataset}")
+        self._dataset = None if dataset in [None, "__auto__"] else dataset
+
+        # the granule candidates (binary files are recognized from their names only)
+        self.filepaths = [
+            filepath
+            for filepath in self._find_files(source, pattern)
+            if self._name_dataset(filepath) is not False
+        ]
+
+        if catalog is True:
+            if not isinstance(source, (str, Path)) or not Path(source).is_dir():
+                raise ValueError(
+                    "A catalog path is required if source is not a directory"
+                )
+            catalog = Path(source) / ".maser_catalog.json"
+        self.catalog_path = None if not catalog else Path(catalog)
+
+        # dataset and exact coverage (start, end) of the granules, keyed by their path, size
+        # and modification time (None for the granules without data of the dataset)
+        self._catalog: Dict[Tuple, Any] = self._load_catalog()
+        self._catalog_changed = False
+
+    @staticmethod
+    def _find_files(
+        source: Union[str, Path, Iterable[Union[str, Path]]], pattern: str
+    ) -> List[Path]:
+        """Get the sorted list of the files given by `source`."""
+        if isinstance(source, (str, Path)):
+            if Path(source).is_dir():
+                filepaths = list(Path(source).glob(pattern))
+            else:
+                filepaths = [Path(filepath) for filepath in glob(str(source))]
+        else:
+            filepaths = [Path(filepath) for filepath in source]
+        return sorted(
+            filepath
+            for filepath in filepaths
+            if filepath.is_file() and filepath.name != ".maser_catalog.json"
+        )
+
+    @staticmethod
+    def _name_dataset(filepath: Path) -> Union[None, bool, str]:
+        """Get the dataset of a binary file from its name (False if it is not recognized), or
+        None for the other kinds of files (their dataset is given by their content)."""
+        selector = Data._dataset_selector(filepath)
+        if selector is not BaseData._registry["bin"]:
+            return None
+        try:
+            return selector.get_dataset(filepath)
+        except NotImplementedError:
+            return False
+
+    @staticmethod
+    def _file_key(filepath: Path) -> Tuple:
+        stat = filepath.stat()
+        return str(filepath.resolve()), stat.st_size, stat.st_mtime_ns
+
+    def _load_catalog(self) -> Dict[Tuple, Any]:
+        """Load the persistent catalog (empty if it is missing, unreadable or outdated)."""
+        if self.catalog_path is None:
+            return {}
+        try:
+            with open(self.catalog_path) as f:
+                content = json.load(f)
+            if content["version"] != self._catalog_version:
+                return {}
+            return {
+                tuple(entry["key"]): (
+                    entry["dataset"],
+                    None
+                    if entry["span"] is None
+                    else tuple(numpy.datetime64(t, "ns") for t in entry["span"]),
+                )
+                for entry in content["granules"]
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_catalog(self):
+        """Save the persistent catalog (the catalog file is replaced atomically)."""
+        if self.catalog_path is None or not self._catalog_changed:
+            return
+        content = {
+            "version": self._catalog_version,
+            "granules": [
+                {
+                    "key": list(key),
+                    "dataset": dataset,
+                    "span": None if span is None else [str(t) for t in span],
+                }
+                for key, (dataset, span) in self._catalog.items()
+            ],
+        }
+        tmp_path = self.catalog_path.with_name(
+            f"{self.catalog_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(content, f)
+            tmp_path.replace(self.catalog_path)
+            self._catalog_changed = False
+        except OSError as e:
+            warnings.warn(f"Unable to save the catalog file {self.catalog_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    @property
+    def dataset(self) -> Union[None, str]:
+        """Dataset of the granules (if it was not given, the dataset of the first recognized
+        file, which may be opened to identify it)."""
+        if self._dataset is None:
+            for filepath in self.filepaths:
+                entry = self._catalog.get(self._file_key(filepath))
+                if entry is not None:
+                    dataset = entry[0]
+                else:
+                    try:
+                        dataset = self._name_dataset(filepath) or Data.get_dataset(
+                            Data, filepath
+                        )
+                    except (NotImplementedError, KeyError, OSError):
+                        continue
+                if dataset is not None:
+                    self._dataset = dataset
+                    break
+        return self._dataset
+
+    def _granule_dataset(self, filepath: Path) -> Union[None, str]:
+        """Get the dataset of a granule if it is known without opening it."""
+        entry = self._catalog.get(self._file_key(filepath))
+        if entry is not None:
+            return entry[0]
+        return self._name_dataset(filepath) or None
+
+    def __len__(self) -> int:
+        """Get the number of granules (including the files not identified yet)."""
+        return len(self.filepaths)
+
+    def __iter__(self) -> Iterator[Data]:
+        """Iterate over the granules (as Data objects), in time order."""
+        return self.granules()
+
+    def open(self, filepath: Path) -> Data:
+        """Get the Data object of a granule."""
+        return Data(filepath, dataset=self.dataset, **self._kwargs)
+
+    @property
+    def coverage(self) -> numpy.ndarray:
+        """Time span of the granules known without opening them, as a numpy structured array
+        (sorted by start time) with the "filepath" of each granule, the "start" and "end" times
+        of its span (NaT if unknown) and whether the span is "exact" (i.e. the coverage of the
+        granule data) or given by the file name.
+
+        The granules known not to have data of the dataset are dropped.
+        """
+        dataset = self.dataset
+        coverage = numpy.empty(
+            len(self.filepaths),
+            dtype=[
+                ("filepath", object),
+                ("start", "M8[ns]"),
+                ("end", "M8[ns]"),
+                ("exact", bool),
+            ],
+        )
+        keep = numpy.ones(len(self.filepaths), dtype=bool)
+        for i, filepath in enumerate(self.filepaths):
+            entry = self._catalog.get(self._file_key(filepath))
+            if entry is not None:
+                granule_dataset, span = entry
+                if granule_dataset != dataset or span is None:
+                    keep[i] = False
+                    continue
+                coverage[i] = (filepath, span[0], span[1], True)
+                continue
+            name_dataset = self._name_dataset(filepath)
+            if name_dataset is not None and name_dataset != dataset:
+                keep[i] = False
+                continue
+            span = _filename_span(filepath) if self.filename_dates else None
+            if span is None:
+                coverage[i] = (filepath, "NaT", "NaT", False)
+            else:
+                coverage[i] = (
+                    filepath,
+                    span[0] - self.filename_margin,
+                    span[1] + self.filename_margin,
+                    False,
+                )
+        coverage = coverage[keep]
+        return coverage[numpy.argsort(coverage["start"], kind="stable")]
+
+    def _scan(self, filepath: Path, data: Union[None, Data] = None):
+        """Add the dataset and exact coverage of a granule to the catalog, opening it unless
+        its Data object is given.
+
+        :return: the catalog entry of the granule
+        """
+        key = self._file_key(filepath)
+        if data is None:
+            try:
+                dataset = self._granule_dataset(filepath)
+                with Data(filepath, dataset=dataset or "__auto__", **self._kwargs) as d:
+                    return self._scan(filepath, d)
+            except (NotImplementedError, KeyError, OSError):
+                entry: Tuple = (None, None)
+        else:
+            times = data.times
+            span = None
+            if len(times) > 0:
+                times = times.datetime64
+                span = (times.min(), times.max())
+            entry = (data.dataset, span)
+        self._catalog[key] = entry
+        self._catalog_changed = True
+        return entry
+
+    def granules(self, time_range=None) -> Iterator[Data]:
+        """Iterate over the granules (as Data objects) with data within `time_range`.
+
+        Only the granules which may have data within `time_range` are opened (the granules of
+        unknown time span are opened first, to sort the granules).
+        """
+        start, end = Data._parse_time_range(time_range)
+        dataset = self.dataset
+
+        def overlaps(first, last):
+            # (the unknown spans, with NaT times, overlap any time range)
+            mask = numpy.ones(numpy.shape(first), dtype=bool)
+            if start is not None:
+                mask &= ~(last < start)
+            if end is not None:
+                mask &= ~(first > end)
+            return mask
+
+        coverage = self.coverage
+        coverage = coverage[overlaps(coverage["start"], coverage["end"])]
+        unknown = numpy.isnat(coverage["start"])
+        if unknown.any():
+            for filepath in coverage["filepath"][unknown]:
+                self._scan(filepath)
+            coverage = self.coverage
+            coverage = coverage[overlaps(coverage["start"], coverage["end"])]
+
+        try:
+            for filepath, exact in zip(coverage["filepath"], coverage["exact"]):
+                if exact:
+                    with self.open(filepath) as data:
+                        yield data
+                    continue
+                # the dataset and coverage of the granule are checked once it is opened
+                try:
+                    data = Data(
+                        filepath,
+                        dataset=self._granule_dataset(filepath) or "__auto__",
+                        **self._kwargs,
+                    )
+                except (NotImplementedError, KeyError, OSError):
+                    self._scan(filepath)
+                    continue
+                with data:
+                    granule_dataset, span = self._scan(filepath, data)
+                    if (
+                        granule_dataset == dataset
+                        and span is not None
+                        and overlaps(*span)
+                    ):
+                        yield data
+        finally:
+            self._save_catalog()
+
+    @property
+    def times(self) -> Time:
+        """Time axis of the whole collection."""
+        times = [data.times for data in self.granules()]
+        if len(times) == 0:
+            return Time([], format="jd")
+        scale = times[0].scale
+        return Time(
+            numpy.concatenate([getattr(t, scale).jd1 for t in times]),
+            numpy.concatenate([getattr(t, scale).jd2 for t in times]),
+            format="jd",
+            scale=scale,
+        )
+
+    @property
+    def sweeps(self):
+        """Iterate over the sweeps of the whole collection (a granule is opened at a time)."""
+        for data in self.granules():
+            for sweep in data.sweeps:
+                yield sweep
+
+    def as_xarray(self, time_range=None, **kwargs) -> "xarray.Dataset":
+        """Get the data of the granules within `time_range`, concatenated along the time axis.
+
+        The time range is passed to the `as_xarray()` method of each granule (or applied to its
+        result if the dataset does not support it), so that each granule only reads the data
+        within the time range. Other keyword arguments are passed to `as_xarray()` as is.
+        """
+        import xarray
+
+        datasets = []
+        for data in self.granules(time_range):
+            if "time_range" in signature(data.as_xarray).parameters:
+                dataset = data.as_xarray(time_range=time_range, **kwargs)
+            else:
+                dataset = data._select_range(
+                    data.as_xarray(**kwargs), time_range=time_range
+                )
+            datasets.append(dataset)
+
+        if len(datasets) == 0:
+            raise ValueError(f"No {self.dataset} data found within {time_range}.")
+        return xarray.concat(datasets, dim="time", combine_attrs="override")
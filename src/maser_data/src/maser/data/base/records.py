@@ -4,6 +4,7 @@
 Module to define generic iterator class for record-based access.
 """
 
+from itertools import islice
 from typing import Union
 
 
@@ -26,10 +27,23 @@ class Records:
             data_instance (maser.data.Data): a reference to the parent data object
         """
         self.data_reference = data_instance
+        self._iterator = None
 
     def __iter__(self):
-        for d in self.generator:
-            yield d
+        return self
+
+    def __getitem__(self, index: int):
+        """Generic method to get an item from its index.
+
+        The items are reached by iterating over the generator: subclasses may override this
+        method to provide random access.
+        """
+        if index < 0:
+            items = list(self.generator)
+            return items[index]
+        for item in islice(self.generator, index, None):
+            return item
+        raise IndexError("index out of range")
 
     def __call__(self, load_data: Union[bool, None] = None, *args, **kwargs):
         return self.generator
@@ -48,4 +62,6 @@ class Records:
             yield d
 
     def __next__(self):
-        next(self.generator)
+        if self._iterator is None:
+            self._iterator = iter(self.generator)
+        return next(self._iterator)
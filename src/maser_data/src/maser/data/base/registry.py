@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""
+Module to define the registry of the dataset classes.
+
+The dataset classes are listed, with the "module:Class" path of their definition, in the
+dataset_registry.json manifest, so that they can be imported only when they are used.
+"""
+
+from typing import Callable, Dict, Tuple
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+import json
+import sys
+
+
+@lru_cache(maxsize=None)
+def _dataset_manifest() -> Dict[str, str]:
+    """Get the "module:Class" path of the class of each dataset (loaded once from
+    dataset_registry.json)."""
+    with open(Path(__file__).parent / "dataset_registry.json") as f:
+        return json.load(f)
+
+
+class _DatasetRegistry(dict):
+    """Registry of the dataset classes (filled by `BaseData.__init_subclass__`).
+
+    The dataset classes listed in dataset_registry.json are imported on demand: when their
+    dataset is looked up, or when the whole registry is iterated over.
+    """
+
+    def _import(self, dataset) -> bool:
+        """Import the module of a dataset class, and tell if the dataset is now registered."""
+        path = _dataset_manifest().get(dataset)
+        if path is None:
+            return False
+        import_module(path.split(":")[0])
+        return dict.__contains__(self, dataset)
+
+    def load_all(self) -> None:
+        """Import all the dataset classes of the manifest."""
+        for dataset in _dataset_manifest():
+            if not dict.__contains__(self, dataset):
+                self._import(dataset)
+
+    def __missing__(self, dataset):
+        if self._import(dataset):
+            return dict.__getitem__(self, dataset)
+        raise KeyError(dataset)
+
+    def __contains__(self, dataset) -> bool:
+        return dict.__contains__(self, dataset) or self._import(dataset)
+
+    def get(self, dataset, default=None):
+        return self[dataset] if dataset in self else default
+
+    def __iter__(self):
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self.load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+
+def _lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """Get the module-level `__getattr__` and `__dir__` functions of a package whose exported
+    names are only imported when they are used (the `__all__` list of the package is also set,
+    for `from package import *`).
+
+    :param package: the name of the package
+    :param exports: the (absolute or relative) name of the module defining each exported name.
+                    A subpackage is exported with its own name.
+    """
+    namespace = vars(sys.modules[package])
+    namespace["__all__"] = sorted(
+        {name for name in namespace if not name.startswith("_")} | set(exports)
+    )
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = import_module(exports[name], package)
+        if module.__name__ == f"{package}.{name}":
+            return module
+        return getattr(module, name)
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
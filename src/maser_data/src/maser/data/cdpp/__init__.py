@@ -40,42 +40,42 @@ Classes for CDPP datasets.
 
 """
 
-from .wind import (  # noqa: F401
-    WindWavesRad1L260sV2BinData,
-    WindWavesRad1L260sV1BinData,
-    WindWavesRad2L260sV1BinData,
-    WindWavesTnrL260sV1BinData,
-    WindWavesRad1L2BinData,
-    WindWavesTnrL3NnBinData,
-    WindWavesTnrL260sV2BinData,
-    WindWavesRad2L260sV2BinData,
-    WindWavesTnrL3Bqt1mnBinData,
-)
-from .wind import (  # noqa: F401
-    WindWavesL260sSweeps,
-    WindWavesL2HighResSweeps,
-    WindWaves60sSweeps,
-)
-from .wind import (  # noqa: F401
-    WindWavesTnrL3Bqt1mnRecords,
-)
-from .viking import (  # noqa: F401
-    VikingV4nE5BinData,
-)
-from .interball import (  # noqa: F401
-    InterballAuroralPolradRspBinData,
-)
-from .interball import (  # noqa: F401
-    InterballAuroralPolradRspSweeps,
-    InterballAuroralPolradRspSweep,
-)
-from .interball import (  # noqa: F401
-    InterballAuroralPolradRspRecords,
-    InterballAuroralPolradRspRecord,
-)
-from .stereo import (  # noqa: F401
-    StereoAWavesL2HighResLfrBinData,
-    StereoAWavesL2HighResHfrBinData,
-    StereoBWavesL2HighResLfrBinData,
-    StereoBWavesL2HighResHfrBinData,
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".wind": [
+        "WindWavesRad1L260sV2BinData",
+        "WindWavesRad1L260sV1BinData",
+        "WindWavesRad2L260sV1BinData",
+        "WindWavesTnrL260sV1BinData",
+        "WindWavesRad1L2BinData",
+        "WindWavesTnrL3NnBinData",
+        "WindWavesTnrL260sV2BinData",
+        "WindWavesRad2L260sV2BinData",
+        "WindWavesTnrL3Bqt1mnBinData",
+        "WindWavesL260sSweeps",
+        "WindWavesL2HighResSweeps",
+        "WindWaves60sSweeps",
+        "WindWavesTnrL3Bqt1mnRecords",
+    ],
+    ".viking": [
+        "VikingV4nE5BinData",
+    ],
+    ".interball": [
+        "InterballAuroralPolradRspBinData",
+        "InterballAuroralPolradRspSweeps",
+        "InterballAuroralPolradRspSweep",
+        "InterballAuroralPolradRspRecords",
+        "InterballAuroralPolradRspRecord",
+    ],
+    ".stereo": [
+        "StereoAWavesL2HighResLfrBinData",
+        "StereoAWavesL2HighResHfrBinData",
+        "StereoBWavesL2HighResLfrBinData",
+        "StereoBWavesL2HighResHfrBinData",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
@@ -14,6 +14,7 @@ __project__ = "MASER/CDPP"
 
 __all__ = [
     "decode_ccsds_date",
+    "decode_ccsds_dates",
     "CCSDSDate",
     "CCSDSDateCUC",
     "CCSDSDateCDS",
@@ -24,6 +25,8 @@ __all__ = [
 
 import datetime
 
+import numpy
+
 # TODO: implement BCD for CCS (but ISEE3-SBH doesn't follow the CCS standard)
 # TODO: fix MSB as described in the CCSDS standard - first bit read is least significant bit
 
@@ -313,6 +316,124 @@ class CCSDSDateCCS(CCSDSDate):
         return dt + datetime.timedelta(microseconds=micro)
 
 
+def decode_ccsds_dates(p_fields, t_fields, epoch=None, bcd=False) -> numpy.ndarray:
+    """Decode arrays of CCSDS time codes into a datetime64[ns] array.
+
+    This is the array counterpart of `decode_ccsds_date`, for the CUC level 1, CDS level 1 and 2,
+    and CCS time code formats: each time code is decoded as the `datetime` attribute of the
+    corresponding CCSDSDate object (i.e. with the same microsecond truncation), but all the
+    time codes sharing a `p_field` are decoded at once.
+
+    :param p_fields: time code preamble codes (int or array of N ints)
+    :param t_fields: time specification fields, as a (N, k) array of 8-bit integers or an
+        array of N k-byte items (e.g. a field of a structured array)
+    :param epoch: Time start epoch of the CDS level 2 time codes (datetime, datetime64 or
+        ISO string)
+    :param bcd: the CCS time specification fields are encoded in Binary Coded Decimal
+        (the CCSDSDateCCS class doesn't decode BCD, which corresponds to `bcd=False`)
+    :return: datetime64[ns] array of N times
+    """
+    t_fields = numpy.ascontiguousarray(t_fields)
+    if t_fields.dtype.kind in "SV":
+        t_fields = t_fields.view(numpy.uint8).reshape(t_fields.shape[0], -1)
+    t_fields = numpy.atleast_2d(t_fields).astype(numpy.int64)
+    p_fields = numpy.broadcast_to(numpy.asarray(p_fields), t_fields.shape[:1])
+
+    times = numpy.empty(len(t_fields), dtype="M8[ns]")
+    for p_field in numpy.unique(p_fields).tolist():
+        rows = p_fields == p_field
+        times[rows] = _decode_t_fields(p_field, t_fields[rows], epoch, bcd)
+    return times
+
+
+def _decode_t_fields(p_field, t_fields, epoch, bcd) -> numpy.ndarray:
+    """Decode time specification fields sharing the same `p_field` (see `decode_ccsds_dates`)."""
+    time_code_id = int((p_field & 14) // 2)
+    if time_code_id == 1:
+        # CCSDS CUC level 1 format
+        n_bytes_coarse_time = int(((p_field & 48) / 16) + 1)
+        n_bytes_fine_time = int((p_field & 192) / 64)
+        _check_t_fields(t_fields, n_bytes_coarse_time + n_bytes_fine_time)
+        seconds = _bytes_to_int(t_fields[:, :n_bytes_coarse_time])
+        sub_seconds_fraction_counter = _bytes_to_int(t_fields[:, n_bytes_coarse_time:])
+        microseconds = (
+            (sub_seconds_fraction_counter * 1e6) / 2 ** (8 * n_bytes_fine_time)
+        ).astype(numpy.int64)
+        return (
+            numpy.datetime64("1958-01-01", "ns")
+            + seconds.astype("m8[s]")
+            + microseconds.astype("m8[us]")
+        )
+    elif time_code_id == 2:
+        raise NotImplementedError("CCSDS CUC level 2")
+    elif time_code_id == 4:
+        # CCSDS CDS format (level 1 or 2)
+        if p_field & 16 == 0:
+            time_epoch = numpy.datetime64("1958-01-01", "ns")
+        elif epoch is None:
+            raise ValueError("CCSDS CDS level 2 time codes require an epoch")
+        else:
+            time_epoch = numpy.datetime64(epoch, "ns")
+        n_bytes_day = int(((p_field & 32) / 32) + 2)
+        n_bytes_sub_millisecond = int((p_field & 192) / 32)
+        _check_t_fields(t_fields, n_bytes_day + 4 + n_bytes_sub_millisecond)
+        days = _bytes_to_int(t_fields[:, :n_bytes_day])
+        millisec = _bytes_to_int(t_fields[:, n_bytes_day : n_bytes_day + 4])
+        # (the sub-millisecond counter is added as microseconds, as in CCSDSDateCDS)
+        sub_milli = _bytes_to_int(t_fields[:, n_bytes_day + 4 :])
+        microsec = (millisec % 1000) * 1000 + sub_milli
+        return (
+            time_epoch
+            + days.astype("m8[D]")
+            + (millisec // 1000).astype("m8[s]")
+            + microsec.astype("m8[us]")
+        )
+    elif time_code_id == 5:
+        # CCSDS CCS format
+        resolution = int((p_field & 224) / 32)
+        _check_t_fields(t_fields, 7 + resolution)
+        if bcd:
+            t_fields = (t_fields >> 4) * 10 + (t_fields & 15)
+        base = 100 if bcd else 256
+        year = _bytes_to_int(t_fields[:, 0:2], base)
+        if p_field & 16 == 16:
+            # year and day of year
+            day = _bytes_to_int(t_fields[:, 2:4], base) - 1
+            date = (year - 1970).astype("M8[Y]").astype("M8[D]") + day.astype("m8[D]")
+        else:
+            # year, month and day of month
+            months = (year - 1970) * 12 + t_fields[:, 2] - 1
+            date = months.astype("M8[M]").astype("M8[D]") + (t_fields[:, 3] - 1).astype(
+                "m8[D]"
+            )
+        sub_second = _bytes_to_int(t_fields[:, 7:], 100) / (100**resolution)
+        micro = (sub_second * 1e6).astype(numpy.int64)
+        return (
+            date.astype("M8[ns]")
+            + t_fields[:, 4].astype("m8[h]")
+            + t_fields[:, 5].astype("m8[m]")
+            + t_fields[:, 6].astype("m8[s]")
+            + micro.astype("m8[us]")
+        )
+    elif time_code_id == 6:
+        raise NotImplementedError("CCSDS Agency Defined level 2")
+    else:
+        raise Exception("Illegal Time Code ID")
+
+
+def _check_t_fields(t_fields, n_bytes):
+    if t_fields.shape[1] != n_bytes:
+        raise Exception("T_field length does match P_field time format specification")
+
+
+def _bytes_to_int(t_fields, base=256) -> numpy.ndarray:
+    """Combine the columns of a (N, k) array of bytes into N integers (first byte first)."""
+    value = numpy.zeros(len(t_fields), dtype=numpy.int64)
+    for item in t_fields.T:
+        value = value * base + item
+    return value
+
+
 def to_binary_coded_decimal(value=0) -> int:
     return int("0x{}".format(value), 16)
 
@@ -10,9 +10,20 @@ from pathlib import Path
 import numpy
 
 from typing import Union, List
-from astropy.time import Time
+from astropy.time import Time, TimeDelta
 from ..const import CCSDS_CDS_FIELDS
-from ..utils import _read_sweep_length, _read_block
+from ..utils import (
+    _merge_dtype,
+    _struct_to_dtype,
+    _read_array,
+    _index_records,
+    _ccsds_cds_to_datetime64,
+)
+
+_SFA_CONF_FIELDS = (
+    ["STEPS", "FIRST_FREQ", "CHANNELS", "SWEEP_DURATION", "ATTENUATION"],
+    ">ififi",
+)
 
 
 class InterballAuroralPolradRspBinData(
@@ -25,101 +36,110 @@ class InterballAuroralPolradRspBinData(
 
     _dataset_keys = ["EX", "EY", "EZ"]
 
+    _header_dtype = _struct_to_dtype(
+        _merge_dtype((CCSDS_CDS_FIELDS[1], ">8s", _SFA_CONF_FIELDS[1])),
+        CCSDS_CDS_FIELDS[0] + ["SESSION_NAME"] + _SFA_CONF_FIELDS[0],
+    )
+
     def __init__(
         self,
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "sweeps",
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
     ):
         BinData.__init__(
             self,
             filepath,
             dataset,
             access_mode,
+            memory_map=memory_map,
+            index_cache=index_cache,
         )
         FixedFrequencies.__init__(self)
         self.fields = ["EX", "EY", "EZ"]
         self.units = ["W m^-2 Hz^-1", "W m^-2 Hz^-1", "W m^-2 Hz^-1"]
-        self._data = None
-        self._nsweep = None
-        self._data = self._loader()
+        self._data_ = None
+
+    @property
+    def _data(self):
+        """The headers and data of the sweeps, decoded when first used."""
+        if self._data_ is None:
+            self._data_ = self._loader()
+        return self._data_
+
+    @property
+    def _nsweep(self):
+        return len(self._data)
+
+    def _build_index(self):
+        def sweep_times(headers):
+            # the epoch is offset in the same way as in the sweep times (i.e. including the
+            # leap seconds since 1950, see `InterballAuroralPolradRspSweep.time`)
+            epoch = numpy.datetime64("1950-01-01", "ms")
+            millisec = (_ccsds_cds_to_datetime64(headers, epoch) - epoch).astype("i8")
+            times = Time("1950-01-01 00:00:00") + TimeDelta(
+                millisec // 1000, (millisec % 1000) / 1000, format="sec"
+            )
+            return (times.datetime64 + numpy.timedelta64(500, "us")).astype("M8[ms]")
+
+        return _index_records(self.buffer, self._header_dtype, sweep_times)
 
     def _loader(self, count_only=False):
         data = []
-        nsweep = 0
 
-        ccsds_fields, ccsds_dtype = CCSDS_CDS_FIELDS
-        sfa_conf_fields, sfa_conf_dtype = (
-            ["STEPS", "FIRST_FREQ", "CHANNELS", "SWEEP_DURATION", "ATTENUATION"],
-            ">ififi",
-        )
+        ccsds_fields, _ = CCSDS_CDS_FIELDS
+        sfa_conf_fields = _SFA_CONF_FIELDS[0]
+
+        # Reading the sweep offsets and header parameters from the index
+        index = self.index
+        if index is None:
+            print("Error reading file!")
+            return None
+        header_dtype = self._header_dtype
+        headers = index[list(header_dtype.names)]
+        offsets = index["offset"]
+        buffer = self.buffer
+
+        # => Here we fix the `P_Field` which is corrupted
+        # First we reverse the order of the bits in the byte
+        preamble = headers["CCSDS_PREAMBLE"]
+        P_Field = numpy.packbits(
+            numpy.unpackbits(preamble[:, None], axis=1)[:, ::-1], axis=1
+        )[:, 0]
+        # Then we put back the initial 4-6 bits into bits 1-3 (defining the CSSDS code)
+        # as those bits are not in reverse order in the file...
+        P_Field = (P_Field & 241) + (preamble & 112) // 8
+
+        epoch = Time("1950-01-01 00:00:00")
+
+        for nsweep, (offset, header_values, p_field) in enumerate(
+            zip(offsets.tolist(), headers.tolist(), P_Field.tolist())
+        ):
+            header_i = dict(zip(ccsds_fields, header_values[:8]))
+            header_i["P_Field"] = p_field
+            header_i["T_Field"] = bytearray(buffer[offset + 1 : offset + 8])
+            header_i["CCSDS_CDS_LEVEL2_EPOCH"] = epoch
+            # (the 8 raw bytes, including any NUL padding)
+            header_i["SESSION_NAME"] = bytes(header_values[8]).decode()
+            header_i.update(zip(sfa_conf_fields, header_values[9:]))
+            header_i["SWEEP_ID"] = nsweep
+
+            # EY, EZ and EX data (views on the file buffer)
+            steps = header_i["STEPS"]
+            offset += header_dtype.itemsize
+            data_i = dict((("EX", None), ("EY", None), ("EZ", None)))
+            data_i["EY"] = _read_array(buffer, offset, steps)
+            if header_i["CHANNELS"] == 3:
+                data_i["EZ"] = _read_array(buffer, offset + 4 * steps, steps)
+                data_i["EX"] = _read_array(buffer, offset + 8 * steps, steps)
+
+            data.append((header_i, data_i))
 
-        while True:
-            try:
-                # Reading number of octets in the current sweep
-                loctets1 = _read_sweep_length(self.file)
-                if loctets1 is None:
-                    break
-
-                header_i = _read_block(self.file, ccsds_dtype, ccsds_fields)
-
-                # => Here we fix the `P_Field` which is corrupted
-                # First we reverse the order of the bits in the byte
-                P_Field_tmp = int("{:08b}".format(header_i["CCSDS_PREAMBLE"])[::-1], 2)
-                # Then we put back the initial 4-6 bits into bits 1-3 (defining the CSSDS code)
-                # as those bits are not in reverse order in the file...
-                P_Field_tmp = (P_Field_tmp & 241) + (
-                    header_i["CCSDS_PREAMBLE"] & 112
-                ) // 8
-
-                header_i["P_Field"] = P_Field_tmp
-                header_i["T_Field"] = bytearray(
-                    [
-                        header_i["CCSDS_JULIAN_DAY_B1"],
-                        header_i["CCSDS_JULIAN_DAY_B2"],
-                        header_i["CCSDS_JULIAN_DAY_B3"],
-                        header_i["CCSDS_MILLISECONDS_OF_DAY_B0"],
-                        header_i["CCSDS_MILLISECONDS_OF_DAY_B1"],
-                        header_i["CCSDS_MILLISECONDS_OF_DAY_B2"],
-                        header_i["CCSDS_MILLISECONDS_OF_DAY_B3"],
-                    ]
-                )
-
-                header_i["CCSDS_CDS_LEVEL2_EPOCH"] = Time("1950-01-01 00:00:00")
-                header_i["SESSION_NAME"] = "".join(
-                    [x.decode() for x in _read_block(self.file, ">cccccccc")]
-                )
-                header_i.update(_read_block(self.file, sfa_conf_dtype, sfa_conf_fields))
-                header_i["SWEEP_ID"] = nsweep
-
-                data_dtype = ">" + "f" * header_i["STEPS"]
-
-                data_i = dict((("EX", None), ("EY", None), ("EZ", None)))
-                data_i["EY"] = _read_block(self.file, data_dtype)
-                if header_i["CHANNELS"] == 3:
-                    data_i["EZ"] = _read_block(self.file, data_dtype)
-                    data_i["EX"] = _read_block(self.file, data_dtype)
-
-                # Reading number of octets in the current sweep
-                loctets2 = _read_sweep_length(self.file)
-                if loctets2 != loctets1:
-                    print("Error reading file!")
-                    return None
-
-            except EOFError:
-                print("End of file reached")
-                break
-
-            else:
-                data.append((header_i, data_i))
-                nsweep += 1
-
-        self._nsweep = nsweep
         return data
 
     def __len__(self):
-        if self._nsweep is None:
-            self._loader(count_only=True)
         return self._nsweep
 
     @property
@@ -192,14 +212,21 @@ class InterballAuroralPolradRspBinData(
 
         return md
 
-    def as_xarray(self):
+    def as_xarray(self, time_range=None, freq_range=None):
         import xarray
 
+        # Only the sweeps within the time range are read (using the index)
+        sweeps = self.index_slice(*self._parse_time_range(time_range))
+        if sweeps == slice(0, len(self._data)):
+            times = self.times
+        else:
+            times = Time(self.index["time"][sweeps])
+
         datasets = {}
         for dataset_key, dataset_unit in zip(self.fields, self.units):
-            data = numpy.zeros((len(self.times), len(self.frequencies)))
-            for i, sweep in enumerate(self.sweeps):
-                data[i, :] = sweep.data[dataset_key]
+            data = numpy.zeros((len(times), len(self.frequencies)))
+            for i, sweep in enumerate(self._data[sweeps]):
+                data[i, :] = sweep[1][dataset_key]
             datasets[dataset_key] = xarray.DataArray(
                 data=data.T,
                 name=dataset_key,
@@ -209,13 +236,15 @@ class InterballAuroralPolradRspBinData(
                         self.frequencies.value,
                         {"units": self.frequencies.unit},
                     ),
-                    ("time", self.times.to_datetime()),
+                    ("time", times.to_datetime()),
                 ],
                 dims=("frequency", "time"),
                 attrs={"units": dataset_unit},
             )
 
-        return xarray.Dataset(data_vars=datasets)
+        return self._select_range(
+            xarray.Dataset(data_vars=datasets), freq_range=freq_range
+        )
 
     def quicklook(self, file_png=None, keys: List[str] = ["EX", "EY", "EZ"], **kwargs):
         default_keys = ["EX", "EY", "EZ"]
@@ -25,6 +25,9 @@ class InterballAuroralPolradRspSweep(Sweep):
 
 
 class InterballAuroralPolradRspSweeps(Sweeps):
+    def __getitem__(self, index):
+        return InterballAuroralPolradRspSweep(*self.data_reference._data[index])
+
     @property
     def generator(self):
         for sweep in self.data_reference._data:
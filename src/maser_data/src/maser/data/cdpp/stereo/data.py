@@ -15,7 +15,14 @@ from .sweeps import (
 )
 from astropy.time import Time
 from astropy.units import Unit
-from ..utils import _read_sweep_length, _merge_dtype, _read_block
+from ..utils import (
+    _merge_dtype,
+    _struct_to_dtype,
+    _records_to_dicts,
+    _read_array,
+    _index_records,
+    _caldate_to_datetime64,
+)
 from ..const import (
     CCSDS_CDS_FIELDS,
     CALDATE_FIELDS,
@@ -30,6 +37,41 @@ ANT_CFG_FIELDS = (
     ">hhh",
 )
 
+# Header of the sweeps in `cdpp_stX_l2_wav_XXX` data
+_L2_HEADER_DTYPE = _struct_to_dtype(
+    _merge_dtype(
+        (
+            ">h",
+            CCSDS_CDS_FIELDS[1],
+            ">L",
+            CALDATE_FIELDS[1],
+            ">ffhhhh",
+            ANT_CFG_FIELDS[1],
+            ">hhhhh",
+        )
+    ),
+    ["RECEIVER_CODE"]
+    + CCSDS_CDS_FIELDS[0]
+    + ["JULIAN_SEC"]
+    + CALDATE_FIELDS[0]
+    + [
+        "JULIAN_SEC_FRAC",
+        "INTEG_TIME",
+        "NSTEP",
+        "NFR_STEP",
+        "NFREQ",
+        "NCHANNEL",
+    ]
+    + ANT_CFG_FIELDS[0]
+    + [
+        "NCONFIG",
+        "NAGC2",
+        "NAUTO2",
+        "LOOP_A",
+        "LOOP_C",
+    ],
+)
+
 
 class StereoWavesL2HighResBinData(
     VariableFrequencies, BinData, dataset="cdpp_st__l2_wav_h_res"
@@ -40,153 +82,115 @@ class StereoWavesL2HighResBinData(
 
     _dataset_keys = ["agc1", "agc2", "auto1", "auto2", "crossr", "crossi"]
 
+    _header_dtype = _L2_HEADER_DTYPE
+
     def __init__(
         self,
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "sweeps",
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
     ):
-        BinData.__init__(self, filepath, dataset, access_mode)
+        BinData.__init__(
+            self,
+            filepath,
+            dataset,
+            access_mode,
+            memory_map=memory_map,
+            index_cache=index_cache,
+        )
         VariableFrequencies.__init__(self)
-        self._data = None
-        self._nsweep = None
-        self._data = self._loader()
+        self._data_ = None
         self.fields = ["agc1", "agc2", "auto1", "auto2", "crossr", "crossi"]
         self.units = ["ADU", "ADU", "ADU", "ADU", "ADU", "ADU"]
 
-    def _read_array_block(self, n1, n2):
-        import struct
+    @property
+    def _data(self):
+        """The headers and data of the sweeps, decoded when first used."""
+        if self._data_ is None:
+            self._data_ = self._loader()
+        return self._data_
+
+    @property
+    def _nsweep(self):
+        return len(self._data) // 3
 
-        nbytes = 4 * n1 * n2
-        block = self.file.read(nbytes)
-        data = struct.unpack(">" + "f" * (nbytes // 4), block)
-        return numpy.array(data).reshape(n1, n2)
+    def _build_index(self):
+        return _index_records(self.buffer, self._header_dtype, _caldate_to_datetime64)
 
     def _loader(self, count_only=False):
         data = []
-        nsweep = 0
-
-        ccsds_fields, ccsds_dtype = CCSDS_CDS_FIELDS
-        caldate_fields, caldate_dtype = CALDATE_FIELDS
-        ant_cfg_fields, ant_cfg_dtype = ANT_CFG_FIELDS
-
-        header_fields = (
-            ["RECEIVER_CODE"]
-            + ccsds_fields
-            + ["JULIAN_SEC"]
-            + caldate_fields
-            + [
-                "JULIAN_SEC_FRAC",
-                "INTEG_TIME",
-                "NSTEP",
-                "NFR_STEP",
-                "NFREQ",
-                "NCHANNEL",
-            ]
-            + ant_cfg_fields
-            + [
-                "NCONFIG",
-                "NAGC2",
-                "NAUTO2",
-                "LOOP_A",
-                "LOOP_C",
-            ]
-        )
-        header_dtype = _merge_dtype(
-            (">h", ccsds_dtype, ">L", caldate_dtype, ">ffhhhh", ant_cfg_dtype, ">hhhhh")
-        )
 
-        while True:
-            try:
-                # Reading number of bytes in the current sweep
-                loctets1 = _read_sweep_length(self.file)
-                if loctets1 is None:
-                    break
-
-                # Reading header parameters in the current sweep
-                header_i = _read_block(self.file, header_dtype, header_fields)
-                nfreq = header_i["NFREQ"]
-                nstep = header_i["NSTEP"]
-                nconf = header_i["NCONFIG"]
-                nauto1 = nfreq
-                nauto2 = header_i["NAUTO2"]
-                nagc1 = nstep
-                nagc2 = header_i["NAGC2"]
-                loopa = header_i["LOOP_A"]
-                loopc = header_i["LOOP_C"]
-
-                # Reading frequency list (kHz) in the current sweep
-                cur_dtype = ">" + "f" * nfreq
-                freq = _read_block(self.file, cur_dtype)
-
-                # Reading time step table
-                step_time = self._read_array_block(nstep, nconf)
-
-                if self.load_data:
-                    # Reading AGC1 table
-                    agc1 = self._read_array_block(nagc1, nconf)
-
-                    # Reading AGC2 table
-                    if nagc2 == nstep:
-                        agc2 = self._read_array_block(nagc2, nconf)
-                    elif nagc2 == 0:
-                        agc2 = None
+        # Reading the sweep offsets and header parameters from the index
+        index = self.index
+        if index is None:
+            print("Error reading file!")
+            return None
+        header_dtype = self._header_dtype
+        headers = index[list(header_dtype.names)]
+        buffer = self.buffer
+
+        for offset, header_i in zip(
+            index["offset"] + header_dtype.itemsize, _records_to_dicts(headers)
+        ):
+            nfreq = header_i["NFREQ"]
+            nstep = header_i["NSTEP"]
+            nconf = header_i["NCONFIG"]
+            nauto1 = nfreq
+            nauto2 = header_i["NAUTO2"]
+            nagc1 = nstep
+            nagc2 = header_i["NAGC2"]
+            loopa = header_i["LOOP_A"]
+            loopc = header_i["LOOP_C"]
+
+            # Frequency list (kHz) in the current sweep
+            freq = _read_array(buffer, offset, nfreq)
+            offset += 4 * nfreq
+
+            # Time step table
+            step_time = _read_array(buffer, offset, nstep * nconf)
+            step_time = step_time.reshape(nstep, nconf)
+            offset += 4 * nstep * nconf
+
+            if self.load_data:
+                if nagc2 not in (0, nstep):
+                    raise IOError("Corrupted file (inconsistent NAGC2 value)")
+                if nauto2 not in (0, nfreq):
+                    raise IOError("Corrupted file (inconsistent NAUTO2 value)")
+
+                # AGC1, AGC2, AUTO1, AUTO2, CROSS_R and CROSS_I tables
+                # (views on the file buffer)
+                tables = {}
+                for key, n1, n2 in [
+                    ("agc1", nagc1, nconf),
+                    ("agc2", nagc2, nconf),
+                    ("auto1", nauto1, loopa),
+                    ("auto2", nauto2, loopa),
+                    ("cross_r", nfreq, loopc),
+                    ("cross_i", nfreq, loopc),
+                ]:
+                    if n1 == 0 and key in ["agc2", "auto2"]:
+                        tables[key] = None
                     else:
-                        raise IOError("Corrupted file (inconsistent NAGC2 value)")
-
-                    # Reading AUTO1 table
-                    auto1 = self._read_array_block(nauto1, loopa)
+                        tables[key] = _read_array(buffer, offset, n1 * n2).reshape(
+                            n1, n2
+                        )
+                    offset += 4 * n1 * n2
 
-                    # Reading AUTO2 table
-                    if nauto2 == nfreq:
-                        auto2 = self._read_array_block(nauto2, loopa)
-                    elif nauto2 == 0:
-                        auto2 = None
-                    else:
-                        raise IOError("Corrupted file (inconsistent NAUTO2 value)")
-
-                    # Reading CROSS_R table
-                    cross_r = self._read_array_block(nfreq, loopc)
-
-                    # Reading CROSS_I table
-                    cross_i = self._read_array_block(nfreq, loopc)
-
-                    data_i = {
-                        "freq": freq,
-                        "step_time": step_time,
-                        "agc1": agc1,
-                        "agc2": agc2,
-                        "auto1": auto1,
-                        "auto2": auto2,
-                        "cross_r": cross_r,
-                        "cross_i": cross_i,
-                    }
-                else:
-                    data_i = {
-                        "freq": freq,
-                        "step_time": step_time,
-                    }
-                    # Skip data section
-                    self.file.seek(
-                        4 * (nagc1 + nagc2) * nconf
-                        + 4 * (nauto1 + nauto2) * loopa
-                        + 4 * (2 * nfreq * loopc),
-                        1,
-                    )
-                # Reading number of octets in the current sweep
-                loctets2 = _read_sweep_length(self.file)
-                if loctets2 != loctets1:
-                    print("Error reading file!")
-                    return None
-
-            except EOFError:
-                print("End of file reached")
-                break
+                data_i = {
+                    "freq": freq,
+                    "step_time": step_time,
+                    **tables,
+                }
             else:
-                data.append({"hdr": header_i, "dat": data_i})
-            nsweep += 1
+                data_i = {
+                    "freq": freq,
+                    "step_time": step_time,
+                }
+
+            data.append({"hdr": header_i, "dat": data_i})
 
-        self._nsweep = nsweep // 3
         return data
 
     @property
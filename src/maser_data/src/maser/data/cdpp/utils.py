@@ -1,6 +1,28 @@
 # -*- coding: utf-8 -*-
+import re
 import struct
 
+import numpy
+
+# mapping between `struct` format characters and numpy type codes
+_STRUCT_TO_NUMPY = {
+    "c": "S1",
+    "b": "i1",
+    "B": "u1",
+    "?": "b1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "l": "i4",
+    "L": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+}
+
 
 def _merge_dtype(dtypes):
     return dtypes[0] + "".join(dt[1:] for dt in dtypes[1:])
@@ -21,3 +43,159 @@ def _read_block(file, dtype, fields=None):
             return struct.unpack(dtype, block)
         else:
             return dict(zip(fields, struct.unpack(dtype, block)))
+
+
+def _struct_to_dtype(dtype, fields):
+    """Convert a `struct` format string and its field names into a numpy structured dtype.
+
+    The `struct` standard sizes are used, i.e. the resulting dtype is packed (no alignment),
+    e.g. `_struct_to_dtype(">hL", ["A", "B"])` gives `[("A", ">i2"), ("B", ">u4")]`.
+    The "s" strings are given as raw bytes ("V" items), to be decoded by the caller.
+    """
+    byte_order = ">" if dtype[0] in "!>" else "<" if dtype[0] == "<" else "="
+    codes = []
+    for count, char in re.findall(r"(\d*)([a-zA-Z?])", dtype.lstrip("@=<>!")):
+        if char == "s":
+            # a single item of `count` raw bytes (unlike numpy "S" strings, the trailing NUL
+            # bytes are kept as with `struct`)
+            codes.append(f"V{count or 1}")
+        else:
+            codes.extend([byte_order + _STRUCT_TO_NUMPY[char]] * int(count or 1))
+    if len(codes) != len(fields):
+        raise ValueError(
+            f"{len(fields)} field names given for {len(codes)} items in '{dtype}'"
+        )
+    return numpy.dtype(list(zip(fields, codes)))
+
+
+def _scan_records(buffer):
+    """Scan a buffer made of length-prefixed records, i.e. `[length][payload][length]`, where
+    `length` is a big-endian 32-bit integer giving the number of bytes of the payload.
+
+    Only the record lengths are read, so that the scan costs one small read per record. The
+    scan stops at the first negative length (the record is kept, to be rejected by
+    `_check_records`).
+
+    :param buffer: the file content (any object supporting the buffer protocol)
+    :return: the byte offsets of the record payloads and their lengths, as numpy arrays
+    """
+    offsets = []
+    lengths = []
+    size = len(buffer)
+    pos = 0
+    while pos + 4 <= size:
+        (length,) = struct.unpack_from(">i", buffer, pos)
+        offsets.append(pos + 4)
+        lengths.append(length)
+        if length < 0:
+            # corrupt record length (the next records cannot be found)
+            break
+        pos += length + 8
+    return numpy.array(offsets, dtype=numpy.int64), numpy.array(
+        lengths, dtype=numpy.int64
+    )
+
+
+def _check_records(buffer, offsets, lengths):
+    """Check that the trailing length of each record matches its leading length."""
+    if len(offsets) == 0:
+        return True
+    if numpy.any(lengths < 0):
+        return False
+    ends = offsets + lengths
+    if ends[-1] + 4 > len(buffer):
+        return False
+    return bool(numpy.all(_read_headers(buffer, ends, numpy.dtype(">i4")) == lengths))
+
+
+def _read_headers(buffer, offsets, dtype):
+    """Decode one `dtype` item at each of the given byte offsets of the buffer.
+
+    All the items are decoded at once: if the offsets are evenly spaced, the result is
+    a strided view on the buffer, otherwise the bytes are gathered in a single pass.
+
+    :param buffer: the file content (any object supporting the buffer protocol)
+    :param offsets: byte offsets of the items
+    :param dtype: a numpy (structured) dtype
+    :return: a numpy array of `len(offsets)` items
+    """
+    dtype = numpy.dtype(dtype)
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    count = len(offsets)
+    if count == 0:
+        return numpy.empty(0, dtype=dtype)
+    stride = int(offsets[1] - offsets[0]) if count > 1 else dtype.itemsize
+    if stride >= dtype.itemsize and numpy.all(numpy.diff(offsets) == stride):
+        return numpy.ndarray(
+            (count,), dtype=dtype, buffer=buffer, offset=offsets[0], strides=(stride,)
+        )
+    raw = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    index = offsets[:, None] + numpy.arange(dtype.itemsize)
+    return raw[index].view(dtype).reshape(count)
+
+
+def _records_to_dicts(records):
+    """Convert a numpy structured array into a list of dicts (with python scalar values)."""
+    names = records.dtype.names
+    return [dict(zip(names, values)) for values in records.tolist()]
+
+
+def _read_array(buffer, offset, count, dtype=">f4"):
+    """Get `count` items of `dtype` at a given byte offset, as a (read-only) view on the buffer."""
+    return numpy.frombuffer(buffer, dtype=dtype, count=count, offset=int(offset))
+
+
+def _index_records(buffer, header_dtype, time_decoder):
+    """Build the index of a buffer made of length-prefixed records.
+
+    The index is a numpy structured array holding, for each record, the byte "offset" and
+    "length" of its payload, its header fields and its start "time".
+
+    :param buffer: the file content (any object supporting the buffer protocol)
+    :param header_dtype: numpy structured dtype of the header at the start of each record
+    :param time_decoder: function converting the decoded headers into a datetime64 array
+    :return: the index, or None if the record lengths are inconsistent
+    """
+    offsets, lengths = _scan_records(buffer)
+    if not _check_records(buffer, offsets, lengths):
+        return None
+    headers = _read_headers(buffer, offsets, header_dtype)
+    index = numpy.empty(
+        len(offsets),
+        dtype=[("offset", "i8"), ("length", "i8")]
+        + [(name, header_dtype[name]) for name in header_dtype.names]
+        + [("time", "M8[ms]")],
+    )
+    index["offset"] = offsets
+    index["length"] = lengths
+    for name in header_dtype.names:
+        index[name] = headers[name]
+    index["time"] = time_decoder(headers)
+    return index
+
+
+def _caldate_to_datetime64(headers):
+    """Get the times given by the CALEND_DATE_* fields of the headers, as datetime64."""
+    months = (headers["CALEND_DATE_YEAR"].astype("i8") - 1970) * 12
+    months += headers["CALEND_DATE_MONTH"] - 1
+    return (
+        months.astype("M8[M]").astype("M8[ms]")
+        + (headers["CALEND_DATE_DAY"] - 1).astype("m8[D]")
+        + headers["CALEND_DATE_HOUR"].astype("m8[h]")
+        + headers["CALEND_DATE_MINUTE"].astype("m8[m]")
+        + headers["CALEND_DATE_SECOND"].astype("m8[s]")
+    )
+
+
+def _ccsds_cds_to_datetime64(headers, epoch):
+    """Get the times given by the CCSDS CDS fields of the headers (24-bit day and 32-bit
+    millisecond of day), as datetime64, with respect to the given epoch."""
+    days = numpy.zeros(len(headers), dtype="i8")
+    for i in (1, 2, 3):
+        days = days * 256 + headers[f"CCSDS_JULIAN_DAY_B{i}"]
+    millisec = numpy.zeros(len(headers), dtype="i8")
+    for i in (0, 1, 2, 3):
+        millisec = millisec * 256 + headers[f"CCSDS_MILLISECONDS_OF_DAY_B{i}"]
+    return (
+        numpy.datetime64(epoch, "ms") + days.astype("m8[D]") + millisec.astype("m8[ms]")
+    )
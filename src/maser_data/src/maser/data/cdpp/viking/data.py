@@ -5,15 +5,17 @@ Classes for Viking datasets.
 """
 
 from pathlib import Path
-from typing import Union, Type
+from typing import Union
 from maser.data.base import BinData, RecordsOnly
-from .records import VikingV4nE5Records
+from .records import VikingV4nE5Records, RECORD_DTYPE
+from ..utils import _caldate_to_datetime64
 
 from astropy.time import Time
+import numpy
 
 
 class VikingV4nE5BinData(RecordsOnly, BinData, dataset="cdpp_viking_v4n_e5"):  # type: ignore
-    _iter_sweep_class = Type[VikingV4nE5Records]
+    _iter_record_class = VikingV4nE5Records
 
     def __init__(
         self,
@@ -21,26 +23,32 @@ class VikingV4nE5BinData(RecordsOnly, BinData, dataset="cdpp_viking_v4n_e5"):  #
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "records",
         load_data: bool = True,
+        memory_map: bool = False,
     ) -> None:
-        super().__init__(filepath, dataset, access_mode, load_data)
+        super().__init__(
+            filepath, dataset, access_mode, load_data, memory_map=memory_map
+        )
+        self._table = None
 
     @property
-    def times(self):
-        import numpy
+    def table(self) -> numpy.ndarray:
+        """The fixed-length blocks of all the records of the file, as a numpy structured array
+        of views on the file buffer (e.g. `table["HEADER1"]["ORBIT_NUMBER"]` or
+        `table["VIKING_V4H_SFA"]["ELECTRIC_SFA"]`, with one row per record)."""
+        if self._table is None:
+            buffer = self.buffer
+            if len(buffer) % RECORD_DTYPE.itemsize != 0:
+                raise ValueError(f"Wrong record length in {self.filepath}")
+            self._table = numpy.frombuffer(buffer, dtype=RECORD_DTYPE)
+        return self._table
 
+    @property
+    def times(self):
         if self._times is None:
-            times = Time([], format="jd")
-            _load_data, self._load_data = self._load_data, False
-            for header, _ in self.sweeps:
-                times = numpy.append(
-                    times,
-                    Time(
-                        f"{header[0]['CALEND_DATE_YEAR']}-{header[0]['CALEND_DATE_MONTH']}-"
-                        f"{header[0]['CALEND_DATE_DAY']} {header[0]['CALEND_DATE_HOUR']}:"
-                        f"{header[0]['CALEND_DATE_MINUTE']}:{header[0]['CALEND_DATE_SECOND']}"
-                    ),
-                )
-            self._load_data = _load_data
+            headers = self.table["HEADER1"]
+            times = _caldate_to_datetime64(headers) + headers[
+                "CALEND_DATE_MILLI_SECOND"
+            ].astype("m8[ms]")
             self._times = Time(times)
         return self._times
 
@@ -15,7 +15,15 @@ from .sweeps import (
 from .records import WindWavesTnrL3Bqt1mnRecords
 from astropy.time import Time, TimeDelta
 from astropy.units import Unit
-from ..utils import _read_sweep_length, _merge_dtype, _read_block
+from ..utils import (
+    _merge_dtype,
+    _struct_to_dtype,
+    _read_headers,
+    _records_to_dicts,
+    _read_array,
+    _index_records,
+    _caldate_to_datetime64,
+)
 from ..const import (
     CCSDS_CDS_FIELDS,
     CALDATE_FIELDS,
@@ -24,6 +32,58 @@ from ..const import (
 import numpy as np
 
 
+# Header of the sweeps in `cdpp_wi_wa_XXX_l2` data
+_L2_HEADER_DTYPE = _struct_to_dtype(
+    _merge_dtype(
+        (CCSDS_CDS_FIELDS[1], ">hL", CALDATE_FIELDS[1], ">fihhffhhhhhhhhffhhhhh")
+    ),
+    CCSDS_CDS_FIELDS[0]
+    + ["RECEIVER_CODE", "JULIAN_SEC"]
+    + CALDATE_FIELDS[0]
+    + [
+        "JULIAN_SEC_FRAC",
+        "ISWEEP",
+        "IUNIT",
+        "NPBS",
+        "SUN_ANGLE",
+        "SPIN_RATE",
+        "KSPIN",
+        "MODE",
+        "LISTFR",
+        "NFREQ",
+        "ICAL",
+        "IANTEN",
+        "IPOLA",
+        "IDIPXY",
+        "SDURCY",
+        "SDURPA",
+        "NPALCY",
+        "NFRPAL",
+        "NPALIF",
+        "NSPALF",
+        "NZPALF",
+    ],
+)
+
+# Header of the sweeps in `cdpp_wi_wa_XXX_l2_60s_vX` data
+# RECEIVER_CODE [Int, 16 bits] = Name of Receiver: 0=TNR; 1=RAD1; 2=RAD2
+# JULIAN_SEC [Int, 32 bits] = Julian date of the middle of the 60-second interval (in seconds since 1950/01/01)
+# AVG_DURATION [Int, 16 bits] = Averaging duration (seconds)
+# IUNIT [Int, 16 bits] = Signal intensity unit:
+#  1: Volt TLM (N1)
+#  2: V^2/Hz @ receiver (N2-3)
+#  3: μV^2/Hz @ receiver (N2-3)
+#  4: SFU (10^-22 W/m^2/Hz) @ antenna (N2-4).
+# NFREQ [Int, 16 bits] = Number of frequencies
+_L2_60S_HEADER_DTYPE = _struct_to_dtype(
+    _merge_dtype((CCSDS_CDS_FIELDS[1], ">hi", CALDATE_FIELDS[1], ">hhh")),
+    CCSDS_CDS_FIELDS[0]
+    + ["RECEIVER_CODE", "JULIAN_SEC"]
+    + CALDATE_FIELDS[0]
+    + ["AVG_DURATION", "IUNIT", "NFREQ"],
+)
+
+
 class WindWavesRad1L260sV2BinData(BinData, dataset="cdpp_wi_wa_rad1_l2_60s_v2"):  # type: ignore
     """CDPP Wind Waves RAD1 Level 2 60s-Average (version 2) dataset
 
@@ -34,6 +94,10 @@ class WindWavesRad1L260sV2BinData(BinData, dataset="cdpp_wi_wa_rad1_l2_60s_v2"):
     - Data format: Binary"""
 
     _iter_sweep_class = WindWavesL260sSweeps
+    _header_dtype = _L2_60S_HEADER_DTYPE
+
+    def _build_index(self):
+        return _index_records(self.buffer, self._header_dtype, _caldate_to_datetime64)
 
 
 class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):  # type: ignore
@@ -53,20 +117,41 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
         "MODE",
     ]  # , "MODE", "FREQ_DEGEN"]
 
+    _header_dtype = _L2_HEADER_DTYPE
+
     def __init__(
         self,
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "sweeps",
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
     ):
-        BinData.__init__(self, filepath, dataset, access_mode)
+        BinData.__init__(
+            self,
+            filepath,
+            dataset,
+            access_mode,
+            memory_map=memory_map,
+            index_cache=index_cache,
+        )
         VariableFrequencies.__init__(self)
-        self._data = None
-        self._nsweep = None
-        self._data = self._loader()
+        self._data_ = None
+        self._layout_ = None
         self.fields = ["VS", "VSP", "VZ", "TS", "TSP", "TZ"]
         self.units = ["uV2/Hz", "uV2/Hz", "uV2/Hz", "s", "s", "s"]
 
+    @property
+    def _data(self):
+        """The headers and data of the sweeps, decoded when first used."""
+        if self._data_ is None:
+            self._data_ = self._loader()
+        return self._data_
+
+    @property
+    def _nsweep(self):
+        return len(self._data)
+
     @property
     def _parse_file_name(self):
         pieces = self.filepath.stem.split("_")
@@ -77,114 +162,64 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
             )
         )
 
-    def _read_data_block(self, nbytes):
-        import struct
-
-        block = self.file.read(nbytes)
-        Vspal = struct.unpack(">" + "f" * (nbytes // 4), block)
-        block = self.file.read(nbytes)
-        Tspal = struct.unpack(">" + "f" * (nbytes // 4), block)
-        return np.array(Vspal, dtype=float), np.array(Tspal, dtype=float)
+    def _build_index(self):
+        return _index_records(self.buffer, self._header_dtype, _caldate_to_datetime64)
 
     def _loader(self, count_only=False):
         data = []
-        nsweep = 0
-
-        ccsds_fields, ccsds_dtype = CCSDS_CDS_FIELDS
-        caldate_fields, caldate_dtype = CALDATE_FIELDS
-        header_fields = (
-            ccsds_fields
-            + ["RECEIVER_CODE", "JULIAN_SEC"]
-            + caldate_fields
-            + [
-                "JULIAN_SEC_FRAC",
-                "ISWEEP",
-                "IUNIT",
-                "NPBS",
-                "SUN_ANGLE",
-                "SPIN_RATE",
-                "KSPIN",
-                "MODE",
-                "LISTFR",
-                "NFREQ",
-                "ICAL",
-                "IANTEN",
-                "IPOLA",
-                "IDIPXY",
-                "SDURCY",
-                "SDURPA",
-                "NPALCY",
-                "NFRPAL",
-                "NPALIF",
-                "NSPALF",
-                "NZPALF",
-            ]
-        )
-        header_dtype = _merge_dtype(
-            (ccsds_dtype, ">hL", caldate_dtype, ">fihhffhhhhhhhhffhhhhh")
-        )
-
-        while True:
-            try:
-                # Reading number of bytes in the current sweep
-                loctets1 = _read_sweep_length(self.file)
-                if loctets1 is None:
-                    break
-
-                # Reading header parameters in the current sweep
-                header_i = _read_block(self.file, header_dtype, header_fields)
-                npalf = header_i["NPALIF"]
-                nspal = header_i["NSPALF"]
-                nzpal = header_i["NZPALF"]
-
-                # Reading frequency list (kHz) in the current sweep
-                cur_dtype = ">" + "f" * npalf
-                freq = np.array(_read_block(self.file, cur_dtype), dtype=float)
-
-                if self.load_data:
-                    # Reading intensity and time values for S/SP in the current sweep
-                    Vspal, Tspal = self._read_data_block(4 * npalf * nspal)
-                    # Reading intensity and time values for Z in the current sweep
-                    Vzpal, Tzpal = self._read_data_block(4 * npalf * nzpal)
-
-                    # Get indices of S and SP channels
-                    index_s = (2 * np.arange(nspal / 2)).astype(int)
-                    index_sp = (2 * np.arange(nspal / 2) + 1).astype(int)
-
-                    # Reshape Vspal, Tspal, Vzpal, Tzpal into 2D arrays
-                    Vspal = Vspal.reshape((npalf, nspal)).T
-                    Vzpal = Vzpal.reshape((npalf, nzpal)).T
-                    Tspal = Tspal.reshape((npalf, nspal)).T
-                    Tzpal = Tzpal.reshape((npalf, nzpal)).T
-
-                    data_i = {
-                        "FREQ": np.tile(freq, (nzpal, 1)).T,
-                        "VST": Vspal,
-                        "VS": np.take(Vspal, index_s, axis=0),
-                        "VSP": np.take(Vspal, index_sp, axis=0),
-                        "VZ": Vzpal,  # .T works
-                        "TS": np.take(Tspal, index_s, axis=0),
-                        "TSP": np.take(Tspal, index_sp, axis=0),
-                        "TZ": Tzpal,  # .T works
-                    }
 
-                else:
-                    # Skip data section
-                    self.file.seek(8 * npalf * (nspal + nzpal), 1)
-                    data_i = None
-                # Reading number of octets in the current sweep
-                loctets2 = _read_sweep_length(self.file)
-                if loctets2 != loctets1:
-                    print("Error reading file!")
-                    return None
-            except EOFError:
-                print("End of file reached")
-                break
+        # Reading the sweep offsets and header parameters from the index
+        index = self.index
+        if index is None:
+            print("Error reading file!")
+            return None
+        header_dtype = self._header_dtype
+        headers = index[list(header_dtype.names)]
+        buffer = self.buffer
+
+        for offset, header_i in zip(
+            index["offset"] + header_dtype.itemsize, _records_to_dicts(headers)
+        ):
+            npalf = header_i["NPALIF"]
+            nspal = header_i["NSPALF"]
+            nzpal = header_i["NZPALF"]
+
+            # Frequency list (kHz) in the current sweep
+            freq = _read_array(buffer, offset, npalf).astype(float)
+
+            if self.load_data:
+                # Intensity and time values for S/SP and Z in the current sweep,
+                # reshaped into 2D arrays (views on the file buffer)
+                offset += 4 * npalf
+                Vspal = _read_array(buffer, offset, npalf * nspal)
+                offset += 4 * npalf * nspal
+                Tspal = _read_array(buffer, offset, npalf * nspal)
+                offset += 4 * npalf * nspal
+                Vzpal = _read_array(buffer, offset, npalf * nzpal)
+                offset += 4 * npalf * nzpal
+                Tzpal = _read_array(buffer, offset, npalf * nzpal)
+
+                Vspal = Vspal.reshape((npalf, nspal)).T
+                Vzpal = Vzpal.reshape((npalf, nzpal)).T
+                Tspal = Tspal.reshape((npalf, nspal)).T
+                Tzpal = Tzpal.reshape((npalf, nzpal)).T
+
+                # S and SP channels are interleaved
+                data_i = {
+                    "FREQ": np.broadcast_to(freq[:, None], (npalf, nzpal)),
+                    "VST": Vspal,
+                    "VS": Vspal[0::2],
+                    "VSP": Vspal[1::2],
+                    "VZ": Vzpal,  # .T works
+                    "TS": Tspal[0::2],
+                    "TSP": Tspal[1::2],
+                    "TZ": Tzpal,  # .T works
+                }
             else:
-                data.append({"hdr": header_i, "dat": data_i})
-                nsweep += 1
+                data_i = None
+
+            data.append({"hdr": header_i, "dat": data_i})
 
-        self._nsweep = nsweep
         return data
 
     @property
@@ -208,52 +243,76 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
         return self._max_sweep_length
 
     @property
-    def times(self):
-        if self._times is None:
-            times = Time([], format="jd")
-            for s in self.sweeps:
-                header = s.header
+    def _layout(self):
+        """Layout of the sweeps in the (frequency, time) grids of `as_xarray`, computed once.
+
+        A sweep measures each frequency up to `sweep_degen_level` times (its degeneracy), every
+        `sub_sweep_len` frequencies, so that it spans `sweep_degen_level * NZPALF` times. The
+        layout is a dict of arrays:
+
+        - "sweep", "delta_times": the sweep and the time (in seconds, from the sweep start) of
+          each column of the grids,
+        - "row", "col": the row (frequency) and column (time) of each value of the sweeps, in
+          the order of `data[key].T.flatten()` for each sweep,
+        - "present": for each frequency and sweep, whether the frequency is measured.
+        """
+        if self._layout_ is None:
+            freq_ref = self.frequencies[0].value
+            col_start = 0
+            sweep, delta_times, row, col, present = [], [], [], [], []
+            for i, s in enumerate(self._data):
+                header = s["hdr"]
                 nzpalf = header["NZPALF"]
                 nspalf = header["NSPALF"]
                 if nspalf != nzpalf * 2:
                     print(
                         "WARNING: Wind data has unexpected dimensions, process might fail."
                     )
-                sweep_degen_level = 0
-                sweep_freqs = s.data["FREQ"][:, 0]  # Freqs in the current sweep
-                sweep_freq_list = np.sort(list(set(sweep_freqs)))  # unique freqs
-                index = []
-                for i in range(len(sweep_freq_list)):
-                    index = np.append(
-                        index, int(np.count_nonzero(sweep_freqs == sweep_freq_list[i]))
-                    )
+                sweep_freqs = s["dat"]["FREQ"][:, 0]  # Freqs in the current sweep
+                sweep_freq_list, freq_degen = np.unique(sweep_freqs, return_counts=True)
                 sweep_degen_level = int(
-                    np.max(index)
+                    np.max(freq_degen)
                 )  # max number of time a freq is measured
                 sub_sweep_len = int(
                     header["NPALIF"] // sweep_degen_level
                 )  # time between measuring the same freq
 
-                dts = s.data["TS"]
-                dtsp = s.data["TSP"]
-                dtz = s.data["TZ"]
                 dtmin = np.min(
-                    [dts.T.flatten(), dtsp.T.flatten(), dtz.T.flatten()], axis=0
-                )
-
-                tsweep = Time(
-                    f"{header['CALEND_DATE_YEAR']}-{header['CALEND_DATE_MONTH']}-"
-                    f"{header['CALEND_DATE_DAY']} {header['CALEND_DATE_HOUR']}:"
-                    f"{header['CALEND_DATE_MINUTE']}:{header['CALEND_DATE_SECOND']}"
+                    [s["dat"][key].T.flatten() for key in ["TS", "TSP", "TZ"]], axis=0
+                ).reshape(-1, nzpalf)
+                n_col = sweep_degen_level * nzpalf
+                sweep.append(np.full(n_col, i))
+                delta_times.append(dtmin[::sub_sweep_len][:sweep_degen_level].flatten())
+                row.append(np.repeat(freq_ref.searchsorted(sweep_freqs), nzpalf))
+                col.append(
+                    col_start
+                    + (
+                        (np.arange(len(sweep_freqs)) // sub_sweep_len)[:, None] * nzpalf
+                        + np.arange(nzpalf)
+                    ).flatten()
                 )
+                present.append(np.isin(freq_ref, sweep_freq_list))
+                col_start += n_col
+
+            self._layout_ = {
+                "sweep": np.concatenate(sweep),
+                "delta_times": np.concatenate(delta_times),
+                "row": np.concatenate(row),
+                "col": np.concatenate(col),
+                "present": np.stack(present, axis=1),
+            }
+        return self._layout_
 
-                for i in range(sweep_degen_level):
-                    loc = i * sub_sweep_len * nzpalf
-                    times = np.append(
-                        times,
-                        tsweep + TimeDelta(dtmin[loc : loc + nzpalf], format="sec"),
-                    )
-            self._times = Time(times)
+    @property
+    def times(self):
+        if self._times is None:
+            # sweep start times (decoded in the index), then times of the grid columns
+            layout = self._layout
+            sweep_times = Time(self.index["time"])
+            self._times = sweep_times[layout["sweep"]] + TimeDelta(
+                layout["delta_times"], format="sec"
+            )
+            self._times.format = "iso"
         return self._times
 
     @property
@@ -277,16 +336,10 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
     @property
     def frequencies(self):
         if self._frequencies is None:
-            self._frequencies = []
-            raw_frequencies = []
-            for s in self.sweeps:
-                raw_frequencies.append(s.data["FREQ"] * Unit("kHz"))
-                for f in s.data["FREQ"][:, 0]:
-                    if f not in self._frequencies:
-                        self._frequencies.append(f)
-            self._frequencies = np.array(
-                list(np.sort(list(self._frequencies)))
-            )  # * Unit("kHz")[...] # return the unique freq list
+            # return the unique freq list
+            self._frequencies = np.unique(
+                np.concatenate([s["dat"]["FREQ"][:, 0] for s in self._data])
+            )
             self._frequencies = [self._frequencies[...] * Unit("kHz")]
         return self._frequencies
 
@@ -304,10 +357,8 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
     def as_xarray(self, replicate=True, tmp_out=False):
         import xarray
 
-        fields = self.fields
-        units = self.units
-        fields.append("MODE")
-        units.append("#")
+        fields = self.fields + ["MODE"]
+        units = self.units + ["#"]
         if False:
             fields.append("FREQ_DEGEN")
             units.append("#")
@@ -356,123 +407,57 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
 
         else:
             # Final data reorganisation from tmp to final
+            layout = self._layout
+            row, col = layout["row"], layout["col"]
+            shape = (len(self.frequencies[0]), len(layout["sweep"]))
+            # frequencies measured in the sweep of each column
+            present = layout["present"][:, layout["sweep"]]
+            # start of the sweep of each column
+            col_start = np.flatnonzero(np.diff(layout["sweep"], prepend=-1))
+            col_start = col_start[layout["sweep"]]
+
+            if replicate:
+                # replace all NaN by the last previous value: the last measurement in the
+                # sweep, or the last value of the previous sweep (if the frequency is not
+                # measured yet in the sweep)
+                measured = np.zeros(shape, dtype=bool)
+                measured[row, col] = True
+                last = np.maximum.accumulate(
+                    np.where(measured, np.arange(shape[1]), col_start - 1), axis=1
+                )
+                fill = present & ~measured
+                fill_in_sweep = np.nonzero(fill & (last >= col_start))
+                fill_from_previous = np.nonzero(
+                    fill & (last < col_start) & (col_start > 0)
+                )
+
             data_reorg = {}
             for dataset_key in fields:
-                data_reorg[dataset_key] = np.full(
-                    (np.shape(self.frequencies[0])[0], len(self.times)), np.nan
-                )
-            sweep_loc = 0
-            freq_ref = self.frequencies[0].value[...]
-            for s in self.sweeps:
-                header = s.header
-                nzpalf = header["NZPALF"]
-                nspalf = header["NSPALF"]
-                if nspalf != nzpalf * 2:
-                    print(
-                        "WARNING: Wind data has unexpected dimensions, process might fail."
-                    )
-                sweep_degen_level = 0
-                sweep_freqs = s.data["FREQ"][:, 0]  # Freqs in the current sweep
-                sweep_freq_list = np.sort(list(set(sweep_freqs)))  # unique freqs
-                freq_degen = []
-                freq_loc = {}
-                for i in range(len(sweep_freq_list)):
-                    freq_degen = np.append(
-                        freq_degen,
-                        int(np.count_nonzero(sweep_freqs == sweep_freq_list[i])),
-                    )
-                    freq_loc[sweep_freq_list[i]] = np.where(
-                        sweep_freqs == sweep_freq_list[i]
+                if dataset_key == "MODE":
+                    values = np.concatenate(
+                        [
+                            np.full(s["dat"]["TS"].size, int(s["hdr"]["MODE"]))
+                            for s in self._data
+                        ]
                     )
-                sweep_degen_level = int(
-                    np.max(freq_degen)
-                )  # max number of time a freq is measured
-                sub_sweep_len = int(
-                    header["NPALIF"] // sweep_degen_level
-                )  # time between measuring the same freq
-                sweep_degen_frac = np.array(sweep_degen_level // freq_degen, dtype=int)
-
-                dts = s.data["TS"]
-                dtsp = s.data["TSP"]
-                dtz = s.data["TZ"]
-                dtmin = np.min(
-                    [dts.T.flatten(), dtsp.T.flatten(), dtz.T.flatten()], axis=0
-                )
-                t_out_min = sweep_loc
-                t_out_max = sweep_loc + sweep_degen_level * nzpalf
-                delta_times = []
-
-                for i in range(sweep_degen_level):
-                    loc = i * sub_sweep_len * nzpalf
-                    delta_times = np.append(
-                        delta_times,
-                        dtmin[loc : loc + nzpalf],
+                else:
+                    values = np.concatenate(
+                        [s["dat"][dataset_key].T.flatten() for s in self._data]
                     )
-                for i in range(len(sweep_freq_list)):
-                    freq_out = int(np.where(sweep_freq_list[i] == freq_ref)[0][0])
-                    freq = sweep_freq_list[i]
-                    freq_in = []
-                    time_out_final = np.arange(t_out_min, t_out_max, 1)
-                    if False:
-                        # Technically works, probably faster
-                        # but copy each subsweep as is and thus not the last measurement (full nzpalf vector is used)
-                        freq_in = (
-                            np.tile(
-                                freq_loc[freq], (sweep_degen_frac[i], 1)
-                            ).T.flatten(),
-                        )
-                        time_out = time_out_final
-                    else:
-                        freq_in = freq_loc[freq]
-                        nztab = np.tile(
-                            np.arange(0, nzpalf, 1), (len(freq_loc[freq][0]), 1)
-                        )
-                        time_out = np.tile(
-                            np.array(freq_loc[freq]) // sub_sweep_len * nzpalf,
-                            (nzpalf, 1),
-                        ).T
-                        time_out = (time_out + nztab + t_out_min).flatten()
-                    if replicate:
-                        # replace all NaN by the last previous value
-                        nan_mask = np.in1d(time_out_final, time_out)
-                        nan_loc = time_out_final[np.where(~nan_mask)[0]]
-                        replace_loc = np.copy(nan_loc)
-                        for k in range(len(replace_loc)):
-                            replace_loc[k] = (
-                                time_out.searchsorted(replace_loc[k], "right") - 1
-                            )
-                        if sweep_loc == 0:
-                            replace_loc = replace_loc[np.where(replace_loc > 0)]
-                            nan_loc = nan_loc[np.where(replace_loc > 0)]
-                        replace_loc = np.append(time_out, [np.min(time_out_final) - 1])[
-                            replace_loc
-                        ]
-                    for dataset_key in fields:
-                        if dataset_key == "MODE":
-                            d = np.full(np.shape(dts), np.nan)
-                            d[:] = int(header["MODE"])
-                        elif dataset_key == "FREQ_DEGEN":
-                            d = np.full(np.shape(dts), np.nan)
-                            d[:] = int(sweep_degen_frac[i])
-                        elif dataset_key == "FREQ":
-                            d = np.full(np.shape(dts), np.nan)
-                            d[:] = freq
-                        else:
-                            d = s.data[dataset_key]
-                        data_reorg[dataset_key][freq_out, time_out] = d[
-                            :, freq_in
-                        ].T.flatten()
-                        if replicate:
-                            # replace all NaN by the last previous value
-                            data_reorg[dataset_key][freq_out, nan_loc] = data_reorg[
-                                dataset_key
-                            ][freq_out, replace_loc]
-                        if dataset_key in ["TS", "TSP", "TZ"]:
-                            data_reorg[dataset_key][
-                                freq_out, time_out_final
-                            ] -= delta_times
-                sweep_loc += sweep_degen_level * nzpalf
-
+                data = np.full(shape, np.nan)
+                data[row, col] = values
+                if replicate:
+                    data[fill_in_sweep] = data[fill_in_sweep[0], last[fill_in_sweep]]
+                if dataset_key in ["TS", "TSP", "TZ"]:
+                    data -= np.where(present, layout["delta_times"], 0)
+                if replicate:
+                    i, j = fill_from_previous
+                    data[i, j] = data[i, col_start[j] - 1]
+                    if dataset_key in ["TS", "TSP", "TZ"]:
+                        data[i, j] -= layout["delta_times"][j]
+                data_reorg[dataset_key] = data
+
+            times = self.times.to_datetime()
             datasets = {}
             for dataset_key, dataset_unit in zip(fields, units):
                 data_arr = data_reorg[dataset_key]
@@ -482,7 +467,7 @@ class WindWavesL2BinData(VariableFrequencies, BinData, dataset="cdpp_wi_wa_l2"):
                     name=dataset_key,
                     coords=[
                         ("frequency", self.frequencies[0].value, {"units": "kHz"}),
-                        ("time", self.times.to_datetime(), {}),
+                        ("time", times, {}),
                     ],
                     attrs={"units": dataset_unit},
                     dims=("frequency", "time"),
@@ -583,14 +568,35 @@ class WindWavesTnrL3Bqt1mnBinData(
 
     _iter_record_class = WindWavesTnrL3Bqt1mnRecords
 
+    # UR8_TIME [Real, 64 bits] = Days since 1982/01/01 (=0)
+    _header_dtype = _struct_to_dtype(
+        _merge_dtype((CCSDS_CDS_FIELDS[1], ">d")), CCSDS_CDS_FIELDS[0] + ["UR8_TIME"]
+    )
+
     def __init__(
         self,
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "records",
         load_data: bool = True,
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
     ) -> None:
-        super().__init__(filepath, dataset, access_mode, load_data)
+        super().__init__(
+            filepath,
+            dataset,
+            access_mode,
+            load_data,
+            memory_map=memory_map,
+            index_cache=index_cache,
+        )
+
+    def _build_index(self):
+        def ur8_to_datetime64(headers):
+            millisec = np.round(headers["UR8_TIME"] * 86400000).astype("i8")
+            return np.datetime64("1982-01-01", "ms") + millisec.astype("m8[ms]")
+
+        return _index_records(self.buffer, self._header_dtype, ur8_to_datetime64)
 
 
 class WindWavesTnrL3NnBinData(BinData, dataset="cdpp_wi_wa_tnr_l3_nn"):  # type: ignore
@@ -603,89 +609,78 @@ class WindWavesL260sV1BinData(BinData, dataset="cdpp_wi_wa___l2_60s_v1"):  # typ
     """Class for `cdpp_wi_wa_rad1_l2_60s_v1` binary data"""
 
     _iter_sweep_class = WindWaves60sSweeps
+    _header_dtype = _L2_60S_HEADER_DTYPE
 
     def __init__(
         self,
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "sweeps",
+        memory_map: bool = False,
+        index_cache: Union[None, bool, str, Path] = None,
     ):
-        super().__init__(filepath, dataset, access_mode, fixed_frequencies=False)
-        self._data = None
-        self._nsweep = None
+        super().__init__(
+            filepath,
+            dataset,
+            access_mode,
+            fixed_frequencies=False,
+            memory_map=memory_map,
+            index_cache=index_cache,
+        )
+        self._data_ = None
         self.__max_sweep_length = None
-        self._data = self._loader()
 
-    def _loader(self):
-        data = []
+    @property
+    def _data(self):
+        """The headers and data of the sweeps, decoded when first used."""
+        if self._data_ is None:
+            self._data_ = self._loader()
+        return self._data_
 
-        ccsds_fields, ccsds_dtype = CCSDS_CDS_FIELDS
+    @property
+    def _nsweep(self):
+        return len(self._data)
 
-        caldate_fields, caldate_dtype = CALDATE_FIELDS
+    def _build_index(self):
+        return _index_records(self.buffer, self._header_dtype, _caldate_to_datetime64)
 
-        header_fields = (
-            ccsds_fields
-            + ["RECEIVER_CODE", "JULIAN_SEC"]
-            + caldate_fields
-            + ["AVG_DURATION", "IUNIT", "NFREQ"]
-        )
-
-        # RECEIVER_CODE [Int, 16 bits] = Name of Receiver: 0=TNR; 1=RAD1; 2=RAD2
-        # JULIAN_SEC [Int, 32 bits] = Julian date of the middle of the 60-second interval (in seconds since 1950/01/01)
+    def _loader(self):
+        data = []
 
         orbit_fields, orbit_dtype = ORBIT_FIELDS
-
-        header_dtype = _merge_dtype((ccsds_dtype, ">hi", caldate_dtype, ">hhh"))
-
-        nsweep = 0
-
-        while True:
-            try:
-                # Reading number of octets in the current sweep
-                loctets1 = _read_sweep_length(self.file)
-                if loctets1 is None:
-                    break
-
-                # Reading header parameters in the current sweep
-                header_i = _read_block(self.file, header_dtype, header_fields)
-                nfreq = header_i["NFREQ"]
-
-                if self.load_data:
-                    # Reading orbit data for current sweep
-                    orbit = _read_block(self.file, orbit_dtype, orbit_fields)
-
-                    # Reading frequency list in the current sweep
-                    cur_dtype = ">" + "f" * nfreq
-                    freq = _read_block(self.file, cur_dtype)
-
-                    # Reading frequency list in the current sweep
-                    intensity = _read_block(self.file, cur_dtype)
-
-                    data_i = {
-                        "FREQ": freq,
-                        "INTENSITY": intensity,
-                        "ORBIT": orbit,
-                    }
-                else:
-                    # Skip data section
-                    self.file.seek(12 + 8 * nfreq, 1)
-                    data_i = None
-
-                # Reading number of octets in the current sweep
-                loctets2 = _read_sweep_length(self.file)
-                if loctets2 != loctets1:
-                    print("Error reading file!")
-                    return None
-
-            except EOFError:
-                print("End of file reached")
-                break
-
+        orbit_dtype = _struct_to_dtype(orbit_dtype, orbit_fields)
+
+        # Reading the sweep offsets and header parameters from the index
+        index = self.index
+        if index is None:
+            print("Error reading file!")
+            return None
+        header_dtype = self._header_dtype
+        headers = index[list(header_dtype.names)]
+        buffer = self.buffer
+
+        # Reading orbit data of all sweeps at once
+        offsets = index["offset"] + header_dtype.itemsize
+        if self.load_data:
+            orbits = _records_to_dicts(_read_headers(buffer, offsets, orbit_dtype))
+            offsets = offsets + orbit_dtype.itemsize
+
+        for i, header_i in enumerate(_records_to_dicts(headers)):
+            nfreq = header_i["NFREQ"]
+
+            if self.load_data:
+                data_i = {
+                    # Frequency list in the current sweep
+                    "FREQ": _read_array(buffer, offsets[i], nfreq),
+                    # Intensity in the current sweep
+                    "INTENSITY": _read_array(buffer, offsets[i] + 4 * nfreq, nfreq),
+                    "ORBIT": orbits[i],
+                }
             else:
-                data.append({"hdr": header_i, "dat": data_i})
-                nsweep += 1
+                data_i = None
+
+            data.append({"hdr": header_i, "dat": data_i})
 
-        self._nsweep = nsweep
         return data
 
 
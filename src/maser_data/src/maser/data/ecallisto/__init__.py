@@ -22,6 +22,14 @@ Classes for e-Callisto datasets.
 
 """
 
-from .data import (  # noqa: F401
-    ECallistoFitsData,
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".data": [
+        "ECallistoFitsData",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
@@ -19,17 +19,16 @@ class ECallistoFitsData(FitsData, dataset="ecallisto"):  # type: ignore
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = f[1].data["TIME"][0] * Unit("s") + Time(
-                    f"{f[0].header['DATE-OBS'].replace('/', '-')} {f[0].header['TIME-OBS']}"
-                )
+            header = self.file[0].header
+            self._times = self._variable(1, "TIME")[0] * Unit("s") + Time(
+                f"{header['DATE-OBS'].replace('/', '-')} {header['TIME-OBS']}"
+            )
         return self._times
 
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as f:
-                self._frequencies = f[1].data["FREQUENCY"][0] * Unit("MHz")
+            self._frequencies = self._variable(1, "FREQUENCY")[0] * Unit("MHz")
         return self._frequencies
 
     @property
@@ -41,7 +40,7 @@ class ECallistoFitsData(FitsData, dataset="ecallisto"):  # type: ignore
 
         dataset = {}
         dataset["Flux Density"] = xarray.DataArray(
-            data=self.file[0].data,
+            data=self._variable(0),
             name="Flux Density",
             coords=[
                 ("frequency", self.frequencies.value, {"units": self.frequencies.unit}),
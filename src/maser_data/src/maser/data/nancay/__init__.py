@@ -31,13 +31,21 @@ distributed by CDN (Centre de Données de Nançay).
 
 """
 
-from .nda import (  # noqa: F401
-    OrnNdaRoutineJupEdrCdfData,
-    OrnNdaRoutineSunEdrCdfData,
-    OrnNdaNewRoutineJupEdrFitsData,
-    OrnNdaNewRoutineSunEdrFitsData,
-    OrnNdaNewRoutineTransitEdrFitsData,
-)
-from .nenufar import (  # noqa: F401
-    OrnNenufarBstFitsData,
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".nda": [
+        "OrnNdaRoutineJupEdrCdfData",
+        "OrnNdaRoutineSunEdrCdfData",
+        "OrnNdaNewRoutineJupEdrFitsData",
+        "OrnNdaNewRoutineSunEdrFitsData",
+        "OrnNdaNewRoutineTransitEdrFitsData",
+    ],
+    ".nenufar": [
+        "OrnNenufarBstFitsData",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
@@ -10,9 +10,26 @@ from typing import Union, List
 from pathlib import Path
 from astropy.time import Time
 from astropy.units import Unit
+import numpy
 
 
-class OrnNdaRoutineEdrCdfData(CdfData, dataset="orn_nda_routine_edr"):  # type: ignore
+class OrnNdaFrequencyRangeMixin:
+    """Mixin class to select the frequency channels of NDA data within a frequency range."""
+
+    def _channel_slice(self, freq_range) -> slice:
+        """Get the slice of the frequency channels spanning `freq_range`."""
+        fmin, fmax = self._parse_freq_range(freq_range, self.frequencies.unit)
+        channels = numpy.flatnonzero(
+            self._range_mask(self.frequencies.value, fmin, fmax)
+        )
+        if len(channels) == 0:
+            return slice(0, 0)
+        return slice(int(channels[0]), int(channels[-1]) + 1)
+
+
+class OrnNdaRoutineEdrCdfData(
+    OrnNdaFrequencyRangeMixin, CdfData, dataset="orn_nda_routine_edr"
+):  # type: ignore
     """ORN NDA Routine Jupiter dataset"""
 
     _iter_sweep_class = OrnNdaRoutineEdrSweeps
@@ -22,41 +39,45 @@ class OrnNdaRoutineEdrCdfData(CdfData, dataset="orn_nda_routine_edr"):  # type:
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as f:
-                self._frequencies = f["Frequency"][...] * Unit(
-                    f["Frequency"].attrs["UNITS"]
-                )
+            self._frequencies = self._variable("Frequency") * Unit(
+                self.file["Frequency"].attrs["UNITS"]
+            )
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = Time(f["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
     def dataset_keys(self):
         return self._dataset_keys
 
-    def as_xarray(self):
+    def as_xarray(self, time_range=None, freq_range=None):
         import xarray
 
         dataset_keys = ["LL", "RR"]
         datasets = {}
 
+        # Only the records and frequency channels within the ranges are read
+        records = self._epoch_slice(time_range)
+        channels = self._channel_slice(freq_range)
+        times = Time(self._variable("Epoch", records))
+        frequencies = self.frequencies[channels]
+
         for dataset_key in dataset_keys:
             datasets[dataset_key] = xarray.DataArray(
-                data=self.file[dataset_key][...].T,
+                data=self._variable(dataset_key, records)[:, channels].T,
                 name=self.file[dataset_key].attrs["LABLAXIS"],
                 coords=[
                     (
                         "frequency",
-                        self.frequencies.value,
-                        {"units": self.frequencies.unit},
+                        frequencies.value,
+                        {"units": frequencies.unit},
                     ),
-                    ("time", self.times.to_datetime()),
+                    ("time", times.to_datetime()),
                 ],
                 dims=("frequency", "time"),
                 attrs={
@@ -64,7 +85,9 @@ class OrnNdaRoutineEdrCdfData(CdfData, dataset="orn_nda_routine_edr"):  # type:
                     "title": self.file[dataset_key].attrs["CATDESC"],
                 },
             )
-        return xarray.Dataset(data_vars=datasets)
+        return self._select_range(
+            xarray.Dataset(data_vars=datasets), freq_range=freq_range
+        )
 
     def quicklook(
         self,
@@ -95,7 +118,9 @@ class OrnNdaRoutineSunEdrCdfData(
     pass
 
 
-class OrnNdaNewRoutineEdrFitsData(FitsData, dataset="orn_nda_newroutine_edr"):  # type: ignore
+class OrnNdaNewRoutineEdrFitsData(
+    OrnNdaFrequencyRangeMixin, FitsData, dataset="orn_nda_newroutine_edr"
+):  # type: ignore
     """ORN NDA NewRoutine dataset"""
 
     _iter_sweep_class = OrnNdaNewRoutineEdrSweeps
@@ -114,16 +139,16 @@ class OrnNdaNewRoutineEdrFitsData(FitsData, dataset="orn_nda_newroutine_edr"):
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as f:
-                self._frequencies = f[1].data[0][0] * Unit(f[1].header["TUNIT1"])
+            self._frequencies = self._variable(1)[0][0] * Unit(
+                self.file[1].header["TUNIT1"]
+            )
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = Time(f[2].data["jd"], format="jd")
+            self._times = Time(self._variable(2, "jd"), format="jd")
         return self._times
 
     def epncore(self):
@@ -137,23 +162,34 @@ class OrnNdaNewRoutineEdrFitsData(FitsData, dataset="orn_nda_newroutine_edr"):
             self._dataset_keys = self.fields
         return self._dataset_keys
 
-    def as_xarray(self):
+    def as_xarray(self, time_range=None, freq_range=None):
         import xarray
 
         dataset_keys = self.fields
         datasets = {}
 
+        # Only the rows and frequency channels within the ranges are read
+        start, end = self._parse_time_range(time_range)
+        times = self.times.datetime64
+        rows = slice(
+            None if start is None else numpy.searchsorted(times, start, side="left"),
+            None if end is None else numpy.searchsorted(times, end, side="right"),
+        )
+        channels = self._channel_slice(freq_range)
+        times = self.times[rows]
+        frequencies = self.frequencies[channels]
+
         for i, dataset_key in enumerate(dataset_keys):
             datasets[dataset_key] = xarray.DataArray(
-                data=self.file[2].data["DATA"][:, :, i].T,
+                data=self._variable(2, "DATA")[rows, channels, i].T,
                 name=dataset_key,
                 coords=[
                     (
                         "frequency",
-                        self.frequencies.value,
-                        {"units": self.frequencies.unit},
+                        frequencies.value,
+                        {"units": frequencies.unit},
                     ),
-                    ("time", self.times.to_datetime()),
+                    ("time", times.to_datetime()),
                 ],
                 dims=("frequency", "time"),
                 attrs={
@@ -161,7 +197,9 @@ class OrnNdaNewRoutineEdrFitsData(FitsData, dataset="orn_nda_newroutine_edr"):
                     "title": f"{self.file[0].header['TITLE']} ({dataset_key} component)",
                 },
             )
-        return xarray.Dataset(data_vars=datasets)
+        return self._select_range(
+            xarray.Dataset(data_vars=datasets), freq_range=freq_range
+        )
 
 
 class OrnNdaNewRoutineSunEdrFitsData(
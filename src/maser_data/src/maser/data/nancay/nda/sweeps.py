@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from maser.data.base.sweeps import Sweeps, Sweep
 from astropy.time import Time
-from astropy.units import Unit
+import numpy
 
 
 class SrnNdaRoutineEdrSweep(Sweep):
@@ -12,22 +12,32 @@ class SrnNdaRoutineEdrSweep(Sweep):
 
 
 class OrnNdaRoutineEdrSweeps(Sweeps):
+    # number of sweeps read at once from the CDF file
+    chunk_size = 10000
+
     @property
     def generator(self):
-        for time, rr, ll, status, rr_t_offset in zip(
-            self.file["Epoch"],
-            self.file["RR"],
-            self.file["LL"],
-            self.file["STATUS"],
-            self.file["RR_SWEEP_TIME_OFFSET"],
-        ):
-            yield SrnNdaRoutineEdrSweep(
-                {"STATUS": status, "RR_TIME_OFFSET": rr_t_offset},
-                {"RR": rr, "LL": ll},
-                Time(time),
-                self.file["Frequency"][...]
-                * Unit(self.file["Frequency"].attrs["UNITS"]),
+        # the frequencies are the same for all the sweeps
+        frequencies = self.data_reference.frequencies
+        n_sweeps = len(self.file["Epoch"])
+        for start in range(0, n_sweeps, self.chunk_size):
+            records = slice(start, start + self.chunk_size)
+            times = Time(
+                numpy.array(self.file["Epoch"][records], dtype="datetime64[ns]")
             )
+            # (yield datetime-valued times, as Time(datetime) does)
+            times.format = "datetime"
+            rr = self.file["RR"][records]
+            ll = self.file["LL"][records]
+            status = self.file["STATUS"][records]
+            rr_t_offset = self.file["RR_SWEEP_TIME_OFFSET"][records]
+            for i in range(len(times)):
+                yield SrnNdaRoutineEdrSweep(
+                    {"STATUS": status[i], "RR_TIME_OFFSET": rr_t_offset[i]},
+                    {"RR": rr[i], "LL": ll[i]},
+                    times[i],
+                    frequencies,
+                )
 
 
 class OrnNdaNewRoutineEdrSweeps(Sweeps):
@@ -58,58 +58,71 @@ Classes for PADC datasets.
 
 """
 
-from .juno import (  # noqa: F401
-    JnoWavLesiaL3aV02Data,
-)
-
-from .cassini import (  # noqa: F401
-    CoRpwsHfrKronosN1Data,
-    CoRpwsHfrKronosN2Data,
-)
-from .stereo import (  # noqa: F401
-    StaWavLfrL2Bin,
-    StbWavLfrL2Bin,
-    StaWavHfrL2Bin,
-    StbWavHfrL2Bin,
-    StaWavLfrL3DfCdf,
-    StbWavLfrL3DfCdf,
-    StaWavHfrL3DfCdf,
-    StbWavHfrL3DfCdf,
-)
-
-from .expres import *  # noqa: F401, F403
-
-from .wind import (  # noqa: F401
-    WindWavesRad1L3AkrData,
-    WindWavesRad1L3DfV01Data,
-    WindWavesRad1L3DfV02Data,
-)
-
-from .bepi import (  # noqa: F401
-    SorbetL1CdfTnr,
-    SorbetL1CdfDbsc,
-)
-
-from .solo import (  # noqa: F401
-    RpwHfrSurv,
-    RpwTnrSurv,
-    RpwLfrSurvBp1,
-    RpwHfrL3Cdf,
-    RpwTnrL3Cdf,
-)
+from maser.data.base.registry import _dataset_manifest, _lazy_exports
 
-from .juice import (  # noqa: F401
-    JuiceRPWIhfL1aCdfSID2,
-    JuiceRPWIhfL1aCdfSID3,
-    JuiceRPWIhfL1aCdfSID4,
-    JuiceRPWIhfL1aCdfSID20,
-    JuiceRPWIhfL1aCdfSID5,
-    JuiceRPWIhfL1aCdfSID21,
-    JuiceRPWIhfL1aCdfSID6,
-    JuiceRPWIhfL1aCdfSID22,
-    JuiceRPWIhfL1aCdfSID7,
-    JuiceRPWIhfL1aCdfSID23,
-    JuiceRPWIhfL1bCdf,
+# the classes are only imported when they are used
+_exports = {
+    ".juno": [
+        "JnoWavLesiaL3aV02Data",
+    ],
+    ".cassini": [
+        "CoRpwsHfrKronosN1Data",
+        "CoRpwsHfrKronosN2Data",
+    ],
+    ".stereo": [
+        "StaWavLfrL2Bin",
+        "StbWavLfrL2Bin",
+        "StaWavHfrL2Bin",
+        "StbWavHfrL2Bin",
+        "StaWavLfrL3DfCdf",
+        "StbWavLfrL3DfCdf",
+        "StaWavHfrL3DfCdf",
+        "StbWavHfrL3DfCdf",
+    ],
+    ".wind": [
+        "WindWavesRad1L3AkrData",
+        "WindWavesRad1L3DfV01Data",
+        "WindWavesRad1L3DfV02Data",
+    ],
+    ".bepi": [
+        "SorbetL1CdfTnr",
+        "SorbetL1CdfDbsc",
+    ],
+    ".solo": [
+        "RpwHfrSurv",
+        "RpwTnrSurv",
+        "RpwLfrSurvBp1",
+        "RpwHfrL3Cdf",
+        "RpwTnrL3Cdf",
+    ],
+    ".juice": [
+        "JuiceRPWIhfL1aCdfSID2",
+        "JuiceRPWIhfL1aCdfSID3",
+        "JuiceRPWIhfL1aCdfSID4",
+        "JuiceRPWIhfL1aCdfSID20",
+        "JuiceRPWIhfL1aCdfSID5",
+        "JuiceRPWIhfL1aCdfSID21",
+        "JuiceRPWIhfL1aCdfSID6",
+        "JuiceRPWIhfL1aCdfSID22",
+        "JuiceRPWIhfL1aCdfSID7",
+        "JuiceRPWIhfL1aCdfSID23",
+        "JuiceRPWIhfL1bCdf",
+    ],
+    # (including the ExpresCdfData subclasses created in the expres subpackage)
+    ".expres": [
+        "ExpresCdfData",
+        "observer_list",
+        "magnetic_field_models",
+        "source_list",
+    ]
+    + [
+        path.split(":")[1]
+        for path in _dataset_manifest().values()
+        if path.startswith(f"{__name__}.expres:")
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
 
 # from .bepi.sorbet import SorbetCdfData  # noqa: F401
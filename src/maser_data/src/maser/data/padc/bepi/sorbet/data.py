@@ -22,17 +22,15 @@ class SorbetL1CdfData(CdfData, dataset="mmo_pwi_sorbet_l1_"):  # type: ignore
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = Time(f["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as f:
-                self._frequencies = f["Frequency"][...] * Unit(
-                    f["Frequency"].attrs["UNITS"]
-                )
+            self._frequencies = self._variable("Frequency") * Unit(
+                self.file["Frequency"].attrs["UNITS"]
+            )
         return self._frequencies
 
     @property
@@ -47,7 +45,7 @@ class SorbetL1CdfData(CdfData, dataset="mmo_pwi_sorbet_l1_"):  # type: ignore
 
         for dataset_key in dataset_keys:
             datasets[dataset_key] = xarray.DataArray(
-                data=self.file[dataset_key][...].T,
+                data=self._variable(dataset_key).T,
                 name=self.file[dataset_key].attrs["LABLAXIS"],
                 coords=[
                     (
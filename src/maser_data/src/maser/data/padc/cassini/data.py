@@ -7,8 +7,9 @@ Classes for Cassini datasets.
 from typing import Iterable, Union, List, Any
 
 from maser.data.base import Data, BinData, Sweeps, Records, VariableFrequencies
+from maser.data.base.base import _datetime64_to_time
 from maser.data.base.sweeps import Sweep
-from .kronos import fi_freq, ti_datetime, t97_datetime
+from .kronos import fi_freq_array, ti_datetime64, t97_datetime64
 
 from astropy.units import Unit
 from astropy.time import Time
@@ -77,6 +78,7 @@ class CoRpwsHfrKronosData(VariableFrequencies, BinData, dataset="co_rpws_hfr_kro
         self._levels = None
         self._data = self.read_data_binary()
         self._nrecord = len(self._data)
+        self._sweep_bounds = None
         self._nsweep = len(self.sweep_masks)
         self._depend_datasets: Iterable[str] = []
         self.fields = self._format["vars"].keys()
@@ -139,43 +141,72 @@ class CoRpwsHfrKronosData(VariableFrequencies, BinData, dataset="co_rpws_hfr_kro
         )
         return data
 
+    def _sweep_times(self):
+        """Get the raw time variable (one value per record) used to split the sweeps."""
+        if self.level == "n1":
+            # If level=n1: time is encoded in 'ti' (time index)
+            return self._data["ti"]
+        elif self.level == "n2":
+            # If level=n1: time is provided in 't97' (days of 1997; t97=1 <=> 1997-01-01)
+            return self._data["t97"]
+        else:
+            # for upper data levels, use n2['t97'] and filter with data['num'] indices
+            return (self.levels("n2")._data["t97"])[self._data["num"]]
+
+    @property
+    def sweep_bounds(self):
+        """Start and stop record indices of the sweeps (a sweep is a run of consecutive
+        records with the same time)."""
+        if self._sweep_bounds is None:
+            tvar = numpy.asarray(self._sweep_times())
+            starts = numpy.flatnonzero(tvar[1:] != tvar[:-1]) + 1
+            if len(tvar) > 0:
+                starts = numpy.concatenate([[0], starts])
+            stops = numpy.append(starts[1:], len(tvar))
+            self._sweep_bounds = (starts, stops)
+        return self._sweep_bounds
+
     @property
     def sweep_masks(self):
+        """List of the slices of the records of each sweep (to be applied on `self._data`)."""
         if self._sweep_masks is None:
-            if self.level == "n1":
-                # If level=n1: time is encoded in 'ti' (time index)
-                tvar = self._data["ti"]
-            elif self.level == "n2":
-                # If level=n1: time is provided in 't97' (days of 1997; t97=1 <=> 1997-01-01)
-                tvar = self._data["t97"]
-            else:
-                # for upper data levels, use n2['t97'] and filter with data['num'] indices
-                tvar = (self.levels("n2")._data["t97"])[self._data["num"]]
-            sweep_masks = []
-            t_values = numpy.unique(tvar)
-            for t in t_values:
-                sweep_masks.append(tvar == t)
-            self._sweep_masks = sweep_masks
+            self._sweep_masks = [
+                slice(start, stop) for start, stop in zip(*self.sweep_bounds)
+            ]
         return self._sweep_masks
 
     @property
     def sweep_mode_masks(self):
         if self._sweep_mode_masks is None:
-            sweep_mode_masks = []
-            mode_hashes = numpy.array(
-                [hash(item.to_string()) for item in self.frequencies]
+            # numeric signature of the sweeps: their length and their frequencies (padded
+            # with zeros), so that the sweeps with the same frequencies are grouped together
+            if self._frequencies_ is None:
+                self._frequencies_ = self._decode_frequencies()
+            starts, stops = self.sweep_bounds
+            lengths = stops - starts
+            sweep_index = numpy.repeat(numpy.arange(self._nsweep), lengths)
+            signatures = numpy.zeros((self._nsweep, self.max_sweep_length + 1))
+            signatures[:, 0] = lengths
+            signatures[
+                sweep_index,
+                1 + numpy.arange(self._nrecord) - numpy.repeat(starts, lengths),
+            ] = self._frequencies_.to_value("kHz")
+            # (the rows are compared as raw bytes, which is much faster than axis=0)
+            _, sweep_modes = numpy.unique(
+                signatures.view(numpy.dtype((numpy.void, signatures.shape[1] * 8))),
+                return_inverse=True,
             )
-            for mode_hash in numpy.unique(mode_hashes):
-                sweep_mode_masks.append(mode_hashes == mode_hash)
-            self._sweep_mode_masks = sweep_mode_masks
+            sweep_modes = sweep_modes.reshape(-1)
+            self._sweep_mode_masks = [
+                sweep_modes == mode for mode in range(sweep_modes.max(initial=-1) + 1)
+            ]
         return self._sweep_mode_masks
 
     @property
     def max_sweep_length(self):
         if self._max_sweep_length is None:
-            self._max_sweep_length = numpy.max(
-                [numpy.count_nonzero(mask) for mask in self.sweep_masks]
-            )
+            starts, stops = self.sweep_bounds
+            self._max_sweep_length = int(numpy.max(stops - starts, initial=0))
         return self._max_sweep_length
 
     def __len__(self):
@@ -186,18 +217,18 @@ class CoRpwsHfrKronosData(VariableFrequencies, BinData, dataset="co_rpws_hfr_kro
         else:
             return int(self.file_size.value)
 
-    def _decode_times(self) -> Time:  # pragma: no cover
+    def _decode_times(self, index=slice(None)) -> Time:  # pragma: no cover
         pass
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            times = self._decode_times()
             if self.access_mode == "records":
-                self._times = times
+                self._times = self._decode_times()
             elif self.access_mode == "sweeps":
-                self._times = Time([times[mask][0] for mask in self.sweep_masks])
+                # only the times of the first record of the sweeps are decoded
+                self._times = self._decode_times(self.sweep_bounds[0])
         return self._times
 
     def _decode_frequencies(self) -> numpy.typing.NDArray[Any]:  # pragma: no cover
@@ -249,19 +280,18 @@ class CoRpwsHfrKronosData(VariableFrequencies, BinData, dataset="co_rpws_hfr_kro
 
 
 class CoRpwsHfrKronosN1Data(CoRpwsHfrKronosData, dataset="co_rpws_hfr_kronos_n1"):  # type: ignore
-    def _decode_times(self) -> Time:
-        return Time(
-            list(
-                map(
-                    ti_datetime,
-                    self._data["ti"],  # time index (YYDDDSSSSS) with YY = YYYY - 1996
-                    self._data["c"],  # centiseconds
-                )
+    def _decode_times(self, index=slice(None)) -> Time:
+        return _datetime64_to_time(
+            ti_datetime64(
+                self._data["ti"][
+                    index
+                ],  # time index (YYDDDSSSSS) with YY = YYYY - 1996
+                self._data["c"][index],  # centiseconds
             )
         )
 
     def _decode_frequencies(self):
-        return numpy.array(list(map(fi_freq, self._data["fi"]))) * Unit("kHz")
+        return fi_freq_array(self._data["fi"]) * Unit("kHz")
 
     def quicklook(
         self,
@@ -293,8 +323,8 @@ class CoRpwsHfrKronosN1Data(CoRpwsHfrKronosData, dataset="co_rpws_hfr_kronos_n1"
 
 
 class CoRpwsHfrKronosN2Data(CoRpwsHfrKronosData, dataset="co_rpws_hfr_kronos_n2"):  # type: ignore
-    def _decode_times(self) -> Time:
-        return Time(list(map(t97_datetime, self._data["t97"])))
+    def _decode_times(self, index=slice(None)) -> Time:
+        return _datetime64_to_time(t97_datetime64(self._data["t97"][index]))
 
     def _decode_frequencies(self):
         return self._data["f"] * Unit("kHz")
@@ -330,9 +360,9 @@ class CoRpwsHfrKronosN2Data(CoRpwsHfrKronosData, dataset="co_rpws_hfr_kronos_n2"
 
 
 class CoRpwsHfrKronosN3Data(CoRpwsHfrKronosData, dataset="co_rpws_hfr_kronos_n3"):  # type: ignore
-    def _decode_times(self) -> Time:
-        return Time(
-            list(map(t97_datetime, (self.levels("n2")._data["t97"])[self._data["num"]]))
+    def _decode_times(self, index=slice(None)) -> Time:
+        return _datetime64_to_time(
+            t97_datetime64((self.levels("n2")._data["t97"])[self._data["num"][index]])
         )
 
     def _decode_frequencies(self):
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 import datetime
+from functools import lru_cache
 from typing import Union
 
+import numpy
+import numpy.typing
+
 
 def freq_abc(nfilt):
     if nfilt == 8:
@@ -197,6 +201,30 @@ def fi_freq(fi: int) -> float:
         return (fi_ccc + (2 * fi_nn - fi_ff + 1) / (2 * fi_ff)) * 25
 
 
+@lru_cache(maxsize=None)
+def _freq_abc_table(nfilt: int) -> numpy.typing.NDArray[numpy.float64]:
+    return numpy.array(freq_abc(nfilt))
+
+
+def fi_freq_array(fi: numpy.typing.ArrayLike) -> numpy.typing.NDArray[numpy.float64]:
+    """Vectorized version of `fi_freq`, for an array of frequency indices (in kHz)."""
+    fi = numpy.asarray(fi, dtype=numpy.int64)
+    fi_b = fi // 10000000
+    fi_ccc = (fi % 10000000) // 10000
+    fi_ff = (fi % 10000) // 100
+    fi_nn = fi % 100
+
+    freqs = numpy.empty(fi.shape, dtype=numpy.float64)
+    abc = fi_b <= 2
+    hf = ~abc
+    freqs[hf] = (fi_ccc[hf] + (2 * fi_nn[hf] - fi_ff[hf] + 1) / (2 * fi_ff[hf])) * 25
+    # ABC frequencies are looked up in the table of each number of filters
+    for nfilt in numpy.unique(fi_ff[abc]):
+        mask = abc & (fi_ff == nfilt)
+        freqs[mask] = _freq_abc_table(int(nfilt))[fi_b[mask] * nfilt + fi_nn[mask]]
+    return freqs
+
+
 def ti_datetime(ti: int, c: int) -> datetime.datetime:
     yy = int(ti // 100000000) + 1996
     dd = int(ti % 100000000) // 100000
@@ -212,6 +240,39 @@ def t97_datetime(t97: float) -> datetime.datetime:
     return datetime.datetime(1997, 1, 1) + datetime.timedelta(days=t97 - 1)
 
 
+def ti_datetime64(
+    ti: numpy.typing.ArrayLike, c: numpy.typing.ArrayLike
+) -> numpy.typing.NDArray[numpy.datetime64]:
+    """Vectorized version of `ti_datetime`, returning a datetime64[ns] array."""
+    ti = numpy.asarray(ti, dtype=numpy.int64)
+    c = numpy.asarray(c, dtype=numpy.int64)
+    yy = ti // 100000000 + 1996
+    dd = (ti % 100000000) // 100000
+    ss = ti % 100000
+
+    return (
+        (yy - 1970).astype("M8[Y]").astype("M8[ns]")
+        + (dd - 1).astype("m8[D]")
+        + ss.astype("m8[s]")
+        + (c * 10).astype("m8[ms]")
+    )
+
+
+def t97_datetime64(
+    t97: numpy.typing.ArrayLike,
+) -> numpy.typing.NDArray[numpy.datetime64]:
+    """Vectorized version of `t97_datetime`, returning a datetime64[ns] array."""
+    # as datetime.timedelta(days=...) does: the whole days, plus the fraction of day converted
+    # into microseconds and rounded (half to even) once
+    day_fraction, days = numpy.modf(numpy.asarray(t97, dtype=numpy.float64) - 1)
+
+    return (
+        numpy.datetime64("1997-01-01", "ns")
+        + days.astype("m8[D]")
+        + numpy.rint(day_fraction * 86400e6).astype("m8[us]")
+    )
+
+
 def ydh_datetime(ydh: Union[int, str]):
     if isinstance(ydh, str):
         ydh_str = ydh
@@ -91,7 +91,7 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
             # },
             "Src_ID_Label": {
                 "name": "source",
-                "value": self.file["Src_ID_Label"][...],
+                "value": self._variable("Src_ID_Label"),
                 "metadata": {},
             },
         }
@@ -100,10 +100,9 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
     def frequencies(self) -> Quantity:
         if self._frequencies is None:  # type: ignore
             # self._frequencies is Union[None, Quantity] but defined in base.py
-            with self.open(self.filepath) as f:
-                self._frequencies = f["Frequency"][...] * Unit(
-                    f["Frequency"].attrs["UNITS"]
-                )
+            self._frequencies = self._variable("Frequency") * Unit(
+                self.file["Frequency"].attrs["UNITS"]
+            )
         return self._frequencies
 
     @property
@@ -111,8 +110,7 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
         if self._times is None:  # type: ignore
             # self._times is Union[None, Time] but defined in base.py
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = Time(f["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
@@ -122,7 +120,7 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
     @source.setter
     def source(self, source_name: Union[None, str]) -> None:
         """Select one source or all (None)."""
-        available_source_values = self.file["Src_ID_Label"][...]
+        available_source_values = self._variable("Src_ID_Label")
         if source_name is None:
             source_name = available_source_values
             self._source = None
@@ -132,7 +130,7 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
             )
         else:
             _source_id = np.argwhere(available_source_values == source_name)[0, 0]
-            self._source = self.file["Src_ID_Label"][...][_source_id]
+            self._source = self._variable("Src_ID_Label")[_source_id]
 
     # @property
     # def hemisphere(self) -> str:
@@ -184,10 +182,9 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
                     )
 
             # Sort out data and attributes
-            data_ext = self.file[dataset_key]
             data_attr = self.file[dataset_key].attrs
             # extract the data and replace the values at FILLVAL by NaN
-            data = data_ext[...]
+            data = self._variable(dataset_key)
             data = np.where(data == data_attr["FILLVAL"], np.nan, data)
 
             # Conversion in XArray
@@ -238,7 +235,7 @@ class ExpresCdfData(CdfData, ABC, dataset="expres"):  # type: ignore
     ) -> None:
         if self.source is None:
             raise ValueError(
-                f"Select one source among {self.file['Src_ID_Label'][...]} before producing a quicklook."
+                f"Select one source among {self._variable('Src_ID_Label')} before producing a quicklook."
             )
         default_keys = ["FC", "FP", "Polarization", "Theta"]
         forbidden_keys = [
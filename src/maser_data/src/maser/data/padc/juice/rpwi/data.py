@@ -168,18 +168,16 @@ class JuiceRPWIhfL1CdfData(CdfData, FixedFrequencies, dataset="jui_rpwi_hf_l1_")
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as f:
-                self._times = Time(f["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as f:
-                # self._frequencies = f["frequency"][...] * Unit(
-                self._frequencies = f["frequency"][...][0, :-1] * Unit(
-                    f["frequency"].attrs["UNITS"]
-                )
+            # self._frequencies = f["frequency"][...] * Unit(
+            self._frequencies = self._variable("frequency")[0, :-1] * Unit(
+                self.file["frequency"].attrs["UNITS"]
+            )
         return self._frequencies
 
     @property
@@ -194,7 +192,7 @@ class JuiceRPWIhfL1CdfData(CdfData, FixedFrequencies, dataset="jui_rpwi_hf_l1_")
 
         for dataset_key in dataset_keys:
             datasets[dataset_key] = xarray.DataArray(
-                data=self.file[dataset_key][...].T[:-1, :],
+                data=self._variable(dataset_key).T[:-1, :],
                 name=self.file[dataset_key].attrs["LABLAXIS"],
                 coords=[
                     (
@@ -8,19 +8,60 @@ class JuiceCdfDataSweep(Sweep):
         self._time = time
         self._frequencies = frequencies
 
+    def as_xarray(self):
+        """Get the data of the sweep as xarray.DataArray objects (with a single time step), as
+        in the xarray.Dataset of the whole file."""
+        import xarray
+
+        return {
+            key: xarray.DataArray(
+                data=values[:, None],
+                name=self.header["attrs"][key]["LABLAXIS"],
+                coords=[
+                    (
+                        "frequency",
+                        self.frequencies.value,
+                        {"units": self.frequencies.unit},
+                    ),
+                    ("time", [self.time.to_datetime()]),
+                ],
+                dims=("frequency", "time"),
+                attrs={
+                    "units": self.header["attrs"][key]["UNITS"],
+                    "title": self.header["attrs"][key]["CATDESC"],
+                },
+            ).sortby("frequency")
+            for key, values in self.data.items()
+        }
+
 
 class JuiceCdfDataSweeps(Sweeps):
+    # number of sweeps read at once from the CDF file
+    chunk_size = 10000
+
     @property
     def generator(self):
         frequencies = self.data_reference.frequencies
         times = self.data_reference.times
+        dataset_keys = self.data_reference.dataset_keys
+        header = {
+            "attrs": {
+                key: {
+                    name: self.file[key].attrs[name]
+                    for name in ["LABLAXIS", "UNITS", "CATDESC"]
+                }
+                for key in dataset_keys
+            }
+        }
 
-        xdata = self.data_reference.as_xarray()
-
-        for i, time in enumerate(times):
-            yield JuiceCdfDataSweep(
-                header={"header_keyword": "x-array generate data"},
-                data={datakey: xdata[datakey].isel(time=[i]) for datakey in xdata},
-                time=time,
-                frequencies=frequencies,
-            )
+        for start in range(0, len(times), self.chunk_size):
+            records = slice(start, start + self.chunk_size)
+            # (the last frequency channel is not used, as in as_xarray)
+            chunk = {key: self.file[key][records, :-1] for key in dataset_keys}
+            for i, time in enumerate(times[records]):
+                yield JuiceCdfDataSweep(
+                    header=header,
+                    data={key: values[i] for key, values in chunk.items()},
+                    time=time,
+                    frequencies=frequencies,
+                )
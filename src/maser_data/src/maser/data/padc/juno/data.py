@@ -36,18 +36,16 @@ class JnoWavLesiaL3aV02Data(CdfData, dataset="jno_wav_cdr_lesia"):  # type: igno
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                units = cdf_file["Frequency"].attrs["UNITS"]
-                freq = cdf_file["Frequency"][...] * Unit(units)
-                self._frequencies = freq
+            units = self.file["Frequency"].attrs["UNITS"]
+            freq = self._variable("Frequency") * Unit(units)
+            self._frequencies = freq
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as cdf_file:
-                self._times = Time(cdf_file["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
@@ -59,18 +57,18 @@ class JnoWavLesiaL3aV02Data(CdfData, dataset="jno_wav_cdr_lesia"):  # type: igno
         import numpy
 
         datasets = {}
-        background = self.file["Background"][...]
+        background = self._variable("Background")
         bg_table = (numpy.tile(background, (len(self.times), 1))).T
         # gain = self.file["Gain"][...]
         # sigma = self.file["Sigma"][...]
 
         for dataset_key in self._dataset_keys:
             if dataset_key == "INTENSITY":
-                values = self.file["Data"][...].T
+                values = self._variable("Data").T
             elif dataset_key == "BACKGROUND":
                 values = bg_table
             elif dataset_key == "INTENSITY_BG_COR":
-                values = self.file["Data"][...].T - bg_table
+                values = self._variable("Data").T - bg_table
             dataset = xarray.DataArray(
                 data=values,
                 name=self.dataset,
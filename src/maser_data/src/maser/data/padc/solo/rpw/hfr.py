@@ -153,24 +153,21 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                # if units are not specified, assume kHz
-                units = Unit(cdf_file["FREQUENCY"].attrs["UNITS"].strip() or "kHz")
-                # Removed # Compute frequency values for HF1 and HF2 bands
-                # f1 = 375 + 50 * np.arange(64)
-                # f2 = 3625 + 100 * np.arange(128)
-
-                def sort_uniq(sequence):  # a fast way to sort(unique(sequence))
-                    import itertools
-                    import operator
-
-                    return map(
-                        operator.itemgetter(0), itertools.groupby(sorted(sequence))
-                    )
+            # if units are not specified, assume kHz
+            units = Unit(self.file["FREQUENCY"].attrs["UNITS"].strip() or "kHz")
+            # Removed # Compute frequency values for HF1 and HF2 bands
+            # f1 = 375 + 50 * np.arange(64)
+            # f2 = 3625 + 100 * np.arange(128)
+
+            def sort_uniq(sequence):  # a fast way to sort(unique(sequence))
+                import itertools
+                import operator
 
-                freq = cdf_file["FREQUENCY"][...]
-                freq = list(sort_uniq(freq))
-                self._frequencies = freq * units  # np.concatenate((f1, f2)) * units
+                return map(operator.itemgetter(0), itertools.groupby(sorted(sequence)))
+
+            freq = self._variable("FREQUENCY")
+            freq = list(sort_uniq(freq))
+            self._frequencies = freq * units  # np.concatenate((f1, f2)) * units
 
         return self._frequencies
 
@@ -180,7 +177,7 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
             self._times = Time([], format="jd")
             # Get Epoch time of each first sample in the sweep
             mask = self.sweep_start_index
-            self._times = Time(np.take(self.file["Epoch"][...], mask, axis=0))
+            self._times = Time(self._epoch_datetimes(mask))
         return self._times
 
     @property
@@ -195,7 +192,7 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
     def sweep_start_index(self):
         # Define the list of indices of the first element of each sweep in the file
         if not hasattr(self, "_sweep_start_index") or self._sweep_start_index is None:
-            self._sweep_start_index = get_sweep_start_index(self.file["SWEEP_NUM"][...])
+            self._sweep_start_index = get_sweep_start_index(self._variable("SWEEP_NUM"))
 
         # Return resulting index array as a list
         return list(self._sweep_start_index)
@@ -204,12 +201,29 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
     def dataset_keys(self):
         return self._dataset_keys
 
-    def as_xarray(self, as_is=False):
+    def _sweep_slice(self, time_range) -> slice:
+        """Get the slice of the sweeps starting within `time_range` (empty if there is none).
+
+        The records within `time_range` are found with a binary search on Epoch (see
+        `_epoch_slice`), so that the sweep times are not all decoded.
+        """
+        sweep_start_index = self.sweep_start_index
+        if time_range is None:
+            return slice(0, len(sweep_start_index))
+        records = self._epoch_slice(time_range)
+        return slice(
+            int(np.searchsorted(sweep_start_index, records.start)),
+            int(np.searchsorted(sweep_start_index, records.stop)),
+        )
+
+    def as_xarray(self, as_is=False, time_range=None, freq_range=None):
         """
         Return the HFR data as a xarray
 
         :param as_is: If True, returns HFR data is stored in the CDF. Otherwise build and return power as a 3D array
                       as a function of channel[2], time and frequency[192].
+        :param time_range: if given, only the sweeps starting within this (start, end) range are read
+        :param freq_range: if given, only the frequencies within this (min, max) range are kept
         :return: xarray containing HFR data
         """
         import xarray
@@ -254,8 +268,13 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
             # assume V^2/Hz
             units = "V^2/Hz"
 
+        # Only the records of the sweeps within the time range are read
+        sweeps = self._sweep_slice(time_range)
+        isweep = self.sweep_start_index + [len(self.file["Epoch"])]
+        records = slice(isweep[sweeps.start], isweep[sweeps.stop])
+
         if as_is:  # old way
-            time = self.file["Epoch"][...]
+            time = self._variable("Epoch", records)
             # Return HFR data as is
             sensor_config = list(
                 map(
@@ -263,16 +282,16 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
                         self.sensor_mapping[configs[0]],
                         self.sensor_mapping[configs[1]],
                     ),
-                    self.file["SENSOR_CONFIG"][...],
+                    self._variable("SENSOR_CONFIG", records),
                 )
             )
 
             # Get vector of frequencies in the file
-            frequency = self.file["FREQUENCY"][...]
+            frequency = self._variable("FREQUENCY", records)
 
             # Build xarray
             V_da = xarray.DataArray(
-                [self.file["AGC1"][...], self.file["AGC2"][...]],
+                [self._variable("AGC1", records), self._variable("AGC2", records)],
                 coords={
                     "channel": self.channel_labels,
                     "time": time,
@@ -283,116 +302,62 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
                 attrs={"units": units},
             )
         else:
-            # Extract frequency and corresponding band values from file
-            freq = self.file["FREQUENCY"][...]
-            band = self.file["HFR_BAND"][...]
+            # Extract frequency and voltage spectral power values from file
+            freq = self._variable("FREQUENCY", records)
+            agc1 = self._variable("AGC1", records)
+            agc2 = self._variable("AGC2", records)
+            sensor_config_rec = self._variable("SENSOR_CONFIG", records)
 
-            # Define number of records
-            n_rec = band.shape[0]
             # Get Epoch times of first sample of each sweep in the file
-            sweep_times = self.times
+            if time_range is None:
+                sweep_times = self.times
+            else:
+                sweep_times = Time(
+                    self._epoch_datetimes(isweep[sweeps.start : sweeps.stop])
+                )
             nt = len(sweep_times)
             # Get complete list of HFR frequency values
             hfr_frequency = self.frequencies
             nf = len(hfr_frequency)
 
-            # Initialize output 2D array containing voltage spectral power values in V^2/Hz
+            # Get list of first index of sweeps (relative to the first record read),
+            # with an element in the end containing the end of the latest sweep
+            isweep = np.array(isweep[sweeps.start : sweeps.stop + 1]) - records.start
+            # Get the sweep of each record and the index of its frequency (since they are
+            # not always sorted)
+            rec_sweep = np.repeat(np.arange(nt), np.diff(isweep))
+            freq_indices = hfr_frequency.value.searchsorted(freq)
+
+            # Output 2D array containing voltage spectral power values in V^2/Hz
             # Dims = (channels[2], time of the first sweep sample[len(time)], frequency[192])
-            V_2d = np.empty((2, nt, nf))
-            # Fill 2D array with NaN for HRF frequencies not actually measured in the file
-            V_2d[:] = np.nan
+            # (filled with NaN for HRF frequencies not actually measured in the sweep)
+            V_2d = np.full((2, nt, nf), np.nan)
+            V_2d[0, rec_sweep, freq_indices] = agc1
+            V_2d[1, rec_sweep, freq_indices] = agc2
 
             # Same for a verification table
-            freq_ind_table = np.empty((nt, nf))
-            freq_ind_table[:] = np.nan
-
-            # Get list of first index of sweeps
-            isweep = self.sweep_start_index
-            # Get number of sweeps
-            n_sweeps = len(isweep)
-            # Insert an element in the end of the isweep list
-            # containing the end of the latest sweep
-            # (required for the loop below, in order to have
-            # a start/end index range for each sweep)
-            isweep = np.insert(isweep, n_sweeps, n_rec)
-
-            # Initialize sensor_config
-            sensor_config = np.zeros((2, nt), dtype=object)
-
-            # Perform a loop on each sweep
-            for i in range(n_sweeps):
-                # Get first and last index of the sweep
-                i0 = isweep[i]
-                i1 = isweep[i + 1]
-
-                # Get indices of the actual frequency values since they are not always sorted
-                # freq_indices = get_freq_indices(freq[i0:i1], band[i0:i1]) # old way if 192 freqs
-                freq_indices = hfr_frequency.value.searchsorted(freq[i0:i1])
-                # freq_ind_table[i, :] = freq_indices
-                freq_ind_table[i, freq_indices] = np.arange(len(freq_indices))
-
-                # fill output 2D array
-                V_2d[0, i, freq_indices] = self.file["AGC1"][i0:i1]
-                V_2d[1, i, freq_indices] = self.file["AGC2"][i0:i1]
-
-                # Fill sensor config
-                sensor_config[0, i] = self.sensor_mapping[
-                    self.file["SENSOR_CONFIG"][i0, 0]
-                ]
-                sensor_config[1, i] = self.sensor_mapping[
-                    self.file["SENSOR_CONFIG"][i0, 1]
-                ]
-
-            # Filtering the All-NaN slice warning for the following section
-            # nanmax is used here to detect the All-NaN lines and thus we do not want the warning
-            # There is always MAX 1 channel used so at least 1 Nan per (freq,time) in 1 channel
-            import warnings
-
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", message="All-NaN slice encountered")
-                # Computing delta_times
-                nanline = np.empty((nt - 2))
-                nanline[:] = np.nan
-                # delta_times = Time([], format="jd")
-                timeref = Time(self.file["Epoch"][...])
-                delta_times = []
-                delta_times_first = np.empty((nf))
-                delta_times_last = np.empty((nf))
-                delta_times_first[:] = np.nan
-                delta_times_last[:] = np.nan
-                isweep_r = isweep[1:-2]
-                j = 0
-                jfirst = 0
-                jlast = 0
-                for i in range(nf):
-                    # First sweep - may be incomplete
-                    # Check whether the measurement exists and fills delta_times if so
-                    if np.nanmax(V_2d[:, 0, i], axis=0) > -np.inf:
-                        delta_times_first[i] = (timeref[jfirst] - self.times[0]).value
-                        jfirst += 1
-
-                    # regular sweep
-                    if np.nanmax(V_2d[:, :, i]) > -np.inf:  # Main case
-                        delta_times = np.append(
-                            delta_times,
-                            (timeref[isweep_r + j] - self.times[1:-1]).value,
-                        )
-                        j += 1
-                    else:
-                        delta_times = np.append(
-                            delta_times, nanline
-                        )  # if a frequency is ONLY here in first or last sweep
-
-                    # Last sweep - maybe be incomplete
-                    # Check whether the measurement exists and fills delta_times if so
-                    if np.nanmax(V_2d[:, -1, i], axis=0) > -np.inf:
-                        delta_times_last[i] = (
-                            timeref[isweep[-2] + jlast] - self.times[-1]
-                        ).value
-                        jlast += 1
-                delta_times = np.append(delta_times_first, delta_times)
-                delta_times = np.append(delta_times, delta_times_last)
-                delta_times = np.reshape(delta_times, (nf, nt))
+            freq_ind_table = np.full((nt, nf), np.nan)
+            freq_ind_table[rec_sweep, freq_indices] = (
+                np.arange(len(rec_sweep)) - isweep[rec_sweep]
+            )
+
+            # Sensor config of each sweep (given by its first record)
+            sensor_config = np.array(
+                [
+                    [self.sensor_mapping[code] for code in configs]
+                    for configs in sensor_config_rec[isweep[:-1]].T
+                ],
+                dtype=object,
+            )
+
+            # Computing delta_times (in days): time of each record relative to the start of
+            # its sweep
+            epoch = self._epoch_nanoseconds(records)
+            delta_times = np.full((nf, nt), np.nan)
+            delta_times[freq_indices, rec_sweep] = (
+                epoch - epoch[isweep[rec_sweep]]
+            ) / 86400e9
+            if time_range is None:
                 self._delta_times = delta_times  # stores delta_times
 
             # Define hfr bands
@@ -441,13 +406,11 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
                         )
                     )
                     sens_conf = sensor_config[0, :]
-                    sens_conf[np.where(tabref - np.inf)] = sensor_config[1, :][
-                        np.where(tabref > -np.inf)
-                    ]
+                    sens_conf[tabref > -np.inf] = sensor_config[1, :][tabref > -np.inf]
                     values = sens_conf
                     # Saving channel info as well
                     channel = np.ones([len(sens_conf)])
-                    channel[np.where(tabref > -np.inf)] = 2
+                    channel[tabref > -np.inf] = 2
                     coords = [
                         ("time", sweep_times.value),
                     ]
@@ -488,12 +451,9 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
                         raise ValueError(
                             "Trying to add a sensor key before the sensor mapping."
                         )
-                    valuetmp = np.empty((nf, nt))
-                    valuetmp[:] = np.nan
-                    loc = np.asarray(sens_conf == key).nonzero()  # faster than np.where
-                    for fr in range(nf):
-                        valuetmp[fr, loc] = main_data[fr, loc]
-                    values = valuetmp
+                    values = np.full((nf, nt), np.nan)
+                    mask = sens_conf == key
+                    values[:, mask] = main_data[:, mask]
                     coords = [
                         ("frequency", hfr_frequency, {"units": self.frequencies.unit}),
                         ("time", sweep_times.value),
@@ -518,7 +478,9 @@ class RpwHfrSurv(CdfData, dataset="solo_L2_rpw-hfr-surv"):  # type: ignore
                 else:
                     V_ds[key] = dataset[key]
 
-        return V_ds  # xarray.Dataset({"VOLTAGE_SPECTRAL_POWER": V_da})
+        return self._select_range(
+            V_ds, freq_range=freq_range
+        )  # xarray.Dataset({"VOLTAGE_SPECTRAL_POWER": V_da})
 
     def quicklook(
         self,
@@ -5,8 +5,9 @@ Classes for RPW/LFR L2 datasets.
 """
 
 from maser.data.base import CdfData
+from maser.data.base.base import _datetime64_to_time
 
-from astropy.time import Time, TimeDelta
+from astropy.time import Time
 from astropy.units import Unit
 from maser.data.base.sweeps import Sweeps
 import numpy
@@ -69,18 +70,17 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
     def multiple_mode(self):
         if self._multiple_mode is None:
             NBmode = ""
-            with self.open(self.filepath) as cdf_file:
-                for frequency_band in self.frequency_band_labels:
-                    frequencies = cdf_file[frequency_band][...]
-                    if len(frequencies) == 0:
-                        continue
-                    else:
-                        if "N" in frequency_band:
-                            if "N" not in NBmode:
-                                NBmode += "N"
-                        elif "B" in frequency_band:
-                            if "B" not in NBmode:
-                                NBmode += "B"
+            for frequency_band in self.frequency_band_labels:
+                frequencies = self._variable(frequency_band)
+                if len(frequencies) == 0:
+                    continue
+                else:
+                    if "N" in frequency_band:
+                        if "N" not in NBmode:
+                            NBmode += "N"
+                    elif "B" in frequency_band:
+                        if "B" not in NBmode:
+                            NBmode += "B"
             if "N" in NBmode and "B" in NBmode:
                 self._multiple_mode = 1
             else:
@@ -92,12 +92,11 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
         if self._frequencies is None:
             self._frequencies = {}
 
-            with self.open(self.filepath) as cdf_file:
-                for frequency_band in self.frequency_band_labels:
-                    # if units are not specified, assume Hz
-                    units = cdf_file[frequency_band].attrs["UNITS"].strip() or "Hz"
-                    freq = cdf_file[frequency_band][...] * Unit(units)
-                    self._frequencies[frequency_band] = freq
+            for frequency_band in self.frequency_band_labels:
+                # if units are not specified, assume Hz
+                units = self.file[frequency_band].attrs["UNITS"].strip() or "Hz"
+                freq = self._variable(frequency_band) * Unit(units)
+                self._frequencies[frequency_band] = freq
 
         return self._frequencies
 
@@ -106,161 +105,104 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
         if self._times is None:
             self._times = Time([], format="jd")
             self._delta_times = {}
+            self.times_per_frequency = {}
+            self._datetime64 = numpy.array([], dtype="datetime64[ns]")
+            self._datetime64_per_frequency = {}
+
+            # tolerance on the start and stop times of the bands of the same mode
+            tolerance = numpy.timedelta64(100, "ms")
+
             timesbymode = {}
             truetimesbyfreq = {}
             timesbyfreq = {}
             NBtable = {"B": [], "N": []}
-            NBdone = ""
-            with self.open(self.filepath) as cdf_file:
-                for frequency_band in self.frequency_band_labels:
-                    if len(cdf_file[f"Epoch_{frequency_band}"][...]) == 0:
-                        tmp = cdf_file[f"Epoch_{frequency_band}"][...]
-                        # Sometimes some bands are not recorded and not present in a file
-                        # continue
-                    else:
-                        # Dealing with different times between Burst and Normal modes to combine them
-                        if "B" in frequency_band:
-                            NBmode = "B"
-                        else:
-                            NBmode = "N"
-                        # Filling arrays for delta_times
-                        truetimesbyfreq[frequency_band] = Time(
-                            cdf_file[f"Epoch_{frequency_band}"][...]
+            for frequency_band in self.frequency_band_labels:
+                epoch = self._epoch_datetime64(f"Epoch_{frequency_band}")
+                if len(epoch) == 0:
+                    # Sometimes some bands are not recorded and not present in a file
+                    continue
+
+                # Dealing with different times between Burst and Normal modes to combine them
+                if "B" in frequency_band:
+                    NBmode = "B"
+                else:
+                    NBmode = "N"
+                if NBmode not in timesbymode:
+                    timesbymode[NBmode] = epoch
+                    timesbyfreq[frequency_band] = epoch
+                    truetimesbyfreq[frequency_band] = epoch
+                else:
+                    reference = timesbymode[NBmode]
+                    # In case new time series starts after (resp. ends earlier), the
+                    # first (resp. last) time of the mode is used for this band
+                    start = 1 if reference[0] - epoch[0] < -tolerance else 0
+                    stop = len(reference)
+                    if reference[-1] - epoch[-1] > tolerance:
+                        stop -= 1
+                    truetimesbyfreq[frequency_band] = numpy.concatenate(
+                        (reference[:start], epoch, reference[stop:])
+                    )
+                    timesbyfreq[frequency_band] = reference[start:stop]
+
+                    # In case new time series starts before (resp. ends later), its first
+                    # (resp. last) time is added to the times of the mode and of its bands
+                    # (should only happen if the cutting time between two files is in
+                    # the middle of a sweep)
+                    before = (
+                        epoch[:1] if reference[0] - epoch[0] > tolerance else epoch[:0]
+                    )
+                    after = (
+                        epoch[-1:]
+                        if reference[-1] - epoch[-1] < -tolerance
+                        else epoch[:0]
+                    )
+                    if len(before) or len(after):
+                        timesbymode[NBmode] = numpy.concatenate(
+                            (before, reference, after)
                         )
-                        # Filling temporary array with time values from B and N modes
-                        if NBmode not in NBdone:
-                            NBdone += NBmode
-                            timesbymode[NBmode] = Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
-                            )
-                            # Filling temporary array with time values for as_xarray times
-                            timesbyfreq[frequency_band] = Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
+                        timesbyfreq[frequency_band] = numpy.concatenate(
+                            (before, timesbyfreq[frequency_band], after)
+                        )
+                        for freq in NBtable[NBmode]:
+                            truetimesbyfreq[freq] = numpy.concatenate(
+                                (before, truetimesbyfreq[freq], after)
                             )
-                        else:
-                            # Checking the dimensions are the same
-
-                            # The same tests as the proper ones (next section) are applied reversed to as_xarray times
-                            # In case new time series starts after - take only the later part
-                            if timesbymode[NBmode][0] - Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
-                            )[0] < TimeDelta(-0.1 * Unit("s")):
-                                nstart = 1
-                                truetimesbyfreq[frequency_band] = Time(
-                                    numpy.append(
-                                        timesbymode[NBmode][0],
-                                        truetimesbyfreq[frequency_band],
-                                    )
-                                )  # .sort()
-                            else:
-                                nstart = 0
-                            # In case new time series ends earlier
-                            if timesbymode[NBmode][-1] - Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
-                            )[-1] > TimeDelta(0.1 * Unit("s")):
-                                timesbyfreq[frequency_band] = timesbymode[NBmode][
-                                    nstart:-1
-                                ]
-                                truetimesbyfreq[frequency_band] = Time(
-                                    numpy.append(
-                                        truetimesbyfreq[frequency_band],
-                                        timesbymode[NBmode][-1],
-                                    )
-                                )  # .sort()
-                            else:
-                                timesbyfreq[frequency_band] = timesbymode[NBmode][
-                                    nstart:
-                                ]
-
-                            # In case new time series starts before ### Should only happen if the cutting time between two files is in the middle of a sweep ###
-                            if timesbymode[NBmode][0] - Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
-                            )[0] > TimeDelta(0.1 * Unit("s")):
-                                timesbymode[NBmode] = Time(
-                                    numpy.append(
-                                        Time(
-                                            cdf_file[f"Epoch_{frequency_band}"][...][0]
-                                        ),
-                                        timesbymode[NBmode],
-                                    )
-                                )  # .sort()
-                                timesbyfreq[frequency_band] = Time(
-                                    numpy.append(
-                                        Time(
-                                            cdf_file[f"Epoch_{frequency_band}"][...][0]
-                                        ),
-                                        timesbyfreq[frequency_band],
-                                    )
-                                )  # .sort()
-                                for freq in NBtable[NBmode]:
-                                    truetimesbyfreq[freq] = Time(
-                                        numpy.append(
-                                            Time(
-                                                cdf_file[f"Epoch_{frequency_band}"][
-                                                    ...
-                                                ][0]
-                                            ),
-                                            truetimesbyfreq[freq],
-                                        )
-                                    )  # .sort()
-                                # print('Adding earlier time')
-                            # In case new time series ends later
-                            if timesbymode[NBmode][-1] - Time(
-                                cdf_file[f"Epoch_{frequency_band}"][...]
-                            )[-1] < TimeDelta(-0.1 * Unit("s")):
-                                timesbymode[NBmode] = Time(
-                                    numpy.append(
-                                        timesbymode[NBmode],
-                                        Time(
-                                            cdf_file[f"Epoch_{frequency_band}"][...][-1]
-                                        ),
-                                    )
-                                )  # .sort()
-                                timesbyfreq[frequency_band] = Time(
-                                    numpy.append(
-                                        timesbyfreq[frequency_band],
-                                        Time(
-                                            cdf_file[f"Epoch_{frequency_band}"][...][-1]
-                                        ),
-                                    )
-                                )  # .sort()
-                                for freq in NBtable[NBmode]:
-                                    truetimesbyfreq[freq] = Time(
-                                        numpy.append(
-                                            truetimesbyfreq[freq],
-                                            Time(
-                                                cdf_file[f"Epoch_{frequency_band}"][
-                                                    ...
-                                                ][-1]
-                                            ),
-                                        )
-                                    )  # .sort()
-                                # print('Adding later time')
-                        NBtable[NBmode].append(frequency_band)
-            if "N" in NBdone and "B" in NBdone:
+                NBtable[NBmode].append(frequency_band)
+
+            if not timesbymode:
+                return self._times
+
+            if len(timesbymode) == 2:
                 # If the file has both Normal and Burst mode, combine the times
-                self._times = Time(
-                    numpy.append(timesbymode["N"], timesbymode["B"])
-                ).sort()
-                for freq in NBtable["B"]:
-                    truetimesbyfreq[freq] = Time(
-                        numpy.append(truetimesbyfreq[freq], timesbymode["N"])
-                    ).sort()
-                    self._delta_times[freq] = truetimesbyfreq[freq] - self._times
-                for freq in NBtable["N"]:
-                    truetimesbyfreq[freq] = Time(
-                        numpy.append(truetimesbyfreq[freq], timesbymode["B"])
-                    ).sort()
-                    self._delta_times[freq] = truetimesbyfreq[freq] - self._times
-            elif NBdone == "":
-                self._times = tmp
-                truetimesbyfreq = tmp
+                times = numpy.sort(
+                    numpy.concatenate((timesbymode["N"], timesbymode["B"]))
+                )
+                for NBmode, other_mode in [("B", "N"), ("N", "B")]:
+                    for freq in NBtable[NBmode]:
+                        truetimesbyfreq[freq] = numpy.sort(
+                            numpy.concatenate(
+                                (truetimesbyfreq[freq], timesbymode[other_mode])
+                            )
+                        )
             else:
-                self._times = timesbymode[NBdone]
-                for freq in NBtable[NBdone]:
-                    self._delta_times[freq] = truetimesbyfreq[freq] - self._times
-            self.times_per_frequency = timesbyfreq
-        return self._times.sort()
+                (times,) = timesbymode.values()
+
+            # Time objects are only built from the final times
+            reference_times = _datetime64_to_time(times)
+            for NBmode in ["B", "N"]:
+                for freq in NBtable[NBmode]:
+                    self._delta_times[freq] = (
+                        _datetime64_to_time(truetimesbyfreq[freq]) - reference_times
+                    )
+            order = numpy.argsort(times, kind="stable")
+            self._datetime64 = times[order]
+            self._times = reference_times[order]
+            self._datetime64_per_frequency = timesbyfreq
+            self.times_per_frequency = {
+                freq: _datetime64_to_time(values)
+                for freq, values in timesbyfreq.items()
+            }
+        return self._times
 
     @property
     def delta_times(self):
@@ -316,7 +258,7 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
             firstbandN = 1
             firstbandB = 1
             for frequency_band in self.frequency_band_labels:
-                frequencies = self.file[frequency_band][...]
+                frequencies = self._variable(frequency_band)
                 if len(frequencies) == 0:
                     continue
 
@@ -344,7 +286,7 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
                         frequency_attrs["units"] = "Hz"
 
                 if dataset_key == "DELTA_TIMES":
-                    times = self.times.to_datetime()  # value
+                    times = self._datetime64
                     values = numpy.tile(
                         deltatimes[frequency_band].value, (len(frequencies), 1)
                     ).transpose()
@@ -368,9 +310,7 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
                     attrs["depend_0"] = "Epoch"
 
                 elif dataset_key == "MODE_NB":
-                    times = self.times_per_frequency[
-                        frequency_band
-                    ].to_datetime()  # value
+                    times = self._datetime64_per_frequency[frequency_band]
                     # values = numpy.chararray([len(times),len(frequencies)])
                     values = numpy.zeros([len(times), len(frequencies)])
                     if "N" in frequency_band:
@@ -396,10 +336,8 @@ class RpwLfrSurvBp1(CdfData, dataset="solo_L2_rpw-lfr-surv-bp1"):  # type: ignor
                     attrs["depend_0"] = "Epoch"
 
                 else:
-                    times = self.times_per_frequency[
-                        frequency_band
-                    ].to_datetime()  # value
-                    values = self.file[f"{dataset_key}_{frequency_band}"][...]
+                    times = self._datetime64_per_frequency[frequency_band]
+                    values = self._variable(f"{dataset_key}_{frequency_band}")
 
                     attrs = {
                         k.lower(): v
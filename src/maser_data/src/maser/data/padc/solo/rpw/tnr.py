@@ -38,69 +38,50 @@ class RpwTnrSurvSweeps(Sweeps):
         - MAGNETIC_SPECTRAL_POWER1 : Magnetic power spectral density from 1 search coil axis in channel 2
         """
 
-        def add_rec(in_data, out_data, rec_index):
-            # Get frequency band range
-            i_band = self.file["TNR_BAND"][rec_index]
-            i0, i1 = self.data_reference.frequency_band_indices[i_band]
-
-            # Fill values
-            out_data["Epoch"][0, i_band] = in_data["Epoch"][rec_index]
-            out_data["VOLTAGE_SPECTRAL_POWER1"][0, i0 : i1 + 1] = in_data["AUTO1"][
-                rec_index, :
-            ]
-            out_data["VOLTAGE_SPECTRAL_POWER2"][0, i0 : i1 + 1] = in_data["AUTO2"][
-                rec_index, :
-            ]
-            out_data["FLUX_DENSITY1"][0, i0 : i1 + 1] = in_data["FLUX_DENSITY1"][
-                rec_index, :
-            ]
-            out_data["FLUX_DENSITY2"][0, i0 : i1 + 1] = in_data["FLUX_DENSITY2"][
-                rec_index, :
-            ]
-            out_data["MAGNETIC_SPECTRAL_POWER1"][0, i0 : i1 + 1] = in_data[
-                "MAGNETIC_SPECTRAL_POWER1"
-            ][rec_index, :]
-            out_data["MAGNETIC_SPECTRAL_POWER2"][0, i0 : i1 + 1] = in_data[
-                "MAGNETIC_SPECTRAL_POWER2"
-            ][rec_index, :]
-
-            return out_data
-
         # First build list of frequency values for TNR (A+B+C+D bands)
         freq = self.data_reference.frequencies
 
-        # Initialize output data vector for the first sweep
-        sweep_data = np.zeros(1, dtype=TNR_SWEEP_DTYPE)
-
-        # Loop over each record in the CDF
-        sweep_completed = False
-        for i in range(self.file["SWEEP_NUM"].shape[0]):
-            try:
-                if self.file["SWEEP_NUM"][i] != self.file["SWEEP_NUM"][i + 1]:
-                    sweep_data = add_rec(self.file, sweep_data, i)
-                    sweep_completed = True
-                    yield (
-                        {key: sweep_data[key][...] for key in sweep_data.dtype.names},
-                        Time(sweep_data["Epoch"][0, 0]),
-                        freq,
-                        self.file["SENSOR_CONFIG"][i],
-                        self.file["SURVEY_MODE"][i],
-                    )
-                else:
-                    if sweep_completed:
-                        sweep_completed = False
-                        sweep_data = np.empty(1, dtype=TNR_SWEEP_DTYPE)
-
-                    sweep_data = add_rec(self.file, sweep_data, i)
-            except IndexError:
-                # End of CDF file is reached, force yield for last record
-                yield (
-                    {key: sweep_data[key][...] for key in sweep_data.dtype.names},
-                    Time(sweep_data["Epoch"][0, 0]),
-                    freq,
-                    self.file["SENSOR_CONFIG"][i],
-                    self.file["SURVEY_MODE"][i],
-                )
+        # Read the variables at once, then find the sweeps (a sweep starts at each change of
+        # SWEEP_NUM) and the sweep of each record
+        sweep_num = self.file["SWEEP_NUM"][...]
+        sweep_start = np.flatnonzero(np.diff(sweep_num) != 0) + 1
+        sweep_index = np.zeros(len(sweep_num), dtype=int)
+        sweep_index[sweep_start] = 1
+        sweep_index = np.cumsum(sweep_index)
+        # the sensor config and survey mode of a sweep are given by its last record
+        sweep_end = np.append(sweep_start, len(sweep_num)) - 1
+        sensor_config = self.file["SENSOR_CONFIG"][...][sweep_end]
+        survey_mode = self.file["SURVEY_MODE"][...][sweep_end]
+
+        # Scatter the records of each band into the sweeps
+        band = self.file["TNR_BAND"][...]
+        band_start = np.array(
+            [i0 for i0, _ in self.data_reference.frequency_band_indices]
+        )
+        n_freq = self.file["AUTO1"].shape[1]
+        columns = band_start[band][:, None] + np.arange(n_freq)
+        sweep_data = np.zeros(len(sweep_end), dtype=TNR_SWEEP_DTYPE)
+        sweep_data["Epoch"][sweep_index, band] = self.file["Epoch"][...]
+        for key, var in [
+            ("VOLTAGE_SPECTRAL_POWER1", "AUTO1"),
+            ("VOLTAGE_SPECTRAL_POWER2", "AUTO2"),
+            ("FLUX_DENSITY1", "FLUX_DENSITY1"),
+            ("FLUX_DENSITY2", "FLUX_DENSITY2"),
+            ("MAGNETIC_SPECTRAL_POWER1", "MAGNETIC_SPECTRAL_POWER1"),
+            ("MAGNETIC_SPECTRAL_POWER2", "MAGNETIC_SPECTRAL_POWER2"),
+        ]:
+            sweep_data[key][sweep_index[:, None], columns] = self.file[var][...]
+
+        # (the Time objects are built at once, which is much faster than one per sweep)
+        times = Time(sweep_data["Epoch"][:, 0])
+        for i in range(len(sweep_data)):
+            yield (
+                {key: sweep_data[key][i : i + 1] for key in sweep_data.dtype.names},
+                times[i],
+                freq,
+                sensor_config[i],
+                survey_mode[i],
+            )
 
 
 class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
@@ -150,36 +131,70 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                # if units are not specified, assume Hz
-                units = Unit(cdf_file["TNR_BAND_FREQ"].attrs["UNITS"].strip() or "Hz")
-                self._frequencies = (
-                    np.sort(self.file["TNR_BAND_FREQ"][...].flatten()) * units
-                )
+            # if units are not specified, assume Hz
+            units = Unit(self.file["TNR_BAND_FREQ"].attrs["UNITS"].strip() or "Hz")
+            self._frequencies = (
+                np.sort(self._variable("TNR_BAND_FREQ").flatten()) * units
+            )
 
         return self._frequencies
 
     @property
     def times(self):
-        import xarray
-
         if self._times is None:
-            self._times = Time([], format="jd")
-            band = xarray.DataArray(
-                [self.frequency_band_labels[idx] for idx in self.file["TNR_BAND"][...]]
-            )
-            timeref = self.file["Epoch"][...]
-            # Get Epoch time values for Band A
-            self._times = Time(timeref[np.where(band == self.frequency_band_labels[0])])
-            self._delta_times = {}
-            for freqband in self.frequency_band_labels:
-                self._delta_times[freqband] = (
-                    Time(timeref[np.where(band == freqband)]) - self._times
-                )
+            self._times, self._delta_times = self._band_times(slice(None))
             # mask = self.file["TNR_BAND"][...] == 0
             # self._times = Time(np.take(self.file["Epoch"][...], mask, axis=0))
         return self._times
 
+    def _band_times(self, records: slice):
+        """Get the times (of band A) and the delta times of each band, for the given records."""
+        band = self._variable("TNR_BAND", records)
+        timeref = self._variable("Epoch", records)
+        # Get Epoch time values for Band A
+        times = Time(timeref[band == 0])
+        delta_times = {}
+        for i, freqband in enumerate(self.frequency_band_labels):
+            delta_times[freqband] = Time(timeref[band == i]) - times
+        return times, delta_times
+
+    @staticmethod
+    def _band_rank(band: np.ndarray) -> np.ndarray:
+        """Get the rank of each record among the records of the same band, i.e. the index of
+        its sweep."""
+        order = np.argsort(band, kind="stable")
+        band_start = np.searchsorted(band[order], band[order])
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(band)) - band_start
+        return rank
+
+    def _sweep_start(self, record: int) -> int:
+        """Get the first record of band A (i.e. the start of a sweep) from `record` on, or the
+        number of records if there is none (TNR_BAND is read by chunks of a few sweeps)."""
+        n_rec = len(self.file["TNR_BAND"])
+        while record < n_rec:
+            band = self._variable("TNR_BAND", slice(record, record + 16))
+            sweep_start = np.flatnonzero(band == 0)
+            if len(sweep_start) > 0:
+                return record + int(sweep_start[0])
+            record += len(band)
+        return n_rec
+
+    def _record_slice(self, time_range) -> slice:
+        """Get the slice of the CDF records of the sweeps starting within `time_range` (empty if
+        there is none).
+
+        The records within `time_range` are found with a binary search on Epoch (see
+        `_epoch_slice`), then extended to the sweeps starting there.
+        """
+        if time_range is None:
+            return slice(None)
+        records = self._epoch_slice(time_range)
+        start = self._sweep_start(records.start)
+        if start >= records.stop:
+            return slice(0, 0)
+        return slice(start, self._sweep_start(records.stop))
+
     @property
     def delta_times(self):
         if self._delta_times is None:
@@ -193,9 +208,12 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
     def dataset_keys(self):
         return self._dataset_keys
 
-    def as_xarray(self):
+    def as_xarray(self, time_range=None, freq_range=None):
         """
         Return the data as a xarray
+
+        :param time_range: if given, only the sweeps starting within this (start, end) range are read
+        :param freq_range: if given, only the frequencies within this (min, max) range are kept
         """
         import xarray
 
@@ -230,113 +248,58 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
             "HF_V3-V1",
         ]
 
-        bandtab = xarray.DataArray(
-            [self.frequency_band_labels[idx] for idx in self.file["TNR_BAND"][...]]
-        )
-        # timeref = self.file["Epoch"][...]
-
-        sensor_config = list(
-            map(
-                lambda configs: (
-                    self.sensor_mapping[configs[0]],
-                    self.sensor_mapping[configs[1]],
-                ),
-                self.file["SENSOR_CONFIG"][...],
-            )
-        )
-
-        tnr_frequency_bands = self.file["TNR_BAND_FREQ"][...]
-        # freq_index = range(tnr_frequency_bands.shape[1])
-        freq_index = tnr_frequency_bands.shape[1]
+        # Only the records of the sweeps within the time range are read
+        records = self._record_slice(time_range)
+        if records == slice(None):
+            times, delta_times = self.times, self.delta_times
+        else:
+            times, delta_times = self._band_times(records)
+
+        # Each record holds one band of a sweep: its sweep is given by its rank among the
+        # records of the same band
+        band = self._variable("TNR_BAND", records).astype(int)
+        rank = self._band_rank(band)
+        n_band = len(self.frequency_band_labels)
+        freq_index = self.file["TNR_BAND_FREQ"].shape[1]
+        shape = (len(times), n_band * freq_index)
 
-        # band_array_tmp = {}
-        # np.zeros([len(self.times), len(self.frequencies)])
-        # band_array_2 = np.zeros([len(self.times), len(self.frequencies)])
-        # for i in range(2):  # loop on channels
-
-        sensor_config = np.array(sensor_config)
-        for i, freqband in enumerate(self.frequency_band_labels):
-            # band_array_tmp[freqband+"_"+str(i)] = sensor_config[i][np.where(bandtab==freqband)]
-            if i == 0:
-                band_array_1 = np.tile(
-                    sensor_config[:, 0][np.where(bandtab == freqband)], (freq_index, 1)
-                ).transpose()
-                band_array_2 = np.tile(
-                    sensor_config[:, 1][np.where(bandtab == freqband)], (freq_index, 1)
-                ).transpose()
-            else:
-                band_array_1 = np.append(
-                    band_array_1,
-                    np.tile(
-                        sensor_config[:, 0][np.where(bandtab == freqband)],
-                        (freq_index, 1),
-                    ).transpose(),
-                    axis=1,
-                )
-                band_array_2 = np.append(
-                    band_array_2,
-                    np.tile(
-                        sensor_config[:, 1][np.where(bandtab == freqband)],
-                        (freq_index, 1),
-                    ).transpose(),
-                    axis=1,
-                )
-
-            # istart = 0 + freq_index*i
-            # iend = freq_index * (i + 1)
-            # band_array_1[:,istart:iend] = sensor_config[0][np.where(bandtab==freqband)]  # chan 1
-            # band_array_2[:,istart:iend] = sensor_config[1][np.where(bandtab==freqband)]  # chan 2
-
-        data_1 = self.file["AUTO1"][...]
-        data_2 = self.file["AUTO2"][...]
         try:
             fillval = self.file["AUTO1"].attrs["FILLVAL"]
         except KeyError:
             # If FILLVAL not found in variable attribute
             fillval = -1e31
-        data_array_1 = (
-            np.ones(
-                [
-                    len(bandtab[np.where(bandtab == "A")]),
-                    freq_index * len(self.frequency_band_labels),
-                ]
-            )
-            * fillval
+        # (the (sweep, band, frequency) views of the outputs are filled at once)
+        data_array_1 = np.full(shape, fillval, dtype=float)
+        data_array_1.reshape(-1, n_band, freq_index)[rank, band] = self._variable(
+            "AUTO1", records
         )
-        data_array_2 = (
-            np.ones(
-                [
-                    len(bandtab[np.where(bandtab == "A")]),
-                    freq_index * len(self.frequency_band_labels),
-                ]
-            )
-            * fillval
+        data_array_2 = np.full(shape, fillval, dtype=float)
+        data_array_2.reshape(-1, n_band, freq_index)[rank, band] = self._variable(
+            "AUTO2", records
         )
-        for i, freqband in enumerate(self.frequency_band_labels):
-            for j in range(freq_index):
-                # cond = bandtab==freqband
-                data_array_1[:, j + i * freq_index] = data_1[:, j][
-                    np.where(bandtab == freqband)
-                ]
-                data_array_2[:, j + i * freq_index] = data_2[:, j][
-                    np.where(bandtab == freqband)
-                ]
 
-        # frequency = self.file["FREQUENCY"][...]  # (n_time, n_freq)
-
-        for i, freqband in enumerate(self.frequency_band_labels):
-            if i == 0:
-                deltatimes = np.tile(
-                    self.delta_times[freqband].value, (freq_index, 1)
-                ).transpose()
-            else:
-                deltatimes = np.append(
-                    deltatimes,
-                    np.tile(
-                        self.delta_times[freqband].value, (freq_index, 1)
-                    ).transpose(),
-                    axis=1,
-                )
+        # Sensor codes of each (sweep, band), then their names for each frequency
+        sensor_config = self._variable("SENSOR_CONFIG", records)
+        sensor_codes = np.zeros((shape[0], n_band, 2), dtype=sensor_config.dtype)
+        sensor_codes[rank, band] = sensor_config
+        codes, inverse = np.unique(sensor_codes, return_inverse=True)
+        sensor_names = np.array([self.sensor_mapping[code] for code in codes])
+        sensor_names = sensor_names[inverse.reshape(sensor_codes.shape)]
+        band_array_1 = np.repeat(sensor_names[..., 0], freq_index, axis=1)
+        band_array_2 = np.repeat(sensor_names[..., 1], freq_index, axis=1)
+        sensor_code = {name: code for code, name in self.sensor_mapping.items()}
+
+        deltatimes = np.repeat(
+            np.stack(
+                [
+                    delta_times[freqband].value
+                    for freqband in self.frequency_band_labels
+                ],
+                axis=1,
+            ),
+            freq_index,
+            axis=1,
+        )
 
         try:
             unit_data = self.file["AUTO1"].attrs["UNITS"]
@@ -354,6 +317,9 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
             "DELTA_TIMES",
         ]
         """
+        # (the coordinates are converted once for all the keys)
+        frequencies = self.frequencies
+        time_values = times.to_datetime()
         dataset = {}
         firstloop = 1
         for key in dataset_keys:
@@ -373,14 +339,15 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
                 values = deltatimes.T
                 units = "jd"
             elif key in sensor_keys:
-                valuetmp = np.empty(data_array_1.T.shape)
-                valuetmp[:] = np.nan
-                # faster than np.where
-                loc1 = np.asarray(band_array_1.T == key).nonzero()
-                loc2 = np.asarray(band_array_2.T == key).nonzero()
-                valuetmp[loc1] = data_array_1.T[loc1]
-                valuetmp[loc2] = data_array_2.T[loc2]
-                values = valuetmp
+                values = np.full(shape, np.nan)
+                for channel, data_array in enumerate([data_array_1, data_array_2]):
+                    mask = np.repeat(
+                        sensor_codes[..., channel] == sensor_code[key],
+                        freq_index,
+                        axis=1,
+                    )
+                    values[mask] = data_array[mask]
+                values = values.T
                 units = unit_data
             else:
                 raise KeyError("Unknown key.")
@@ -391,10 +358,10 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
                     # "channel": self.channel_labels,
                     (
                         "frequency",
-                        self.frequencies.value,
-                        {"units": self.frequencies.unit},
+                        frequencies.value,
+                        {"units": frequencies.unit},
                     ),  # (["time", "freq_index"], frequency.data),
-                    ("time", self.times.to_datetime()),  # timeref,
+                    ("time", time_values),  # timeref,
                     # "freq_index": freq_index,
                     # "band": ("time", bandtab.data),
                     # "sensor": (["time", "channel"], sensor_config),
@@ -409,7 +376,9 @@ class RpwTnrSurv(CdfData, dataset="solo_L2_rpw-tnr-surv"):  # type: ignore
             else:
                 ds[key] = dataset[key]
 
-        return ds  # xarray.Dataset({"VOLTAGE_SPECTRAL_POWER": auto})
+        return self._select_range(
+            ds, freq_range=freq_range
+        )  # xarray.Dataset({"VOLTAGE_SPECTRAL_POWER": auto})
 
     def quicklook(
         self,
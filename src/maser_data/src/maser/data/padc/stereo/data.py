@@ -56,18 +56,16 @@ class StWavL3Cdf(CdfData, dataset="st__l3_wav"):  # type: ignore
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                units = cdf_file["FREQUENCY"].attrs["UNITS"]
-                freq = cdf_file["FREQUENCY"][...] * Unit(units)
-                self._frequencies = freq
+            units = self.file["FREQUENCY"].attrs["UNITS"]
+            freq = self._variable("FREQUENCY") * Unit(units)
+            self._frequencies = freq
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as cdf_file:
-                self._times = Time(cdf_file["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
@@ -82,7 +80,7 @@ class StWavL3Cdf(CdfData, dataset="st__l3_wav"):  # type: ignore
         for key in dataset_keys:
             data_vars[key] = (
                 ["frequency", "time"],
-                self.file[key][...].T,
+                self._variable(key).T,
                 {
                     "units": self.file[key].attrs["UNITS"],
                 },
@@ -25,18 +25,16 @@ class WindWavesRad1L3AkrData(CdfData, dataset="wi_wa_rad1_l3-akr"):  # type: ign
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                units = cdf_file["Frequency"].attrs["UNITS"]
-                freq = cdf_file["Frequency"][...] * Unit(units)
-                self._frequencies = freq
+            units = self.file["Frequency"].attrs["UNITS"]
+            freq = self._variable("Frequency") * Unit(units)
+            self._frequencies = freq
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as cdf_file:
-                self._times = Time(cdf_file["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     @property
@@ -48,11 +46,10 @@ class WindWavesRad1L3AkrData(CdfData, dataset="wi_wa_rad1_l3-akr"):  # type: ign
 
         for dataset_key in self._dataset_keys:
             # Sort out data and attributes
-            data_ext = self.file[dataset_key]
             data_attr = self.file[dataset_key].attrs
 
             # extract the data and replace the values at FILLVAL by NaN
-            data = data_ext[...]
+            data = self._variable(dataset_key)
             data = np.where(data == data_attr["FILLVAL"], np.nan, data)
 
             datasets[dataset_key] = xarray.DataArray(
@@ -122,18 +119,16 @@ class WindWavesRad1L3DfV01Data(CdfData, dataset="wi_wav_rad1_l3_df_v01"):  # typ
     @property
     def frequencies(self):
         if self._frequencies is None:
-            with self.open(self.filepath) as cdf_file:
-                units = cdf_file["FREQ"].attrs["UNITS"]
-                freq = cdf_file["FREQ"][...] * Unit(units)
-                self._frequencies = freq
+            units = self.file["FREQ"].attrs["UNITS"]
+            freq = self._variable("FREQ") * Unit(units)
+            self._frequencies = freq
         return self._frequencies
 
     @property
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as cdf_file:
-                self._times = Time(cdf_file["Epoch"][...])
+            self._times = Time(self._variable("Epoch"))
         return self._times
 
     def as_xarray(self):
@@ -157,7 +152,7 @@ class WindWavesRad1L3DfV02Data(CdfData, dataset="wi_wav_rad1_l3_df_v02"):  # typ
     def frequencies(self):
         if self._frequencies is None:
             units = self.file["FREQUENCY"].attrs["UNITS"]
-            freq = self.file["FREQUENCY"][...]
+            freq = self._variable("FREQUENCY")
             if self.access_mode == "sweeps":
                 freq = np.unique(np.sort(freq[:64]))
             self._frequencies = freq * Unit(units)
@@ -167,11 +162,10 @@ class WindWavesRad1L3DfV02Data(CdfData, dataset="wi_wav_rad1_l3_df_v02"):  # typ
     def times(self):
         if self._times is None:
             self._times = Time([], format="jd")
-            with self.open(self.filepath) as cdf_file:
-                times = Time(cdf_file["Epoch"][...])
-                if self.access_mode == "sweeps":
-                    times = times[::16]
-                self._times = times
+            times = Time(self._variable("Epoch"))
+            if self.access_mode == "sweeps":
+                times = times[::16]
+            self._times = times
         return self._times
 
     @property
@@ -186,9 +180,8 @@ class WindWavesRad1L3DfV02Data(CdfData, dataset="wi_wav_rad1_l3_df_v02"):  # typ
         nstep = len(self.frequencies)
 
         for dataset_key in self._dataset_keys:
-            data_ext = self.file[dataset_key]
-            data_attr = data_ext.attrs
-            data_raw = data_ext[...].reshape(nsweep_raw, nstep_raw)
+            data_attr = self.file[dataset_key].attrs
+            data_raw = self._variable(dataset_key).reshape(nsweep_raw, nstep_raw)
             data_raw = np.where(data_raw == data_attr["FILLVAL"], np.nan, data_raw)
 
             data = np.zeros((nstep, nsweep))
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""
+Module to process many data files (granules) in parallel.
+
+* `map_files` function: apply a function to data files with a pool of processes.
+* `FileResult` class: the result of the function for a file.
+* `ingest` function: convert data files into numpy arrays (.npz files) in parallel.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Union
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from multiprocessing import Array, resource_tracker, shared_memory
+from pathlib import Path
+import logging
+import pickle
+import weakref
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+
+class FileResult(NamedTuple):
+    """Result of a function for a file: `value` is None and `error` is the exception raised
+    if the function failed."""
+
+    filepath: Path
+    value: Any = None
+    error: Union[None, BaseException] = None
+
+
+class _SharedArray(NamedTuple):
+    """Reference to a numpy array written in the shared memory block of the results."""
+
+    page: int
+    shape: tuple
+    dtype: str
+
+
+class _PickledArray(NamedTuple):
+    """A numpy array sent back as is, as there was no room left for it in the shared memory
+    block of the results."""
+
+    array: numpy.ndarray
+
+
+# size (in bytes) of the pages of the shared memory block
+_PAGE_SIZE = 64 * 2**10
+
+# shared memory block of the results, and the shared table of its used pages (in the worker
+# processes)
+_block: Union[None, shared_memory.SharedMemory] = None
+_pages: Any = None
+
+
+def _init_worker(name: str, pages):
+    """Attach the worker process to the shared memory block of the results."""
+    global _block, _pages
+    _block = shared_memory.SharedMemory(name=name)
+    _pages = pages
+
+
+def _page_count(nbytes: int) -> int:
+    return -(-nbytes // _PAGE_SIZE)
+
+
+def _allocate_pages(count: int) -> Union[None, int]:
+    """Mark the first run of `count` free pages of the shared memory block as used.
+
+    :return: the index of the first page of the run, or None if there is no such run
+    """
+    with _pages.get_lock():
+        table = numpy.frombuffer(_pages.get_obj(), dtype=numpy.int8)
+        edges = numpy.flatnonzero(numpy.diff(numpy.r_[1, table, 1] == 0))
+        starts, ends = edges[::2], edges[1::2]
+        runs = numpy.flatnonzero(ends - starts >= count)
+        if len(runs) == 0:
+            return None
+        first = int(starts[runs[0]])
+        table[first : first + count] = 1
+    return first
+
+
+def _release_pages(pages, first: int, count: int):
+    """Mark pages of the shared memory block as free."""
+    with pages.get_lock():
+        numpy.frombuffer(pages.get_obj(), dtype=numpy.int8)[first : first + count] = 0
+
+
+def _to_shared(value):
+    """Write the numpy arrays of a value (an array, or a dict/list/tuple of arrays) into free
+    pages of the shared memory block of the results, so that only references are sent back to
+    the parent process (the arrays which do not fit in the block are sent back as is)."""
+    if (
+        isinstance(value, numpy.ndarray)
+        and value.dtype.kind not in "OV"
+        and value.nbytes > 0
+    ):
+        page = _allocate_pages(_page_count(value.nbytes))
+        if page is None:
+            return _PickledArray(value)
+        numpy.ndarray(
+            value.shape,
+            dtype=value.dtype,
+            buffer=_block.buf,
+            offset=page * _PAGE_SIZE,
+        )[...] = value
+        return _SharedArray(page, value.shape, value.dtype.str)
+    elif isinstance(value, dict):
+        return {k: _to_shared(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return type(value)(_to_shared(v) for v in value)
+    return value
+
+
+class _ResultPages(numpy.ndarray):
+    """Memory of the shared memory block of the results. As a distinct type, numpy keeps the
+    pages of an array of the results in its bases (and those of its views), so that they are
+    only released with the array."""
+
+
+class _ResultBlock:
+    """Shared memory block of the results, created by the parent process.
+
+    The workers write the arrays of the results into free pages of the block, and the parent
+    process gets them as views into the block, without copying them. The pages of an array are
+    released (to be used for the next results) when the array is released, and the block is
+    unmapped when all the arrays are released.
+    """
+
+    def __init__(self, size: int):
+        self.pages = Array("b", max(_page_count(size), 1))
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=len(self.pages) * _PAGE_SIZE
+        )
+        self.buffer = _ResultPages(
+            (self.shm.size,), dtype=numpy.uint8, buffer=self.shm.buf
+        )
+        weakref.finalize(self.buffer, self.shm.close).atexit = False
+        self.full = False
+
+    def from_shared(self, value):
+        """Get the numpy arrays of a value sent back by a worker."""
+        if isinstance(value, _SharedArray):
+            dtype = numpy.dtype(value.dtype)
+            count = _page_count(int(numpy.prod(value.shape)) * dtype.itemsize)
+            start = value.page * _PAGE_SIZE
+            pages = self.buffer[start : start + count * _PAGE_SIZE]
+            weakref.finalize(
+                pages, _release_pages, self.pages, value.page, count
+            ).atexit = False
+            return numpy.ndarray(value.shape, dtype=dtype, buffer=pages)
+        elif isinstance(value, _PickledArray):
+            if not self.full:
+                logger.warning(
+                    "The shared memory block of the results is full, the arrays which do "
+                    "not fit are pickled (consider releasing the results, or a larger "
+                    "shared_size)."
+                )
+                self.full = True
+            return value.array
+        elif isinstance(value, dict):
+            return {k: self.from_shared(v) for k, v in value.items()}
+        elif isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+            return type(value)(self.from_shared(v) for v in value)
+        return value
+
+
+def _run_chunk(func: Callable, filepaths: List[Path]) -> List[FileResult]:
+    """Apply the function to a chunk of files (in a worker process), the errors being caught
+    for each file."""
+    results = []
+    for filepath in filepaths:
+        try:
+            value = func(filepath)
+            if _block is not None:
+                value = _to_shared(value)
+            results.append(FileResult(filepath, value))
+        except Exception as err:
+            try:
+                pickle.dumps(err)
+            except Exception:
+                # the error must be sent back to the parent process
+                err = RuntimeError(repr(err))
+            results.append(FileResult(filepath, error=err))
+    return results
+
+
+def map_files(
+    func: Callable,
+    filepaths: Iterable[Union[str, Path]],
+    workers: Union[None, int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    shared: bool = True,
+    shared_size: int = 256 * 2**20,
+) -> Iterator[FileResult]:
+    """Apply a function to data files with a pool of processes.
+
+    The files are sent to the workers by chunks of `chunksize` files. An error raised by the
+    function for a file does not stop the processing: it is returned in the `error` field of
+    the result of this file.
+
+    The numpy arrays returned by the function (as is, or in a dict, list or tuple) are sent
+    back through shared memory instead of being pickled: the workers write them into a shared
+    memory block of `shared_size` bytes created by this process, and the arrays of the results
+    are views into this block. The space of an array in the block is reused for the next
+    results once the array is released, so that the block only has to hold the results in
+    use. The arrays which do not fit in the free space of the block are pickled (a warning is
+    then logged).
+
+    :param func: the function, taking a file path (it must be picklable, e.g. a module-level
+                 function)
+    :param filepaths: the file paths
+    :param workers: the number of worker processes (default is the number of CPUs). If 1, the
+                    files are processed in the current process.
+    :param chunksize: the number of files sent at once to a worker
+    :param ordered: if True, the results are yielded in the order of `filepaths`, otherwise
+                    as soon as they are available
+    :param shared: if True, the numpy arrays are sent back through shared memory
+    :param shared_size: the size (in bytes) of the shared memory block
+    :return: an iterator of FileResult objects
+    """
+    filepaths = [Path(filepath) for filepath in filepaths]
+    chunks = [filepaths[i : i + chunksize] for i in range(0, len(filepaths), chunksize)]
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(func, chunk)
+        return
+
+    # the workers must share the resource tracker of this process, which releases the shared
+    # memory block if this process dies
+    resource_tracker.ensure_running()
+    block: Union[None, _ResultBlock] = None
+    pool_kwargs: Dict[str, Any] = {}
+    if shared:
+        block = _ResultBlock(shared_size)
+        pool_kwargs = dict(
+            initializer=_init_worker, initargs=(block.shm.name, block.pages)
+        )
+    try:
+        with ProcessPoolExecutor(max_workers=workers, **pool_kwargs) as executor:
+            futures = {
+                executor.submit(_run_chunk, func, chunk): chunk for chunk in chunks
+            }
+            for future in futures if ordered else as_completed(futures):
+                try:
+                    results = future.result()
+                    if block is not None:
+                        results = [
+                            result._replace(value=block.from_shared(result.value))
+                            for result in results
+                        ]
+                except Exception as err:
+                    # the worker process itself has failed
+                    results = [
+                        FileResult(filepath, error=err) for filepath in futures[future]
+                    ]
+                yield from results
+    finally:
+        if block is not None:
+            block.shm.unlink()
+
+
+def as_arrays(
+    filepath: Path, dataset: Union[None, str] = "__auto__"
+) -> Dict[str, numpy.ndarray]:
+    """Get the variables and coordinates of `Data(filepath).as_xarray()` as numpy arrays."""
+    from maser.data import Data
+
+    with Data(filepath, dataset=dataset) as data:
+        xr = data.as_xarray()
+    return {name: numpy.asarray(xr[name].values) for name in xr.variables}
+
+
+def ingest(
+    filepaths: Iterable[Union[str, Path]],
+    output_dir: Union[str, Path],
+    dataset: Union[None, str] = "__auto__",
+    workers: Union[None, int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> List[Path]:
+    """Convert data files into .npz files (one per data file, named after it and holding the
+    variables and coordinates of its `as_xarray()` dataset), using a pool of processes.
+
+    :param filepaths: the data file paths
+    :param output_dir: the directory of the .npz files
+    :param dataset: the dataset of the data files (guessed from each file if "__auto__")
+    :param workers: the number of worker processes (default is the number of CPUs)
+    :param chunksize: the number of files sent at once to a worker
+    :param ordered: if True, the files are written in the order of `filepaths`
+    :return: the list of the data files which could not be converted
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for result in map_files(
+        partial(as_arrays, dataset=dataset),
+        filepaths,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    ):
+        if result.error is not None:
+            logger.error(f"Converting {result.filepath} has failed! ({result.error})")
+            failed.append(result.filepath)
+            continue
+        output_file = output_dir / (result.filepath.name + ".npz")
+        numpy.savez(output_file, **result.value)
+        logger.info(f"{output_file} saved")
+    return failed
@@ -28,24 +28,32 @@ Classes for PDS datasets.
 
 """
 
-from .data import (  # noqa: F401
-    Pds3Data,
-)
-from .vg import (  # noqa: F401
-    Vg1JPra3RdrLowband6secV1Data,
-    Vg1JPra4SummBrowse48secV1Data,
-    Vg1SPra3RdrLowband6secV1Data,
-    Vg2JPra4SummBrowse48secV1Data,
-    Vg2NPra2RdrHighrate60msV1Data,
-    Vg2NPra3RdrLowband6secV1Data,
-    Vg2NPra4SummBrowse48secV1Data,
-    Vg2UPra3RdrLowband6secV1Data,
-    Vg2UPra4SummBrowse48secV1Data,
-    VgPra3RdrLowband6secV1Sweep,
-    VgPra3RdrLowband6secV1Sweeps,
-    VgPra4SummBrowse48secV1Sweeps,
-)
-from .co import (  # noqa: F401
-    CoVEJSSSRpws2RefdrWbrFullV1Data,
-    CoVEJSSSRpws3RdrLrFullV1Data,
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".data": [
+        "Pds3Data",
+    ],
+    ".vg": [
+        "Vg1JPra3RdrLowband6secV1Data",
+        "Vg1JPra4SummBrowse48secV1Data",
+        "Vg1SPra3RdrLowband6secV1Data",
+        "Vg2JPra4SummBrowse48secV1Data",
+        "Vg2NPra2RdrHighrate60msV1Data",
+        "Vg2NPra3RdrLowband6secV1Data",
+        "Vg2NPra4SummBrowse48secV1Data",
+        "Vg2UPra3RdrLowband6secV1Data",
+        "Vg2UPra4SummBrowse48secV1Data",
+        "VgPra3RdrLowband6secV1Sweep",
+        "VgPra3RdrLowband6secV1Sweeps",
+        "VgPra4SummBrowse48secV1Sweeps",
+    ],
+    ".co": [
+        "CoVEJSSSRpws2RefdrWbrFullV1Data",
+        "CoVEJSSSRpws3RdrLrFullV1Data",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
@@ -248,6 +248,8 @@ class PDSDataTableColumnHeader:
         if self.verbose:
             print(self.np_data_type)
 
+        self.np_dtype = self._get_np_dtype()
+
     def _get_np_data_type(self):
         struct_to_np_data_type = {
             "b": numpy.int8,
@@ -264,6 +266,18 @@ class PDSDataTableColumnHeader:
         }
         return struct_to_np_data_type[self.struct_format[-1]]
 
+    def _get_np_dtype(self):
+        """Get the numpy dtype of the column in a binary table row (with its byte order and its
+        item count), to be used as a field of the row structured dtype."""
+        endianess, data_type = self.struct_format[0], self.struct_format[-1]
+        if data_type == "c":
+            item_dtype = numpy.dtype("S1")
+        else:
+            item_dtype = numpy.dtype(endianess + data_type)
+        if self.n_items == 1:
+            return item_dtype
+        return numpy.dtype((item_dtype, (int(self.n_items),)))
+
     def _get_struct_format(self):
         data_type = ""
         endianess = ""
@@ -371,84 +385,82 @@ class PDSDataTableObject(dict):
                 )
             )
 
+    @property
+    def row_dtype(self) -> numpy.dtype:
+        """Structured dtype of the rows of a binary table, with a field per column (at its
+        START_BYTE offset) and the ROW_PREFIX_BYTES and ROW_SUFFIX_BYTES padding."""
+        row_bytes = int(self.label["ROW_BYTES"])
+        if "ROW_PREFIX_BYTES" in self.label.keys():
+            row_bytes += int(self.label["ROW_PREFIX_BYTES"])
+        if "ROW_SUFFIX_BYTES" in self.label.keys():
+            row_bytes += int(self.label["ROW_SUFFIX_BYTES"])
+
+        # (the fields are not named after the columns, as column names may be repeated)
+        return numpy.dtype(
+            {
+                "names": [f"f{ii}" for ii in range(len(self.columns))],
+                "formats": [cur_col.np_dtype for cur_col in self.columns],
+                "offsets": [cur_col.start_byte for cur_col in self.columns],
+                "itemsize": row_bytes,
+            }
+        )
+
     def _load_data_ascii(self):
         with open(self.filepath, "r") as f:
-            for ii, line in enumerate(f.readlines()):
-                for cur_col in self.columns:
-                    cur_name = cur_col.name
-                    cur_byte_start = int(cur_col.start_byte)
-                    cur_byte_length = int(cur_col.bytes)
-                    if cur_col.n_items == 1:
-                        if self.verbose:
-                            print(
-                                "Loading... {}[{}] from bytes {}:{}".format(
-                                    cur_name,
-                                    ii,
-                                    cur_byte_start,
-                                    cur_byte_start + cur_byte_length,
-                                )
-                            )
-                        self[cur_name][ii] = line[
-                            cur_byte_start : cur_byte_start + cur_byte_length
-                        ]
-                    else:
-                        for cur_item in range(cur_col.n_items):
-                            if self.verbose:
-                                print(
-                                    "Loading... {}[{}, {}] from bytes {}:{}".format(
-                                        cur_name,
-                                        ii,
-                                        cur_item,
-                                        cur_byte_start,
-                                        cur_byte_start + cur_byte_length,
-                                    )
-                                )
-                            self[cur_name][ii, cur_item] = line[
-                                cur_byte_start : cur_byte_start + cur_byte_length
-                            ]
-                            cur_byte_start += cur_byte_length
-
-    def _load_data_binary(self):
-        import struct
+            lines = numpy.array(f.readlines(), dtype=numpy.str_)
+        if len(lines) == 0:
+            return
+
+        # characters of the rows (padded to cover all the columns), so that a fixed-width
+        # field is sliced out of all the rows at once
+        row_length = max(
+            int(cur_col.start_byte) + int(cur_col.n_items) * int(cur_col.bytes)
+            for cur_col in self.columns
+        )
+        chars = numpy.zeros(
+            (len(lines), max(row_length, lines.itemsize // 4)), dtype="U1"
+        )
+        chars[:, : lines.itemsize // 4] = lines.view("U1").reshape(len(lines), -1)
 
-        with open(self.filepath, "rb") as f:
-            f.seek(self.offset)
-
-            buf_length = int(self.label["ROW_BYTES"])
-            if "ROW_PREFIX_BYTES" in self.label.keys():
-                buf_length += int(self.label["ROW_PREFIX_BYTES"])
-            if "ROW_SUFFIX_BYTES" in self.label.keys():
-                buf_length += int(self.label["ROW_SUFFIX_BYTES"])
-
-            for ii in range(self.n_rows):
-                buf_data = f.read(buf_length)
+        for cur_col in self.columns:
+            cur_byte_start = int(cur_col.start_byte)
+            cur_byte_length = int(cur_col.bytes)
+            if self.verbose:
+                print(
+                    "Loading... {} from bytes {}:{} ({} items)".format(
+                        cur_col.name,
+                        cur_byte_start,
+                        cur_byte_start + cur_byte_length,
+                        cur_col.n_items,
+                    )
+                )
+            for cur_item in range(int(cur_col.n_items)):
+                field = numpy.ascontiguousarray(
+                    chars[:, cur_byte_start : cur_byte_start + cur_byte_length]
+                ).view(f"U{cur_byte_length}")[:, 0]
+                if cur_col.n_items == 1:
+                    self[cur_col.name][:] = field
+                else:
+                    self[cur_col.name][:, cur_item] = field
+                cur_byte_start += cur_byte_length
 
-                for cur_col in self.columns:
-                    cur_name = cur_col.name
-                    cur_byte_start = int(cur_col.start_byte)
-                    cur_byte_length = int(cur_col.bytes)
+    def _load_data_binary(self):
+        row_dtype = self.row_dtype
+        if self.verbose:
+            print("Loading... {} rows with dtype: {}".format(self.n_rows, row_dtype))
 
-                    if self.verbose:
-                        print(
-                            "Loading... {}[{}] from bytes {}:{} of buffer({} bytes) with format: {}".format(
-                                cur_name,
-                                ii,
-                                cur_byte_start,
-                                cur_byte_start + cur_byte_length,
-                                buf_length,
-                                cur_col.struct_format,
-                            )
-                        )
-
-                    line = struct.unpack(
-                        cur_col.struct_format,
-                        buf_data[cur_byte_start : cur_byte_start + cur_byte_length],
-                    )
+        rows = numpy.fromfile(
+            self.filepath, dtype=row_dtype, count=self.n_rows, offset=self.offset
+        )
+        if len(rows) < self.n_rows:
+            raise ValueError(
+                "Truncated data file ({} rows found, {} expected)".format(
+                    len(rows), self.n_rows
+                )
+            )
 
-                    if cur_col.n_items == 1:
-                        self[cur_name][ii] = line[0]
-                    else:
-                        self[cur_name][ii, :] = line
+        for ii, cur_col in enumerate(self.columns):
+            self[cur_col.name][...] = rows[f"f{ii}"]
 
     def __repr__(self):
         return f"<PDSTableObject: {self.data_set_id}/{self.product_id} ({self.n_rows} rows x {self.n_columns} columns)>"
@@ -22,13 +22,21 @@ Classes for PSA datasets.
 
 """
 
-from .mex import (  # noqa: F401
-    MexMMarsis3RdrAisV1Data,
-    MexMMarsis3RdrAisExt1V1Data,
-    MexMMarsis3RdrAisExt2V1Data,
-    MexMMarsis3RdrAisExt3V1Data,
-    MexMMarsis3RdrAisExt4V1Data,
-    MexMMarsis3RdrAisExt5V1Data,
-    MexMMarsis3RdrAisExt6V1Data,
-    MexMMarsis3RdrAisV1Sweep,
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".mex": [
+        "MexMMarsis3RdrAisV1Data",
+        "MexMMarsis3RdrAisExt1V1Data",
+        "MexMMarsis3RdrAisExt2V1Data",
+        "MexMMarsis3RdrAisExt3V1Data",
+        "MexMMarsis3RdrAisExt4V1Data",
+        "MexMMarsis3RdrAisExt5V1Data",
+        "MexMMarsis3RdrAisExt6V1Data",
+        "MexMMarsis3RdrAisV1Sweep",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
 )
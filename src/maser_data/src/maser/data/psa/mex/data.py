@@ -17,7 +17,6 @@ from .consts import (
 from ...psa.labels import FMT_LABELS
 from astropy.time import Time
 from astropy.units import Unit
-from datetime import datetime
 import numpy
 
 
@@ -40,27 +39,27 @@ class MexMMarsis3RdrAisV1Sweep(Sweep):
 class MexMMarsis3RdrAisV1Sweeps(Sweeps):
     @property
     def generator(self):
-        for sweep_id, sweep_mask in self.data_reference.sweep_mapping.items():
+        table = self.data_reference.table
+        times = self.data_reference.times
+        for sweep_id, sweep_rows in self.data_reference.sweep_mapping.items():
             if self.data_reference.fixed_frequencies:
                 freqs = self.data_reference.frequencies
             else:
                 freqs = self.data_reference.frequencies[sweep_id]
-            table = self.data_reference.table
-            times = self.data_reference.times
             header = {
                 "process_id": MEX_MARSIS_AIS_PROCESS_IDS[
-                    table["PROCESS_ID"][sweep_mask][0]
+                    table["PROCESS_ID"][sweep_rows][0]
                 ],
-                "attenuation": table["RECEIVER_ATTENUATION"][sweep_mask],
-                "band_number": table["BAND_NUMBER"][sweep_mask],
-                "transmit_power": table["TRANSMIT_POWER"][sweep_mask][0],
+                "attenuation": table["RECEIVER_ATTENUATION"][sweep_rows],
+                "band_number": table["BAND_NUMBER"][sweep_rows],
+                "transmit_power": table["TRANSMIT_POWER"][sweep_rows][0],
             }
             header.update(
-                decode_instrument_mode(table["INSTRUMENT_MODE"][sweep_mask][0])
+                decode_instrument_mode(table["INSTRUMENT_MODE"][sweep_rows][0])
             )
             yield MexMMarsis3RdrAisV1Sweep(
                 header,
-                table["SPECTRAL_DENSITY"][sweep_mask],
+                table["SPECTRAL_DENSITY"][sweep_rows],
                 times[sweep_id],
                 freqs,
             )
@@ -99,7 +98,9 @@ class MexMMarsis3RdrAisV1Data(
         self.table = PDSDataTableObject(
             self.label["AIS_TABLE"], self.pointers["AIS_TABLE"]["file_name"]
         )
-        self.sweep_mapping: Dict[int, bool] = {}
+        self.sweep_mapping: Dict[int, slice] = {}
+        # row indices of the sweep starts, followed by the number of rows
+        self._sweep_bounds = numpy.zeros(1, dtype=int)
         if self._load_data:
             self.load_data()
 
@@ -107,55 +108,58 @@ class MexMMarsis3RdrAisV1Data(
         self.table.load_data()
         self._load_data = True
 
-        msec0 = self.table["SCET_MSEC"][0]
-        sweep_number = [0]
-        for msec in self.table["SCET_MSEC"][1:]:
-            if msec == msec0:
-                sweep_number.append(sweep_number[-1])
-            else:
-                msec0 = msec
-                sweep_number.append(sweep_number[-1] + 1)
-        sweep_number = numpy.array(sweep_number)
-        for sweep_id in sorted(set(sweep_number)):
-            self.sweep_mapping[sweep_id] = sweep_number == sweep_id
+        # a new sweep starts at each change of SCET_MSEC, the rows of a sweep being
+        # contiguous in the table
+        msec = self.table["SCET_MSEC"]
+        self._sweep_bounds = numpy.concatenate(
+            ([0], numpy.flatnonzero(numpy.diff(msec) != 0) + 1, [len(msec)])
+        )
+        if len(msec) == 0:
+            self._sweep_bounds = self._sweep_bounds[1:]
+        self.sweep_mapping = {
+            sweep_id: slice(start, stop)
+            for sweep_id, (start, stop) in enumerate(
+                zip(self._sweep_bounds[:-1].tolist(), self._sweep_bounds[1:].tolist())
+            )
+        }
 
     @property
-    def _sweep_masks(self):
+    def _sweep_slices(self):
         for item in self.sweep_mapping.items():
             yield item[1]
 
     @property
     def times(self):
         if self._times is None:
-            _times = Time([], format="jd")
             if self._load_data is False:
                 self.load_data()
-            _times = [
-                datetime.strptime(
-                    "".join(self.table["SCET_STRING"][sweep_mask, :][0]).strip(),
-                    "%Y-%jT%H:%M:%S.%f",
-                )
-                for sweep_mask in self._sweep_masks
-            ]
-            self._times = Time(_times)
+            # SCET_STRING of the first row of each sweep, from characters to strings
+            scet = numpy.ascontiguousarray(
+                self.table["SCET_STRING"][self._sweep_bounds[:-1]]
+            )
+            scet = scet.view(f"U{scet.shape[1]}")[:, 0]
+            # from "YYYY-DDDTHH:MM:SS.fff" to the "yday" format of astropy
+            scet = numpy.char.replace(numpy.char.strip(scet), "-", ":")
+            scet = numpy.char.replace(scet, "T", ":")
+            self._times = Time(scet, format="yday", scale="utc")
+            self._times.format = "datetime"
         return self._times
 
     @property
     def frequencies(self):
         if self._frequencies is None:
             if self._load_data is False:
-                self.table.load_data()
-                self._load_data = True
+                self.load_data()
             freq_table_nb = self.table["FREQUENCY_TABLE_NUMBER"]
             if len(set(freq_table_nb)) == 1:
                 self._frequencies = self.table["FREQUENCY"][
-                    next(self._sweep_masks)
+                    next(self._sweep_slices)
                 ] * Unit("Hz")
             else:
                 self.fixed_frequencies = False
                 self._frequencies = [
-                    self.table["FREQUENCY"][sweep_mask] * Unit("Hz")
-                    for sweep_mask in self._sweep_masks
+                    self.table["FREQUENCY"][sweep_rows] * Unit("Hz")
+                    for sweep_rows in self._sweep_slices
                 ]
         return self._frequencies
 
@@ -167,9 +171,20 @@ class MexMMarsis3RdrAisV1Data(
         import xarray
 
         datasets = {}
+        times = self.times.to_datetime()
+        frequencies = self.frequencies
+        sweep_lengths = numpy.diff(self._sweep_bounds)
 
         for dataset_key in self._initial_dataset_keys:
-            data = numpy.array([item.data for item in self.sweeps])  # .T,
+            if len(sweep_lengths) > 0 and numpy.all(sweep_lengths == sweep_lengths[0]):
+                # sweeps of the same length: (sweeps, frequencies, samples) view of the table
+                data = self.table[dataset_key].reshape(
+                    len(sweep_lengths), sweep_lengths[0], -1
+                )
+            else:
+                data = numpy.array(
+                    [self.table[dataset_key][rows] for rows in self._sweep_slices]
+                )
             data_avg = numpy.mean(data, axis=2)
             data_med = numpy.median(data, axis=2)
             data_min = numpy.min(data, axis=2)
@@ -179,32 +194,32 @@ class MexMMarsis3RdrAisV1Data(
                     dkey = dataset_key + "_AVG"
                     datatab = data_avg.T
                     coords = [
-                        ("frequency", self.frequencies, {"units": "kHz"}),
-                        ("time", self.times.to_datetime()),
+                        ("frequency", frequencies, {"units": "kHz"}),
+                        ("time", times),
                     ]
                     dims = ("frequency", "time")
                 elif i == 1:
                     dkey = dataset_key + "_MED"
                     datatab = data_med.T
                     coords = [
-                        ("frequency", self.frequencies, {"units": "kHz"}),
-                        ("time", self.times.to_datetime()),
+                        ("frequency", frequencies, {"units": "kHz"}),
+                        ("time", times),
                     ]
                     dims = ("frequency", "time")
                 elif i == 2:
                     dkey = dataset_key + "_MIN"
                     datatab = data_min.T
                     coords = [
-                        ("frequency", self.frequencies, {"units": "kHz"}),
-                        ("time", self.times.to_datetime()),
+                        ("frequency", frequencies, {"units": "kHz"}),
+                        ("time", times),
                     ]
                     dims = ("frequency", "time")
                 elif i == 3:
                     dkey = dataset_key + "_MAX"
                     datatab = data_max.T
                     coords = [
-                        ("frequency", self.frequencies, {"units": "kHz"}),
-                        ("time", self.times.to_datetime()),
+                        ("frequency", frequencies, {"units": "kHz"}),
+                        ("time", times),
                     ]
                     dims = ("frequency", "time")
                 else:
@@ -218,8 +233,8 @@ class MexMMarsis3RdrAisV1Data(
                     dkey = dataset_key
                     datatab = numpy.transpose(data, (1, 0, 2))
                     coords = [
-                        ("frequency", self.frequencies, {"units": "kHz"}),
-                        ("time", self.times.to_datetime()),
+                        ("frequency", frequencies, {"units": "kHz"}),
+                        ("time", times),
                         ("sample", range(data.shape[2])),
                     ]
                     dims = ("frequency", "time", "sample")
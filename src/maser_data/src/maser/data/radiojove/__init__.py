@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+Classes for RadioJOVE datasets.
+
+.. list-table:: Dataset Table
+   :widths: 20 20 20 20 10 10
+   :header-rows: 1
+
+   * - Observatory
+     - Instrument
+     - Repository
+     - Dataset-id
+     - Format
+     - Requires
+   * - RadioJOVE
+     - Skypipe SPS/SPD
+     - N/A
+     - `radiojove_sps`
+     - Bin
+     - N/A
+
+"""
+
+from maser.data.base.registry import _lazy_exports
+
+# the classes are only imported when they are used
+_exports = {
+    ".data": [
+        "RadioJoveSpxData",
+        "RadioJoveSpsData",
+        "RadioJoveSpsSweeps",
+        "RadioJoveSpsSweep",
+        "RadioJoveCdfData",
+    ],
+}
+__getattr__, __dir__ = _lazy_exports(
+    __name__, {name: module for module, names in _exports.items() for name in names}
+)
@@ -2,18 +2,293 @@
 from pathlib import Path
 from typing import Union
 from maser.data.base import BinData, CdfData
+from maser.data.base.sweeps import Sweeps, Sweep
 
-# from astropy.units import Quantity, Unit
+from astropy.units import Unit
 from astropy.time import Time
 import numpy as np
+import re
 import struct
+import warnings
+
+# end of sweep delimiter of the SPS files
+SPS_SWEEP_DELIMITER = 0xFEFE
+
+# julian date of the origin of the Skypipe dates (1899-12-30 00:00)
+SPX_JD_ORIGIN = 2415018.5
+
+
+# keys of the SPS header notes (see http://www.radiosky.com/skypipehelp/V2/datastructure.html)
+# CHECK LIST WITH https://voparis-confluence.obspm.fr/display/JOVE/RadioSky+Spectrograph-SPS+Metadata
+SPS_NOTE_KEYS = [
+    "SWEEPS",
+    "LOWF",
+    "HIF",
+    "STEPS",
+    "RCVR",
+    "DUALSPECFILE",
+    "COLORRES",
+    "BANNER",
+    "ANTENNATYPE",
+    "ANTENNAORIENTATION",
+    "COLORFILE",
+    "COLOROFFSET",
+    "COLORGAIN",
+    "CORRECTIONFILENAME",
+    "CAXF",
+    "CAX1",
+    "CAX2",
+    "CLOCKMSG",
+]
+
+# SPS note keys with multiple values
+SPS_NOTE_MULTI_KEYS = [
+    "BANNER",
+    "COLOROFFSET",
+    "COLORGAIN",
+    "CAXF",
+    "CAX1",
+    "CAX2",
+    "CLOCKMSG",
+]
+
+# SPS note keys with integer values
+SPS_NOTE_INT_KEYS = ["SWEEPS", "STEPS", "RCVR", "COLORRES", "COLOROFFSET"]
+
+# SPS note keys with floating point values
+SPS_NOTE_FLOAT_KEYS = ["LOWF", "HIF", "COLORGAIN"]
+
+# matches the known key at the start of a SPS note item (the longest keys are tried first)
+_SPS_NOTE_KEY_REGEX = re.compile(
+    "|".join(sorted(map(re.escape, SPS_NOTE_KEYS), key=len, reverse=True))
+)
+
+
+def _spx_days_to_datetime64(days: np.ndarray) -> np.ndarray:
+    """Convert Skypipe dates (decimal days since 1899-12-30 00:00, i.e. days of 86400 seconds)
+    into datetime64[ns] values."""
+    return np.datetime64("1899-12-30", "ns") + np.round(days * 86400e9).astype("m8[ns]")
+
+
+def _decode_spx_header(hdr_raw: bytes) -> dict:
+    """Decode the 156-byte primary header of a SPS or SPD file (the start and stop dates are
+    only given as julian dates)."""
+    hdr_fmt = "<10s6d1h10s20s20s40s1h1i"  # header format to unpack header
+    hdr_values = struct.unpack(hdr_fmt, hdr_raw[0:156])
+
+    header = dict(sft=hdr_values[0].decode("ascii"))
+    # date conversion: header dates are given in decimal days since 30/12/1899 00:00 (early morning!) == day 0.0
+    # date values must be corrected by adding 2415018.5 = julian date 30/12/1899 00:00
+    header["start_jdtime"] = hdr_values[1] + SPX_JD_ORIGIN
+    header["stop_jdtime"] = hdr_values[2] + SPX_JD_ORIGIN
+    header["latitude"] = hdr_values[3]
+    header["longitude"] = hdr_values[4]
+    header["chartmax"] = hdr_values[5]
+    header["chartmin"] = hdr_values[6]
+    header["timezone"] = hdr_values[7]
+    # For the next 4 header keywords, we remove leading and trailing null (0x00) and space characters
+    header["source"] = (hdr_values[8].decode("ascii").strip("\x00")).strip(" ")
+    header["author"] = (hdr_values[9].decode("ascii").strip("\x00")).strip(" ")
+    header["obsname"] = (hdr_values[10].decode("ascii").strip("\x00")).strip(" ")
+    header["obsloc"] = (hdr_values[11].decode("ascii").strip("\x00")).strip(" ")
+    header["nchannels"] = hdr_values[12]
+    header["note_length"] = hdr_values[13]
+    return header
+
+
+def _decode_sps_notes(raw_notes: bytes, debug: bool = False) -> dict:
+    """Decode the notes of a SPS file (spectrograph)."""
+    notes = dict()
+
+    # The header notes are composed of a series of key and value (KV) pairs.
+    # The raw notes start with a free text space.
+    # The KV pairs section are starting *[[* and finishes with *]]*.
+    # The delimiter between each KV pair is 0xFF.
+    # There is no predefined character for separating key and value within a KV pair.
+    # We must then identify the keys. Some keys have multiple values.
+    # More info: http://www.radiosky.com/skypipehelp/V2/datastructure.html
+
+    # stripping raw note text stream from "*[[*" and "*]]*" delimiters, and splitting with '\xff'
+    # (the text after the last delimiter is not a note item)
+    start_index = raw_notes.find(b"*[[*")
+    stop_index = raw_notes.find(b"*]]*")
+    notes["free_text"] = raw_notes[0:start_index].decode("ascii")
+    note_list = raw_notes[start_index + 4 : stop_index].split(b"\xff")[:-1]
+
+    # Looping on note items to identify what keys are present
+    for item in note_list:
+
+        note_item = item.decode("ascii")
+
+        if debug:
+            print("Current Item = {}".format(note_item))
+
+        # checking if current note item starts with a known key item
+        match = _SPS_NOTE_KEY_REGEX.match(note_item)
+        if match is None:
+            continue
+        key_item = match.group()
+
+        # getting length of key name
+        key_len = len(key_item)
+
+        if debug:
+            print("Detected Key = {}".format(key_item))
+
+        # if current key item has multiple values, do this
+        if key_item in SPS_NOTE_MULTI_KEYS:
+
+            # if current key item has multiple values, initializing a list for the values
+            if key_item not in notes.keys():
+                notes[key_item] = []
+
+                # checking specific cases
+            if key_item[0:3] == "CAX":
+                note_item = note_item.split("|")
+                note_index = int(note_item[0][key_len:])
+                note_value = note_item[1]
+            elif key_item[0:8] == "CLOCKMSG":
+                note_item = note_item.split(" ")
+                note_index = int(note_item[0][key_len:])
+                note_value = " ".join(note_item[1:])
+            else:
+                note_index = int(note_item[key_len : key_len + 1])
+                note_value = note_item[key_len + 1 :]
+            if debug:
+                print("Index = {}".format(note_index))
+                print("Value = {}".format(note_value))
+
+            # adding value to note item
+            if key_item in SPS_NOTE_INT_KEYS:
+                notes[key_item].append(int(note_value.strip()))
+            elif key_item in SPS_NOTE_FLOAT_KEYS:
+                notes[key_item].append(float(note_value.strip()))
+            else:
+                notes[key_item].append(note_value)
 
+        else:
 
-class RadioJoveSpsSweeps:
-    pass
+            # key has single value, extracting the value (no delimiter)
+            note_value = note_item[key_len:]
+
+            # special case for RCVR, empty value should be value -1
+            if key_item == "RCVR":
+                if note_value == "":
+                    note_value = "-1"
+
+            if debug:
+                print("Value = {}".format(note_value))
+
+            # loop on keys that have numeric values
+            if key_item in SPS_NOTE_INT_KEYS:
+                notes[key_item] = int(note_value.strip())
+            elif key_item in SPS_NOTE_FLOAT_KEYS:
+                notes[key_item] = float(note_value.strip())
+            else:
+                notes[key_item] = note_value
+
+    # final special case: if not present this keyword (no value) says that we deal with single channel spectrograph data
+    if "DUALSPECFILE" not in notes.keys():
+        notes["DUALSPECFILE"] = False
+    else:
+        if notes["DUALSPECFILE"].strip() == "True":
+            notes["DUALSPECFILE"] = True
+
+    return notes
+
+
+def _decode_spd_notes(raw_notes: bytes) -> dict:
+    """Decode the notes of a SPD file (radiojove kits)."""
+
+    # The header notes are composed of a series of key and value (KV) pairs.
+    # The raw notes start with a free text space.
+    # The KV pairs section are starting *[[* and finishes with *]]*.
+    # The delimiter between each KV pair is 0xFF.
+    # There is no predefined character for separating key and value within a KV pair.
+    # We must then identify the keys. Some keys have multiple values.
+    # More info: http://www.radiosky.com/skypipehelp/V2/datastructure.html
+
+    raw_notes = raw_notes.decode("latin-1")
+
+    # initializing notes with 3 sub dictionaries.
+    notes = dict(CHL={}, CHO={}, MetaData={})
+
+    start_index = raw_notes.find("*[[*")
+    stop_index = raw_notes.find("*]]*")
+    notes["free_text"] = raw_notes[0:start_index]
+    note_list = raw_notes[start_index + 4 : stop_index].split("\xff")
+    notes["Logged Using UT"] = "Logged Using UT" in note_list
+    notes["No Time Stamps"] = "No Time Stamps" in note_list
+    notes["Integer Save"] = "Integer Save" in note_list
+    for note_item in note_list:
+
+        if note_item[0:3] == "CHL":
+            notes["CHL"][int(note_item[3])] = note_item[4:]
+
+        if note_item[0:3] == "CHO":
+            notes["CHO"][int(note_item[3])] = note_item[4:]
+
+        if note_item[0:7] == "XALABEL":
+            notes["XALABEL"] = note_item[7:]
+
+        if note_item[0:7] == "YALABEL":
+            notes["YALABEL"] = note_item[7:]
+
+        # extra metadata are present with a generic syntax Metadata_[KEY][0xC8][VALUE]
+        if note_item[0:9] == "MetaData_":
+            item_metadata = note_item.split("\xc8")
+            # removing any extra trailing character in key name (spaces or colon)
+            notes["MetaData"][
+                item_metadata[0][9:].strip(" ").strip(":").strip(" ")
+            ] = item_metadata[1]
+
+    return notes
+
+
+def _decode_spx_notes(file_type: str, raw_notes: bytes, debug: bool = False) -> dict:
+    """Decode the notes of a SPS or SPD file."""
+    if file_type == "SPS":
+        return _decode_sps_notes(raw_notes, debug=debug)
+    elif file_type == "SPD":
+        return _decode_spd_notes(raw_notes)
+    raise ValueError(f"Unknown RadioJOVE file type: {file_type}")
+
+
+class RadioJoveSpsSweep(Sweep):
+    def __init__(self, header, data, time, frequencies):
+        super().__init__(header, data)
+        self._time = time
+        self._frequencies = frequencies
+
+
+class RadioJoveSpsSweeps(Sweeps):
+    @property
+    def generator(self):
+        header = self.data_reference.header
+        frequencies = self.data_reference.frequencies
+        data = self.data_reference._data
+        for i, time in enumerate(self.data_reference.times):
+            yield RadioJoveSpsSweep(
+                header,
+                {key: values[i] for key, values in data.items()},
+                time,
+                frequencies,
+            )
 
 
 class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
+    """Base class for the RadioJOVE Skypipe SPS (spectrograph) and SPD (radiojove kits) files.
+
+    The files are made of a 156-byte primary header, a note section and a data section, which
+    is accessed through views on the file buffer (see `extract_radiojove_spx_data`).
+    """
+
+    # length of the primary header
+    prim_hdr_length = 156
+
+    verbose = False
+    debug = False
+
     def extract_radiojove_spx_header(self):
         """
         Extracts fixed length header keywords from Raw data
@@ -24,30 +299,9 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
         if self.verbose:
             print("### [load_radiojove_spx_header]")
 
-        hdr_raw = self.file_info["prim_hdr_raw"]
-
-        hdr_fmt = "<10s6d1h10s20s20s40s1h1i"  # header format to unpack header
-        hdr_values = struct.unpack(hdr_fmt, hdr_raw[0:156])
-
-        header = dict(sft=hdr_values[0].decode("ascii"))
-        # date conversion: header dates are given in decimal days since 30/12/1899 00:00 (early morning!) == day 0.0
-        # date values must be corrected by adding 2415018.5 = julian date 30/12/1899 00:00
-        header["start_jdtime"] = hdr_values[1] + 2415018.5
+        header = _decode_spx_header(self.file_info["prim_hdr_raw"])
         header["start_time"] = Time(header["start_jdtime"], format="jd").datetime
-        header["stop_jdtime"] = hdr_values[2] + 2415018.5
         header["stop_time"] = Time(header["stop_jdtime"], format="jd").datetime
-        header["latitude"] = hdr_values[3]
-        header["longitude"] = hdr_values[4]
-        header["chartmax"] = hdr_values[5]
-        header["chartmin"] = hdr_values[6]
-        header["timezone"] = hdr_values[7]
-        # For the next 4 header keywords, we remove leading and trailing null (0x00) and space characters
-        header["source"] = (hdr_values[8].decode("ascii").strip("\x00")).strip(" ")
-        header["author"] = (hdr_values[9].decode("ascii").strip("\x00")).strip(" ")
-        header["obsname"] = (hdr_values[10].decode("ascii").strip("\x00")).strip(" ")
-        header["obsloc"] = (hdr_values[11].decode("ascii").strip("\x00")).strip(" ")
-        header["nchannels"] = hdr_values[12]
-        header["note_length"] = hdr_values[13]
         return header
 
     def extract_radiojove_sps_notes(self):
@@ -59,150 +313,7 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
         if self.verbose:
             print("### [extract_radiojove_sps_notes]")
 
-        raw_notes = self.file_info["notes_raw"]
-        notes = dict()
-
-        # The header notes are composed of a series of key and value (KV) pairs.
-        # The raw notes start with a free text space.
-        # The KV pairs section are starting *[[* and finishes with *]]*.
-        # The delimiter between each KV pair is 0xFF.
-        # There is no predefined character for separating key and value within a KV pair.
-        # We must then identify the keys. Some keys have multiple values.
-        # More info: http://www.radiosky.com/skypipehelp/V2/datastructure.html
-
-        # List of known metadata keys
-        key_list = [
-            "SWEEPS",
-            "LOWF",
-            "HIF",
-            "STEPS",
-            "RCVR",
-            "DUALSPECFILE",
-            "COLORRES",
-            "BANNER",
-            "ANTENNATYPE",
-            "ANTENNAORIENTATION",
-            "COLORFILE",
-            "COLOROFFSET",
-            "COLORGAIN",
-            "CORRECTIONFILENAME",
-            "CAXF",
-            "CAX1",
-            "CAX2",
-            "CLOCKMSG",
-        ]
-        # CHECK LIST WITH https://voparis-confluence.obspm.fr/display/JOVE/RadioSky+Spectrograph-SPS+Metadata
-
-        # list of metadata keys with multiple values
-        key_list_multi = [
-            "BANNER",
-            "COLOROFFSET",
-            "COLORGAIN",
-            "CAXF",
-            "CAX1",
-            "CAX2",
-            "CLOCKMSG",
-        ]
-
-        # list of metadata keys with integer values
-        key_list_int = ["SWEEPS", "STEPS", "RCVR", "COLORRES", "COLOROFFSET"]
-
-        # list of metadata keys with floating point values
-        key_list_float = ["LOWF", "HIF", "COLORGAIN"]
-
-        # stripping raw note text stream from "*[[*" and "*]]*" delimiters, and splitting with '\xff'
-        start_index = raw_notes.find(b"*[[*")
-        stop_index = raw_notes.find(b"*]]*")
-        notes["free_text"] = raw_notes[0:start_index].decode("ascii")
-        note_list = []
-        cur_note = b""
-        for bb in raw_notes[start_index + 4 : stop_index]:
-            if bb == 255:
-                note_list.append(cur_note)
-                cur_note = b""
-            else:
-                cur_note = b"".join([cur_note, struct.pack("B", bb)])
-
-        # Looping on note items to identify what keys are present
-        for item in note_list:
-
-            note_item = item.decode("ascii")
-
-            if self.debug:
-                print("Current Item = {}".format(note_item))
-
-            # looping on known key items
-            for key_item in key_list:
-
-                # getting length of key name
-                key_len = len(key_item)
-
-                # checking if current note item contains current key item
-                if note_item[0:key_len] == key_item:
-
-                    if self.debug:
-                        print("Detected Key = {}".format(key_item))
-
-                    # if current key item has multiple values, do this
-                    if key_item in key_list_multi:
-
-                        # if current key item has multiple values, initializing a list for the values
-                        if key_item not in notes.keys():
-                            notes[key_item] = []
-
-                            # checking specific cases
-                        if key_item[0:3] == "CAX":
-                            note_item = note_item.split("|")
-                            note_index = int(note_item[0][key_len:])
-                            note_value = note_item[1]
-                        elif key_item[0:8] == "CLOCKMSG":
-                            note_item = note_item.split(" ")
-                            note_index = int(note_item[0][key_len:])
-                            note_value = " ".join(note_item[1:])
-                        else:
-                            note_index = int(note_item[key_len : key_len + 1])
-                            note_value = note_item[key_len + 1 :]
-                        if self.debug:
-                            print("Index = {}".format(note_index))
-                            print("Value = {}".format(note_value))
-
-                        # adding value to note item
-                        if key_item in key_list_int:
-                            notes[key_item].append(int(note_value.strip()))
-                        elif key_item in key_list_float:
-                            notes[key_item].append(float(note_value.strip()))
-                        else:
-                            notes[key_item].append(note_value)
-
-                    else:
-
-                        # key has single value, extracting the value (no delimiter)
-                        note_value = note_item[key_len:]
-
-                        # special case for RCVR, empty value should be value -1
-                        if key_item == "RCVR":
-                            if note_value == "":
-                                note_value = "-1"
-
-                        if self.debug:
-                            print("Value = {}".format(note_value))
-
-                        # loop on keys that have numeric values
-                        if key_item in key_list_int:
-                            notes[key_item] = int(note_value.strip())
-                        elif key_item in key_list_float:
-                            notes[key_item] = float(note_value.strip())
-                        else:
-                            notes[key_item] = note_value
-
-        # final special case: if not present this keyword (no value) says that we deal with single channel spectrograph data
-        if "DUALSPECFILE" not in notes.keys():
-            notes["DUALSPECFILE"] = False
-        else:
-            if notes["DUALSPECFILE"].strip() == "True":
-                notes["DUALSPECFILE"] = True
-
-        return notes
+        return _decode_sps_notes(self.file_info["notes_raw"], debug=self.debug)
 
     def extract_radiojove_spd_notes(self):
         """
@@ -210,95 +321,79 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
         :param self:
         :return notes: dictionary containing the extracted header notes
         """
-
-        # The header notes are composed of a series of key and value (KV) pairs.
-        # The raw notes start with a free text space.
-        # The KV pairs section are starting *[[* and finishes with *]]*.
-        # The delimiter between each KV pair is 0xFF.
-        # There is no predefined character for separating key and value within a KV pair.
-        # We must then identify the keys. Some keys have multiple values.
-        # More info: http://www.radiosky.com/skypipehelp/V2/datastructure.html
-
         if self.verbose:
             print("### [extract_radiojove_spd_notes]")
 
-        raw_notes = self.file_info["notes_raw"]
-
-        # initializing notes with 3 sub dictionaries.
-        notes = dict(CHL={}, CHO={}, MetaData={})
-
-        start_index = raw_notes.find("*[[*")
-        stop_index = raw_notes.find("*]]*")
-        notes["free_text"] = raw_notes[0:start_index]
-        note_list = raw_notes[start_index + 4 : stop_index].split("\xff")
-        for note_item in note_list:
-
-            if note_item == "Logged Using UT":
-                notes["Logged Using UT"] = True
-            else:
-                notes["Logged Using UT"] = False
-
-            if note_item == "No Time Stamps":
-                notes["No Time Stamps"] = True
-            else:
-                notes["No Time Stamps"] = False
-
-            if note_item[0:3] == "CHL":
-                notes["CHL"][int(note_item[3])] = note_item[4:]
-
-            if note_item[0:3] == "CHO":
-                notes["CHO"][int(note_item[3])] = note_item[4:]
-
-            if note_item == "Integer Save":
-                notes["Integer Save"] = True
-            else:
-                notes["Integer Save"] = False
-
-            if note_item[0:7] == "XALABEL":
-                notes["XALABEL"] = note_item[7:]
-
-            if note_item[0:7] == "YALABEL":
-                notes["YALABEL"] = note_item[7:]
-
-            # extra metadata are present with a generic syntax Metadata_[KEY][0xC8][VALUE]
-            if note_item[0:9] == "MetaData_":
-                item_metadata = note_item.split("\xc8")
-                # removing any extra trailing character in key name (spaces or colon)
-                notes["MetaData"][
-                    item_metadata[0][9:].strip(" ").strip(":").strip(" ")
-                ] = item_metadata[1]
+        return _decode_spd_notes(self.file_info["notes_raw"])
 
-        return notes
+    @classmethod
+    def read_headers(cls, filepaths):
+        """
+        Reads the primary header and the notes of many SPS or SPD files, without reading (or
+        mapping) their data sections
+        :param filepaths: the paths of the files
+        :return headers: a list of (header, notes) tuples, one per file, where the header holds
+        the primary header keywords, and the name, type and size of the file
+        """
+        headers = []
+        for filepath in filepaths:
+            filepath = Path(filepath)
+            with open(filepath, "rb") as file:
+                header = _decode_spx_header(file.read(cls.prim_hdr_length))
+                raw_notes = file.read(header["note_length"])
+                header["file_name"] = str(filepath)
+                header["file_type"] = filepath.suffix[1:].upper()
+                header["file_size"] = file.seek(0, 2)
+            if len(raw_notes) < header["note_length"]:
+                raise ValueError(f"Truncated RadioJOVE file header: {filepath}")
+            notes = _decode_spx_notes(header["file_type"], raw_notes, debug=cls.debug)
+            headers.append((header, notes))
+
+        # (the dates of all the files are converted at once)
+        jd_times = Time(
+            [header["start_jdtime"] for header, _ in headers]
+            + [header["stop_jdtime"] for header, _ in headers],
+            format="jd",
+        ).datetime
+        for i, (header, _) in enumerate(headers):
+            header["start_time"] = jd_times[i]
+            header["stop_time"] = jd_times[len(headers) + i]
+        return headers
 
     def open_radiojove_spx(self):
         """
-        Opens RadioJOVE SPS or SPD file for processing
-        :return header, notes, time, frequency:
+        Reads the header and notes of the RadioJOVE SPS or SPD file, and derives the layout of
+        its data section
+        :return header, notes, time, frequency: the time steps are given in decimal days since
+        1899-12-30 00:00, and the frequencies in MHz
         """
         if self.verbose:
             print("### [open_radiojove_spx]")
 
-        # Opening file:
-        self.file_info["prim_hdr_length"] = 156
-        self.file_info["lun"] = open(self.file_info["name"], "rb")
+        buffer = self.buffer
+        self.file_info = {
+            "name": str(self.filepath),
+            "size": len(buffer),
+            "prim_hdr_length": self.prim_hdr_length,
+        }
 
         # Reading header:
-        self.file_info["prim_hdr_raw"] = self.file_info["lun"].read(
-            self.file_info["prim_hdr_length"]
-        )
+        self.file_info["prim_hdr_raw"] = bytes(buffer[0 : self.prim_hdr_length])
         header = self.extract_radiojove_spx_header()
         header["file_name"] = self.file_info["name"]
-        header["file_type"] = self.file_info["name"][-3:].upper()
+        header["file_type"] = self.filepath.suffix[1:].upper()
 
         # Reading notes:
-        self.file_info["notes_raw"] = self.file_info["lun"].read(header["note_length"])
+        self.file_info["notes_raw"] = bytes(
+            buffer[self.prim_hdr_length : self.prim_hdr_length + header["note_length"]]
+        )
         if header["file_type"] == "SPS":
             notes = self.extract_radiojove_sps_notes()
         elif header["file_type"] == "SPD":
             notes = self.extract_radiojove_spd_notes()
             header["nfreq"] = 1
         else:
-            notes = ""
+            raise ValueError(f"Unknown RadioJOVE file type: {header['file_type']}")
 
         if header["obsname"] == "AJ4CO DPS":
             header["obsty_id"] = "AJ4CO"
@@ -338,13 +433,16 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
             print(header)
             print(notes)
 
-        # Reading data:
+        # Data section:
 
+        self.file_info["data_offset"] = (
+            self.file_info["prim_hdr_length"] + header["note_length"]
+        )
         self.file_info["data_length"] = (
-            self.file_info["size"]
-            - self.file_info["prim_hdr_length"]
-            - header["note_length"]
+            self.file_info["size"] - self.file_info["data_offset"]
         )
+        if self.file_info["data_length"] < 0:
+            raise ValueError(f"Truncated RadioJOVE file header: {self.filepath}")
 
         # nfeed = number of observation feeds
         # nfreq = number of frequency step (1 for SPD)
@@ -421,22 +519,17 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
 
                 header["feeds"].append(feed_tmp[header["polar0"]])
 
-            self.file_info["bytes_per_step"] = (
-                header["nfreq"] * header["nfeed"] + 1
-            ) * 2
-            self.file_info["data_format"] = ">{}H".format(
-                self.file_info["bytes_per_step"] // 2
+            # each sweep is made of nfreq x nfeed big-endian 16-bit values (the feeds being
+            # interleaved), followed by the end of sweep delimiter
+            self.file_info["data_dtype"] = np.dtype(
+                (">u2", (header["nfreq"] * header["nfeed"] + 1,))
             )
 
             header["fmin"] = float(notes["LOWF"]) / 1.0e6  # MHz
             header["fmax"] = float(notes["HIF"]) / 1.0e6  # MHz
-            frequency = [
-                header["fmax"]
-                - float(ifreq)
-                / (header["nfreq"] - 1)
-                * (header["fmax"] - header["fmin"])
-                for ifreq in range(header["nfreq"])
-            ]
+            frequency = header["fmax"] - np.arange(header["nfreq"]) / max(
+                header["nfreq"] - 1, 1
+            ) * (header["fmax"] - header["fmin"])
 
         # SPD files
 
@@ -444,83 +537,47 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
             header["nfreq"] = 1
             header["nfeed"] = header["nchannels"]
             for i in range(header["nchannels"]):
-                header["feeds"][i] = {}
-                header["feeds"][i]["FIELDNAM"] = "CH{:02d}".format(i)
-                header["feeds"][i]["CATDESC"] = "CH{:02d} Flux Density".format(i)
-                header["feeds"][i]["LABLAXIS"] = "CH{:02d} Flux Density".format(i)
-
-            if notes["INTEGER_SAVE_FLAG"]:
-                self.file_info["bytes_per_step"] = 2
-                self.file_info["data_format"] = "{}h".format(header["nfeed"])
-            else:
-                self.file_info["nbytes_per_sample"] = 8
-                self.file_info["data_format"] = "{}d".format(header["nfeed"])
-
-            if notes["NO_TIME_STAMPS_FLAG"]:
-                self.file_info["bytes_per_step"] = (
-                    header["nfeed"] * self.file_info["nbytes_per_sample"]
-                )
-                self.file_info["data_format"] = "<{}".format(
-                    self.file_info["data_format"]
-                )
-            else:
-                self.file_info["bytes_per_step"] = (
-                    header["nfeed"] * self.file_info["nbytes_per_sample"] + 8
-                )
-                self.file_info["data_format"] = "<1d{}".format(
-                    self.file_info["data_format"]
+                header["feeds"].append(
+                    {
+                        "FIELDNAM": "CH{:02d}".format(i),
+                        "CATDESC": "CH{:02d} Flux Density".format(i),
+                        "LABLAXIS": "CH{:02d} Flux Density".format(i),
+                    }
                 )
 
-            frequency = 20.1
-            header["fmin"] = frequency  # MHz
-            header["fmax"] = frequency  # MHz
+            # each time step is made of a time stamp (unless "No Time Stamps" is set),
+            # followed by the little-endian values of the channels (16-bit integers if
+            # "Integer Save" is set, 64-bit floats otherwise)
+            data_dtype = []
+            if not notes["No Time Stamps"]:
+                data_dtype.append(("time", "<f8"))
+            data_dtype.append(
+                ("data", "<i2" if notes["Integer Save"] else "<f8", (header["nfeed"],))
+            )
+            self.file_info["data_dtype"] = np.dtype(data_dtype)
 
-        else:
-            frequency = 0.0
+            frequency = np.array([20.1])
+            header["fmin"] = frequency[0]  # MHz
+            header["fmax"] = frequency[0]  # MHz
+
+        self.file_info["bytes_per_step"] = self.file_info["data_dtype"].itemsize
 
         if header["file_type"] == "SPS":
             header["product_type"] = "sp{}_{}".format(header["nfeed"], header["nfreq"])
-            self.file_info["record_data_offset"] = 0
         if header["file_type"] == "SPD":
             header["product_type"] = "ts{}".format(header["nfeed"])
-            if notes["NO_TIME_STAMPS_FLAG"]:
-                self.file_info["record_data_offset"] = 0
-            else:
-                self.file_info["record_data_offset"] = 1
 
         header["nstep"] = (
             self.file_info["data_length"] // self.file_info["bytes_per_step"]
         )
 
-        if header["file_type"] == "SPS":
-            time_step = (header["stop_jdtime"] - header["start_jdtime"]) / float(
-                header["nstep"]
-            )
-            time = [
-                istep * time_step + header["start_jdtime"]
-                for istep in range(header["nstep"])
-            ]
-        elif header["file_type"] == "SPD":
-            # if notes['NO_TIME_STAMPS_FLAG']:
-            time_step = (header["stop_jdtime"] - header["start_jdtime"]) / float(
-                header["nstep"]
-            )
-            time = [
-                float(istep) * time_step + header["start_jdtime"]
-                for istep in range(header["nstep"])
-            ]
-            # else:
-            # time = np.array()
-            # for i in range(header['nstep']):
-            #     time.append(data_raw[i][0])
-            # time_step = np.median(time[1:header['nstep']]-time[0:header['nstep']-1])
-        else:
-            time = 0.0
-            time_step = 0.0
-
-        # transforming times from JD to datetime
-        # time = astime.Time(time, format='jd').datetime  # needs some checks
-        time = Time(time, format="jd").datetime  # needs some checks
+        # the time steps are evenly spaced between the start and stop times (in decimal days
+        # since 1899-12-30 00:00)
+        start_day, stop_day = struct.unpack(
+            "<2d", self.file_info["prim_hdr_raw"][10:26]
+        )
+        time_step = (stop_day - start_day) / float(header["nstep"] or 1)
+        time = np.arange(header["nstep"]) * time_step + start_day
 
         # time sampling step in seconds
         header["time_step"] = time_step * 86400.0
@@ -540,35 +597,24 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
 
         return header, notes, time, frequency
 
-    def close_radiojove_spx(self):
-        """
-        Closes the current SPS or SPD input file
-        :param self:
-        :return:
-        """
-        if self.verbose:
-            print("### [close_radiojove_spx]")
-
-        self.file_info["lun"].close()
-
     def extract_radiojove_spx_data(self):
         """
-        :return:
+        Gets the data of the SPS or SPD file, as (nstep, nfreq) views on the file buffer
+        :return data, time: a dictionary of views (one per feed), and the time stamps of the
+        SPD files (None if they are not recorded)
         """
-
-        packet_size = 0  # Need updates
-
         if self.verbose:
             print("### [extract_radiojove_spx_data]")
 
-        nstep = self.header["nstep"]  # len(time)
-        nfreq = self.header["nfreq"]  # len(freq)
+        nstep = self.header["nstep"]
+        nfreq = self.header["nfreq"]
         nfeed = self.header["nfeed"]
-        rec_0 = self.file_info["record_data_offset"]
 
         var_list = [item["FIELDNAM"] for item in self.header["feeds"]]
+        if len(set(var_list)) < len(var_list):
+            # e.g. dual spectrograph with no polarization in the banners
+            var_list = ["{}{}".format(var, i) for i, var in enumerate(var_list)]
 
-        # reading sweeps structure
         if self.verbose:
             print(
                 "Loading data into {} variable(s), from {}".format(
@@ -576,68 +622,37 @@ class RadioJoveSpxData(BinData, dataset="radiojove_spx"):  # type: ignore
                 )
             )
 
-        data = dict()
-        for var in var_list:
-            data[var] = np.empty((nstep, nfreq), dtype=np.short)
-
-        for j in range(0, self.header["nstep"], packet_size):
-            j1 = j
-            j2 = j + packet_size
-            if j2 > nstep:
-                j2 = nstep
-
-            if self.verbose:
-                if packet_size == 1:
-                    print("Loading record #{}".format(j))
-                else:
-                    print("Loading records #{} to #{}".format(j1, j2))
-
-            data_raw = np.array(self.read_radiojove_spx_sweep(j2 - j1))[
-                :, rec_0 : rec_0 + nfreq * nfeed
-            ].reshape(j2 - j1, nfreq, nfeed)
-
-            for i in range(nfeed):
-                data[var_list[i]][j1:j2, :] = data_raw[:, :, i].reshape(j2 - j1, nfreq)
-
-        return data
-
-    def read_radiojove_spx_sweep(self, read_size):
-        """
-        Reads raw data from SPS or SPD file
-        :param self:
-        :param read_size: number of sweep to read
-        :return raw:
-        """
-        if self.verbose:
-            print("### [read_radiojove_spx_sweep]")
-            print(
-                "loading packet of {} sweep(s), with format `{}`.".format(
-                    read_size, self.file_info["data_format"]
-                )
-            )
+        raw = np.ndarray(
+            (nstep,),
+            dtype=self.file_info["data_dtype"],
+            buffer=self.buffer,
+            offset=self.file_info["data_offset"],
+        )
 
-        raw = []
-        for i in range(read_size):
-            raw.append(
-                struct.unpack(
-                    self.file_info["data_format"],
-                    self.file_info["lun"].read(self.file_info["bytes_per_step"]),
-                )
-            )
-            if raw[i][-1] != 65278:
-                print(
-                    "WARNING ! wrong end of sweep delimiter. (Got 0x{:04X} instead of 0x{:04X})".format(
-                        raw[i][-1], 65278
+        if self.header["file_type"] == "SPS":
+            bad_sweeps = np.flatnonzero(raw[:, -1] != SPS_SWEEP_DELIMITER)
+            if len(bad_sweeps) > 0:
+                warnings.warn(
+                    "Wrong end of sweep delimiter in {} sweep(s) of {} (first: #{})".format(
+                        len(bad_sweeps), self.filepath, bad_sweeps[0]
                     )
                 )
+            values = raw[:, :-1].reshape(nstep, nfreq, nfeed)
+            time = None
+        else:
+            values = raw["data"].reshape(nstep, nfreq, nfeed)
+            time = raw["time"] if "time" in raw.dtype.names else None
 
-        if self.verbose:
-            print("Size of loaded data: {}".format(len(raw)))
-
-        return raw
+        data = {var: values[:, :, i] for i, var in enumerate(var_list)}
+        return data, time
 
 
 class RadioJoveSpsData(RadioJoveSpxData, dataset="radiojove_sps"):  # type: ignore
+    """Class for the RadioJOVE Skypipe SPS and SPD files.
+
+    The data are views on the file buffer, memory-mapped by default.
+    """
+
     _iter_sweep_class = RadioJoveSpsSweeps
 
     def __init__(
@@ -645,16 +660,64 @@ class RadioJoveSpsData(RadioJoveSpxData, dataset="radiojove_sps"):  # type: igno
         filepath: Path,
         dataset: Union[None, str] = "__auto__",
         access_mode: str = "sweeps",
+        memory_map: bool = True,
     ):
-        BinData.__init__(self, filepath, dataset, access_mode)
+        BinData.__init__(self, filepath, dataset, access_mode, memory_map=memory_map)
         self._data = None
         self._nsweep = None
         self._data = self._loader()
-        self.fields: list = []
-        self.units: list = []
+        self.fields = list(self._data.keys())
+        self.units: list = ["" for _ in self.fields]
 
     def _loader(self):
-        pass
+        self.header, self.notes, days, frequency = self.open_radiojove_spx()
+        self._frequencies = frequency * Unit("MHz")
+        data, time_stamps = self.extract_radiojove_spx_data()
+        if time_stamps is not None:
+            days = time_stamps
+        # (the time axis of as_xarray is computed from the Skypipe dates, as converting the
+        # times into datetime64 with astropy is slow for long time series)
+        self._datetime64 = _spx_days_to_datetime64(days)
+        self._times = Time(SPX_JD_ORIGIN, days, format="jd")
+        self._nsweep = self.header["nstep"]
+        return data
+
+    @property
+    def times(self):
+        return self._times
+
+    @property
+    def frequencies(self):
+        return self._frequencies
+
+    @property
+    def dataset_keys(self):
+        return list(self._data.keys())
+
+    def as_xarray(self, time_range=None, freq_range=None):
+        import xarray
+
+        datasets = {}
+        for (dataset_key, values), feed in zip(
+            self._data.items(), self.header["feeds"]
+        ):
+            datasets[dataset_key] = xarray.DataArray(
+                data=values.T,
+                name=feed["LABLAXIS"],
+                coords=[
+                    (
+                        "frequency",
+                        self.frequencies.value,
+                        {"units": self.frequencies.unit},
+                    ),
+                    ("time", self._datetime64),
+                ],
+                dims=("frequency", "time"),
+                attrs={"title": feed["CATDESC"]},
+            )
+        return self._select_range(
+            xarray.Dataset(data_vars=datasets), time_range, freq_range
+        )
 
 
 class RadioJoveCdfData(CdfData, dataset="radiojove_cdf"):  # type: ignore
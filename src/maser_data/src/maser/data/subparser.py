@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""maser-data sub-commands."""
+
+
+def add_ingest_subparser(subparser):
+    """maser.data.parallel.ingest script program."""
+    ingest_parser = subparser.add_parser(
+        "ingest",
+        help="Convert data files into .npz files (in parallel)",
+    )
+    ingest_parser.add_argument(
+        "filepaths", nargs="+", type=str, help="Input data file paths"
+    )
+    ingest_parser.add_argument(
+        "-o",
+        "--output-dir",
+        nargs=1,
+        default=["."],
+        help="Output directory of the .npz files",
+    )
+    ingest_parser.add_argument(
+        "-d",
+        "--dataset",
+        nargs=1,
+        default=["__auto__"],
+        help="Dataset of the input files (guessed from each file by default)",
+    )
+    ingest_parser.add_argument(
+        "-j",
+        "--workers",
+        nargs=1,
+        type=int,
+        default=[None],
+        help="Number of worker processes (default is the number of CPUs)",
+    )
+    ingest_parser.add_argument(
+        "-c",
+        "--chunksize",
+        nargs=1,
+        type=int,
+        default=[1],
+        help="Number of files sent at once to a worker process",
+    )
+    ingest_parser.add_argument(
+        "-U",
+        "--unordered",
+        action="store_true",
+        help="Write the output files as soon as they are available",
+    )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from .leapsec import Lstable  # noqa: F401
+from .leapsec import Lstable, get_lstable  # noqa: F401
 from .time import *  # noqa: F401, F403
 from .const import *  # noqa: F401, F403
 from .subparser import add_leapsec_subparser  # noqa: F401
@@ -16,10 +16,12 @@ import os
 import logging
 from datetime import datetime
 
+import numpy
+
 from maser.tools.toolbox import download_data, print_exception
 from maser.tools.settings import SUPPORT_DIR
 
-__all__ = ["Lstable"]
+__all__ = ["Lstable", "get_lstable"]
 
 # ________________ HEADER _________________________
 
@@ -40,6 +42,9 @@ if not os.path.isdir(LS_FILE_DEF_DIR):
     os.makedirs(LS_FILE_DEF_DIR)
 LS_FILE_DEF_PATH = os.path.join(LS_FILE_DEF_DIR, LS_FILENAME)
 
+# Leapsec tables already loaded (see get_lstable())
+_LSTABLES = {}
+
 # ________________ Class Definition __________
 # (If required, define here classes)
 
@@ -59,6 +64,10 @@ class Lstable:
         self.drift = []
         self.lstable = None
 
+        # dates and leapsec of the table as numpy arrays (for the lookups)
+        self._dates = numpy.array([], dtype="M8[us]")
+        self._leapsecs = numpy.array([], dtype=float)
+
         # Setting the CDFLeapSeconds.txt filepath
         # and loading table
         self.set_file(file=file, reload=True)
@@ -76,20 +85,22 @@ class Lstable:
         self.drift.append([float(fields[4]), float(fields[5])])
 
     def get_leapsec(self, date=datetime.now()):
-        """Return the leapseconds for a given datetime."""
+        """Return the leapseconds for a given datetime.
+
+        The date can also be a numpy array of datetime64,
+        then the leapseconds are returned as a numpy array of float.
+        """
         if self.lstable is None:
             self.load_lstable()
 
-        if date < self.date[0]:
-            return 0.0
-        elif date >= self.date[-1]:
-            return self.leapsec[-1]
-        else:
-            for i, lsdate in enumerate(self.date[:-1]):
-                if date >= lsdate and date < self.date[i + 1]:
-                    return self.leapsec[i]
+        # index of the last table date before the input date(s)
+        dates = numpy.asarray(date, dtype="M8[us]")
+        index = numpy.searchsorted(self._dates, dates, side="right") - 1
+        leapsec = numpy.where(index >= 0, self._leapsecs[index.clip(min=0)], 0.0)
 
-        return None
+        if leapsec.ndim == 0:
+            return float(leapsec)
+        return leapsec
 
     @staticmethod
     def get_lstable_file(target_dir=None, overwrite=False, url=URL):
@@ -130,20 +141,25 @@ class Lstable:
         else:
             return True
 
-    def set_file(self, file=None, reload=True):
-        """Check if the leapsec table file exists on the local disk."""
+    @staticmethod
+    def resolve_file(file=None):
+        """Return the leapsec table file (or url) to be used for the input file."""
         if file is not None:
-            self.file = file
+            return file
         elif file is None and ENVAR in os.environ:
-            self.file = os.environ[ENVAR]
+            return os.environ[ENVAR]
         elif (
             file is None
             and ENVAR not in os.environ
             and os.path.isfile(LS_FILE_DEF_PATH)
         ):
-            self.file = LS_FILE_DEF_PATH
+            return LS_FILE_DEF_PATH
         else:
-            self.file = URL
+            return URL
+
+    def set_file(self, file=None, reload=True):
+        """Check if the leapsec table file exists on the local disk."""
+        self.file = self.resolve_file(file=file)
 
         # Reloading the lstable with file
         if reload:
@@ -174,6 +190,9 @@ class Lstable:
 
     def _parse_lstable(self, data):
         """Parse the CDF leap second table file."""
+        self.date = []
+        self.leapsec = []
+        self.drift = []
         for row in data.split("\n"):
             row = str(row).rstrip()
             if row.startswith(";"):
@@ -183,6 +202,8 @@ class Lstable:
                     continue
                 self._add(row)
 
+        self._dates = numpy.array(self.date, dtype="M8[us]")
+        self._leapsecs = numpy.array(self.leapsec, dtype=float)
         return data
 
     def __str__(self):
@@ -205,6 +226,28 @@ class Lstable:
 # (If required, define here gobal functions)
 
 
+def get_lstable(file=None):
+    """Return the leapsec table loaded from the input file.
+
+    The table is loaded once, then reused as long as
+    the file is not modified.
+    """
+    file = Lstable.resolve_file(file=file)
+    try:
+        mtime = os.path.getmtime(file)
+    except OSError:
+        mtime = None
+
+    key = (file, mtime)
+    if key not in _LSTABLES:
+        lstable = Lstable(file=file)
+        if lstable.lstable is None:
+            # do not keep a table which has not been loaded
+            return lstable
+        _LSTABLES[key] = lstable
+    return _LSTABLES[key]
+
+
 # _________________ Main ____________________________
 # if (__name__ == "__main__"):
 #    main()
@@ -7,8 +7,9 @@
 # (Include here the modules to import, e.g. import sys)
 from datetime import datetime, timedelta
 
-from numpy import datetime64, timedelta64
+from numpy import array, datetime64, timedelta64
 
+from .leapsec import get_lstable
 from .time import (
     get_leapsec,
     local_to_utc,
@@ -98,6 +99,39 @@ def test_mjd_to_tt2000():
     assert tt2000 == timedelta64(352234802000000, "us")
 
 
+def test_get_lstable():
+    """Test get_lstable().
+
+    The leapsec table must be loaded once.
+    """
+    assert get_lstable() is get_lstable()
+
+
+def test_get_leapsec_array():
+    """Test get_leapsec() with an array of dates."""
+    dates = array(["1950-01-01", "2008-12-31T23:59:59", "2011-03-01T07:00"], "M8[s]")
+    leapsec = get_leapsec(dates)
+    assert leapsec.tolist() == [
+        timedelta(0),
+        timedelta(seconds=33),
+        timedelta(seconds=34),
+    ]
+
+
+def test_tt2000_array():
+    """Test utc_to_tt2000(), tt2000_to_utc(), tt2000_to_jd() and jd_to_tt2000()
+    with arrays."""
+    utc = array(["2011-03-01T07:00", "2017-01-01T00:00"], "M8[ns]")
+    tt2000 = utc_to_tt2000(utc)
+    assert tt2000[0] == timedelta64(352234802000000000, "ns")
+    assert tt2000[1] == utc_to_tt2000(utc[1])
+    assert (tt2000_to_utc(tt2000) == utc).all()
+
+    jd = tt2000_to_jd(tt2000)
+    assert jd[0] == timedelta64(212165722800000000, "us")
+    assert (jd_to_tt2000(jd) == tt2000).all()
+
+
 # _________________ Main ____________________________
 # if (__name__ == "__main__"):
 # print ""
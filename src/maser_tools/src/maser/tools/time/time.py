@@ -13,7 +13,7 @@ import logging
 
 from ..toolbox import print_exception
 
-from .leapsec import Lstable
+from .leapsec import get_lstable
 
 from .const import MJD_EPOCH, JD_TO_MJD, TT2000_EPOCH, DELTA_NSEC_TAI_TT
 
@@ -87,6 +87,9 @@ def cast_timedelta(fr=None, to=None):
               (Possible values = timedelta, timedelta64 or None).
               If 'fr=None', then use the input type.
 
+    numpy arrays (of timedelta64) are passed to and returned by the
+    function as is.
+
     Example:
 
         from datetime import timedelta
@@ -109,6 +112,10 @@ def cast_timedelta(fr=None, to=None):
         def wrapper(*args, **kwargs):
             args = list(args)
             """Decorator wrapper."""
+            if isinstance(args[0], numpy.ndarray):
+                # numpy arrays (of timedelta64) are passed and returned as is
+                return func(*args, **kwargs)
+
             type_in = type(args[0])
             try:
                 if type_in is not timedelta and type_in is not timedelta64:
@@ -184,6 +191,9 @@ def cast_datetime(fr=None, to=None):
               (Possible values = datetime, datetime64 or None).
               If 'fr=None', then use the input type.
 
+    numpy arrays (of datetime64) are passed to and returned by the
+    function as is.
+
     Example:
 
         from datetime import datetime
@@ -206,6 +216,10 @@ def cast_datetime(fr=None, to=None):
             args = list(args)
             """Decorator wrapper."""
             args = list(args)
+            if isinstance(args[0], numpy.ndarray):
+                # numpy arrays (of datetime64) are passed and returned as is
+                return func(*args, **kwargs)
+
             type_in = type(args[0])
             try:
                 if type_in is not datetime and type_in is not datetime64:
@@ -268,8 +282,14 @@ def get_leapsec(date, leapsec_file=None, to_timedelta64=False):
 
     Leapsec are returned in the timedelta64 format if
     to_timedelta64 keyword is set to True.
+
+    If date is a numpy array of datetime64, leapsec are
+    always returned as a numpy array of timedelta64.
     """
-    leapsec = Lstable(file=leapsec_file).get_leapsec(date)
+    leapsec = get_lstable(file=leapsec_file).get_leapsec(date)
+
+    if isinstance(leapsec, numpy.ndarray):
+        return (leapsec * 1000000).round().astype("m8[us]")
 
     # Convert seconds in float to timedelta object
     leapsec = timedelta(microseconds=leapsec * 1000000)
@@ -363,7 +383,7 @@ def jd_to_mjd(jd):
     Be awared that the best time resolution is
     microsec.
     """
-    return numpy.timedelta64(jd, "us") - JD_TO_MJD
+    return jd.astype("m8[us]") - JD_TO_MJD
 
 
 @cast_timedelta(fr=timedelta64)
@@ -373,7 +393,7 @@ def mjd_to_jd(mjd):
     Be awared that the best time resolution is
     microsec.
     """
-    return numpy.timedelta64(mjd, "us") + JD_TO_MJD
+    return mjd.astype("m8[us]") + JD_TO_MJD
 
 
 @cast_datetime(fr=datetime64)
@@ -7,7 +7,9 @@ from maser.data.base import (
 )
 from .fixtures import filepaths_test
 from pathlib import Path
+import numpy
 import pytest
+from astropy.units import Unit
 from .fixtures import skip_if_spacepy_not_available
 
 
@@ -41,6 +43,306 @@ def test_bin_dataset():
     assert isinstance(data, BinData)
 
 
+def test_bin_dataset__buffer(tmp_path):
+    filepath = tmp_path / "toto.bin"
+    filepath.write_bytes(bytes(range(16)))
+
+    data = Data(filepath=filepath, dataset="bin")
+    assert not data.memory_map
+    assert data.buffer == bytes(range(16))
+
+    data = Data(filepath=filepath, dataset="bin", memory_map=True)
+    assert isinstance(data.buffer, numpy.memmap)
+    assert data.buffer.tolist() == list(range(16))
+    assert data._file is None
+
+
+def test_bin_dataset__index_cache(tmp_path):
+    filepath = tmp_path / "toto.bin"
+    filepath.write_bytes(bytes(range(16)))
+    index = numpy.array(
+        [(4, "2000-01-01T00:00"), (12, "2000-01-01T00:01")],
+        dtype=[("offset", "i8"), ("time", "M8[ms]")],
+    )
+
+    data = Data(filepath=filepath, dataset="bin")
+    assert data.index_path is None
+    with pytest.raises(NotImplementedError):
+        data.index
+
+    data = Data(filepath=filepath, dataset="bin", index_cache=True)
+    data._build_index = lambda: index
+    assert data.index_path == tmp_path / "toto.bin.idx.npz"
+    assert numpy.array_equal(data.index, index)
+    assert data.index_path.exists()
+    assert data.index_slice("2000-01-01T00:00:30") == slice(1, 2)
+    assert data.index_slice(end_time="2000-01-01T00:00:30") == slice(0, 1)
+
+    # the saved index is loaded (instead of being built) while the file is unchanged
+    data = Data(filepath=filepath, dataset="bin", index_cache=True)
+    assert numpy.array_equal(data.index, index)
+
+    filepath.write_bytes(bytes(range(8)))
+    data = Data(filepath=filepath, dataset="bin", index_cache=True)
+    with pytest.raises(NotImplementedError):
+        data.index
+
+    data = Data(filepath=filepath, dataset="bin", index_cache=tmp_path / "cache")
+    data._build_index = lambda: index
+    assert data.index_path.parent == tmp_path / "cache"
+    assert numpy.array_equal(data.index, index)
+    assert data.index_path.exists()
+
+
+def test_bin_dataset__index_cache_format(tmp_path):
+    filepath = tmp_path / "toto.bin"
+    filepath.write_bytes(bytes(range(16)))
+    index = numpy.array([(4, 1)], dtype=[("offset", "i8"), ("ID", ">i2")])
+
+    data = Data(filepath=filepath, dataset="bin", index_cache=True)
+    data._header_dtype = numpy.dtype([("ID", ">i2")])
+    data._build_index = lambda: index
+    assert numpy.array_equal(data.index, index)
+
+    def load_index(header_dtype, index_version=BinData._index_version):
+        data = Data(filepath=filepath, dataset="bin", index_cache=True)
+        data._header_dtype = header_dtype
+        data._index_version = index_version
+        data._build_index = lambda: None
+        return data.index
+
+    assert numpy.array_equal(load_index(numpy.dtype([("ID", ">i2")])), index)
+    # the saved index is not loaded for other header layouts or index versions
+    assert load_index(numpy.dtype([("ID", ">i4")])) is None
+    assert load_index(numpy.dtype([("ID", ">i2")]), BinData._index_version + 1) is None
+
+
+def test_dataset__detection_cache(tmp_path):
+    filepath = tmp_path / "POLR_RSPN2_19971115"
+    filepath.write_bytes(b"")
+    key = (str(filepath.resolve()), 0, filepath.stat().st_mtime_ns)
+
+    assert Data.get_dataset(Data, filepath) == "cdpp_int_aur_polrad_rspn2"
+    assert Data._dataset_cache[key] == "cdpp_int_aur_polrad_rspn2"
+
+    # the cache is keyed by the file size and modification time
+    filepath.write_bytes(b"\x00")
+    assert Data.get_dataset(Data, filepath) == "cdpp_int_aur_polrad_rspn2"
+    assert len([k for k in Data._dataset_cache if k[0] == key[0]]) == 2
+
+
+@skip_if_spacepy_not_available
+def test_cdf_dataset__detection_cache_warnings(tmp_path):
+    from spacepy import pycdf
+
+    filepath = tmp_path / "wi_wa_rad1_l3_df_19950101_v01.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "wi_wav_rad1_l3_df"
+        cdf.attrs["Skeleton_version"] = "01"
+
+    # the deprecation warning is emitted even when the dataset is taken from the cache
+    for _ in range(2):
+        with pytest.warns(DeprecationWarning):
+            assert Data.get_dataset(Data, filepath) == "wi_wav_rad1_l3_df_v01"
+
+
+def test_fits_dataset__detection_file_closed(tmp_path, monkeypatch):
+    from astropy.io import fits
+
+    filepath = tmp_path / "toto.fits"
+    hdu = fits.PrimaryHDU()
+    hdu.header["INSTRUME"] = "newroutine"
+    hdu.header["TELESCOP"] = "NDA"
+    hdu.header["OBJECT"] = "Sun"
+    hdu.writeto(filepath)
+
+    closed = []
+    close = FitsData.close.__func__
+    monkeypatch.setattr(
+        FitsData, "close", classmethod(lambda cls, f: closed.append(f) or close(cls, f))
+    )
+
+    def init(self, *args, **kwargs):
+        raise ValueError("invalid file")
+
+    dataset_class = Data._registry["orn_nda_newroutine_sun_edr"]
+    monkeypatch.setattr(dataset_class, "__init__", init)
+
+    # the file opened to identify the dataset is closed if the data object cannot be created
+    Data._dataset_cache.clear()
+    with pytest.raises(ValueError):
+        Data(filepath)
+    assert len(closed) == 1
+
+
+def test_fits_dataset__detection_file(tmp_path):
+    from astropy.io import fits
+
+    filepath = tmp_path / "toto.fits"
+    hdu = fits.PrimaryHDU()
+    hdu.header["INSTRUME"] = "newroutine"
+    hdu.header["TELESCOP"] = "NDA"
+    hdu.header["OBJECT"] = "Sun"
+    hdu.writeto(filepath)
+
+    # the file opened to identify the dataset is handed on to the data object
+    data = Data(filepath)
+    assert data.dataset == "orn_nda_newroutine_sun_edr"
+    assert data._file is not None
+    assert data.file[0].header["OBJECT"] == "Sun"
+    data.close(data.file)
+
+
+def test_dataset__select_range():
+    import xarray
+
+    times = numpy.datetime64("2000-01-01T00:00") + numpy.arange(4) * numpy.timedelta64(
+        1, "m"
+    )
+    dataset = xarray.Dataset(
+        {"V": (("frequency", "time"), numpy.arange(12).reshape(3, 4))},
+        coords={
+            "frequency": ("frequency", [10.0, 20.0, 30.0], {"units": "kHz"}),
+            "time": times,
+        },
+    )
+    data = Data(filepath=Path("toto.txt"), dataset="bin")
+
+    assert data._select_range(dataset) is dataset
+    selected = data._select_range(
+        dataset,
+        time_range=("2000-01-01T00:01", None),
+        freq_range=(15000 * Unit("Hz"), 30),
+    )
+    assert selected["frequency"].values.tolist() == [20.0, 30.0]
+    assert selected["time"].values.tolist() == times[1:].tolist()
+    assert selected["V"].values.tolist() == [[5, 6, 7], [9, 10, 11]]
+
+
+@skip_if_spacepy_not_available
+def test_cdf_dataset__epoch_slice(tmp_path):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+
+    filepath = tmp_path / "toto.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf["Epoch"] = [datetime(2000, 1, 1) + timedelta(minutes=i) for i in range(10)]
+
+    with Data(filepath=filepath, dataset="cdf") as data:
+        assert data._epoch_slice(None) == slice(0, 10)
+        assert data._epoch_slice(("2000-01-01T00:02", "2000-01-01T00:04")) == slice(
+            2, 5
+        )
+        assert data._epoch_slice(("2000-01-01T00:02:30", None)) == slice(3, 10)
+        assert data._epoch_slice((None, "1999-12-31")) == slice(0, 0)
+
+
+@skip_if_spacepy_not_available
+def test_cdf_dataset__epoch_datetime64(tmp_path):
+    from spacepy import pycdf
+    from datetime import datetime
+
+    filepath = tmp_path / "toto.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        # without and with the leap second at the end of 2016
+        for key, start in [
+            ("Epoch", datetime(2017, 1, 1, 0, 0, 2)),
+            ("Epoch_leap", datetime(2016, 12, 31, 23, 59, 58)),
+        ]:
+            cdf.new(key, type=pycdf.const.CDF_TIME_TT2000)
+            cdf[key] = numpy.arange(24) * 250000499 + pycdf.lib.datetime_to_tt2000(
+                start
+            )
+
+    with Data(filepath=filepath, dataset="cdf") as data:
+        for key in ["Epoch", "Epoch_leap"]:
+            expected = numpy.asarray(data.file[key][...], dtype="datetime64[ns]")
+            assert data._epoch_datetime64(key).tolist() == expected.tolist()
+
+
+@skip_if_spacepy_not_available
+def test_cdf_dataset__variable_cache(tmp_path):
+    from spacepy import pycdf
+
+    filepath = tmp_path / "toto.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf["A"] = numpy.arange(10.0)
+        cdf["B"] = numpy.arange(10.0) * 2
+
+    data = Data(filepath=filepath, dataset="cdf")
+    with data:
+        a = data._variable("A")
+        assert data._variable("A") is a
+        assert not a.flags.writeable
+        assert data._variable("A", slice(2, 4)).tolist() == [2.0, 3.0]
+
+    # the cached variables are not read again once the file is closed
+    assert data._file is None
+    assert data._variable("A") is a
+    assert data._file is None
+    # selections of records of the other variables are read from the file
+    assert data._variable("B", slice(2, 4)).tolist() == [4.0, 6.0]
+    assert list(data._variables) == ["A"]
+
+    # the least recently used variables are evicted
+    data.variable_cache_size = 100
+    data._variable("B")
+    assert list(data._variables) == ["B"]
+    assert data._variables_size == 80
+    data.close(data.file)
+
+
+def test_fits_dataset__variable_cache(tmp_path):
+    from astropy.io import fits
+
+    filepath = tmp_path / "toto.fits"
+    table = fits.BinTableHDU.from_columns(
+        [fits.Column(name="jd", format="D", array=numpy.arange(3.0))]
+    )
+    fits.HDUList([fits.PrimaryHDU(), table]).writeto(filepath)
+
+    with Data(filepath=filepath, dataset="fits") as data:
+        jd = data._variable(1, "jd")
+        assert jd.tolist() == [0.0, 1.0, 2.0]
+        assert data._variable(1, "jd") is jd
+
+
+def test_dataset_registry__manifest():
+    from importlib import import_module
+    from maser.data.base.base import BaseData
+    from maser.data.base.registry import _dataset_manifest
+
+    # the manifest must list all the dataset classes of the subpackages
+    for package in ["cdpp", "ecallisto", "nancay", "padc", "pds", "psa", "radiojove"]:
+        import_module(f"maser.data.{package}")
+    registry = dict.copy(BaseData._registry)
+    manifest = _dataset_manifest()
+    assert set(registry) == set(manifest)
+    for dataset, path in manifest.items():
+        module, name = path.split(":")
+        assert getattr(import_module(module), name) is registry[dataset]
+
+
+def test_dataset_registry__lazy_import():
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, maser.data; "
+        "assert 'maser.data.padc' not in sys.modules; "
+        "assert 'maser.data.padc.cassini.data' not in sys.modules; "
+        "from maser.data.base.base import BaseData; "
+        "assert BaseData._registry['co_rpws_hfr_kronos_n1'].__name__ "
+        "== 'CoRpwsHfrKronosN1Data'; "
+        "assert 'maser.data.padc.solo.rpw.tnr' not in sys.modules; "
+        "assert 'maser.data.cdpp' not in sys.modules; "
+        "from maser.data import RpwTnrSurv; "
+        "assert len(BaseData._registry) == len(list(BaseData._registry)); "
+        "assert 'maser.data.cdpp' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 @pytest.mark.test_data_required
 @pytest.mark.parametrize("filepath,dataset", filepaths_test())
 def test_any_dataset(filepath, dataset):
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import datetime
+import numpy
+import pytest
+from maser.data.cdpp.ccsds import decode_ccsds_date, decode_ccsds_dates
+
+# (p_field, t_fields) for CUC level 1, CDS level 1 and 2, and CCS time codes
+TIME_CODES = [
+    # CUC: 4 bytes of coarse time and 2 bytes of fine time
+    (0b10110010, [[0x7F, 0x01, 0x02, 0x03, 0x80, 0x00], [0, 0, 1, 0, 0xFF, 0xFF]]),
+    # CDS level 1: 2 bytes of day, 4 bytes of ms of day and 2 bytes of sub-ms
+    (0b01001000, [[0x12, 0x34, 0x01, 0x02, 0x03, 0x04, 0x00, 0x07], [0] * 8]),
+    # CDS level 2: 3 bytes of day and 4 bytes of ms of day
+    (0b00111000, [[0, 1, 0, 0, 0x36, 0xEE, 0x80], [0, 0x66, 0x55, 0, 0, 0, 1]]),
+    # CCS: year, month, day of month, hour, minute, second and 2 sub-second bytes
+    (
+        0b01001010,
+        [[0x07, 0xC6, 11, 10, 23, 59, 58, 12, 34], [0x07, 0xD0, 2, 29, 0, 0, 0, 0, 1]],
+    ),
+    # CCS: year, day of year, hour, minute, second and 1 sub-second byte
+    (
+        0b00111010,
+        [[0x07, 0xC6, 0x01, 0x2C, 1, 2, 3, 99], [0x07, 0xD0, 0, 60, 0, 0, 0, 5]],
+    ),
+]
+
+EPOCH = datetime.datetime(1950, 1, 1)
+
+
+@pytest.mark.parametrize("p_field,t_fields", TIME_CODES)
+def test_decode_ccsds_dates(p_field, t_fields):
+    times = decode_ccsds_dates(p_field, numpy.array(t_fields, dtype=numpy.uint8), EPOCH)
+    assert times.dtype == numpy.dtype("M8[ns]")
+    assert times.astype("M8[us]").tolist() == [
+        decode_ccsds_date(p_field, bytearray(t_field), EPOCH).datetime
+        for t_field in t_fields
+    ]
+    # the same with the time specification fields given as k-byte items
+    t_bytes = numpy.array([bytes(t_field) for t_field in t_fields])
+    assert numpy.array_equal(decode_ccsds_dates(p_field, t_bytes, EPOCH), times)
+
+
+def test_decode_ccsds_dates__mixed_p_fields():
+    p_fields = numpy.array([0b00011010, 0b00001010, 0b00011010], dtype=numpy.uint8)
+    t_fields = numpy.array(
+        [
+            [0x07, 0xC6, 0, 32, 1, 0, 0],
+            [0x07, 0xC6, 2, 1, 1, 0, 0],
+            [0x07, 0xC6, 0, 1, 0, 0, 0],
+        ]
+    )
+    assert decode_ccsds_dates(p_fields, t_fields).astype(str).tolist() == [
+        "1990-02-01T01:00:00.000000000",
+        "1990-02-01T01:00:00.000000000",
+        "1990-01-01T00:00:00.000000000",
+    ]
+
+
+def test_decode_ccsds_dates__bcd():
+    # 1980-12-31 23:59:58.75
+    t_fields = numpy.array([[0x19, 0x80, 0x12, 0x31, 0x23, 0x59, 0x58, 0x75]])
+    times = decode_ccsds_dates(0b00101010, t_fields, bcd=True)
+    assert times.astype(str).tolist() == ["1980-12-31T23:59:58.750000000"]
+
+
+def test_decode_ccsds_dates__errors():
+    with pytest.raises(Exception, match="T_field length"):
+        decode_ccsds_dates(0b00001010, numpy.zeros((2, 8), dtype=numpy.uint8))
+    with pytest.raises(ValueError, match="epoch"):
+        decode_ccsds_dates(0b00011000, numpy.zeros((2, 6), dtype=numpy.uint8))
+    with pytest.raises(NotImplementedError):
+        decode_ccsds_dates(0b00000100, numpy.zeros((2, 1), dtype=numpy.uint8))
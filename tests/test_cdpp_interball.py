@@ -8,6 +8,7 @@ from maser.data.cdpp import (
     InterballAuroralPolradRspSweep,
     InterballAuroralPolradRspRecord,
 )
+import numpy
 import pytest
 import xarray
 from pathlib import Path
@@ -300,3 +301,28 @@ def test_int_aur_polrad_rsp_bin_dataset__quicklook():
         data.quicklook(ql_path_tmp, keys=data.dataset_keys)
         assert ql_path_tmp.is_file()
         ql_path_tmp.unlink()
+
+
+def _write_int_aur_polrad_rspn2(filepath, session_names):
+    # one single-channel sweep of 2 steps per session name
+    content = b""
+    header_dtype = InterballAuroralPolradRspBinData._header_dtype
+    for session_name in session_names:
+        header = numpy.zeros(1, dtype=header_dtype)
+        header["CCSDS_PREAMBLE"] = 76
+        header["CCSDS_JULIAN_DAY_B2"], header["CCSDS_JULIAN_DAY_B3"] = 68, 78
+        header["SESSION_NAME"] = numpy.void(session_name)
+        header["STEPS"], header["CHANNELS"] = 2, 1
+        payload = header.tobytes() + numpy.array([1, 2], dtype=">f4").tobytes()
+        length = numpy.array([len(payload)], dtype=">i4").tobytes()
+        content += length + payload + length
+    filepath.write_bytes(content)
+
+
+def test_int_aur_polrad_rsp_bin_dataset__session_name_nul_padding(tmp_path):
+    filepath = tmp_path / "POLR_RSPN2_19971116"
+    _write_int_aur_polrad_rspn2(filepath, [b"73204S21", b"732\x00\x00\x00\x00\x00"])
+    data = Data(filepath=filepath)
+    session_names = [sweep.header["SESSION_NAME"] for sweep in data.sweeps]
+    # the 8 bytes are decoded as they are (NUL bytes included)
+    assert session_names == ["73204S21", "732\x00\x00\x00\x00\x00"]
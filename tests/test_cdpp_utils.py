@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import struct
+import numpy
+import pytest
+from maser.data.cdpp.const import CCSDS_CDS_FIELDS, CALDATE_FIELDS
+from maser.data.cdpp.utils import (
+    _struct_to_dtype,
+    _scan_records,
+    _check_records,
+    _read_headers,
+    _records_to_dicts,
+    _read_array,
+    _index_records,
+    _caldate_to_datetime64,
+    _ccsds_cds_to_datetime64,
+)
+
+
+def _length_prefixed(*payloads):
+    return b"".join(
+        struct.pack(">i", len(p)) + p + struct.pack(">i", len(p)) for p in payloads
+    )
+
+
+def test_struct_to_dtype():
+    fields, dtype = CCSDS_CDS_FIELDS
+    np_dtype = _struct_to_dtype(dtype + "hLf", fields + ["A", "B", "C"])
+    assert np_dtype.names == tuple(fields + ["A", "B", "C"])
+    assert np_dtype.itemsize == struct.calcsize(dtype + "hLf")
+    assert np_dtype["B"] == numpy.dtype(">u4")
+
+
+def test_struct_to_dtype__raw_bytes():
+    np_dtype = _struct_to_dtype(">h8s", ["A", "NAME"])
+    assert np_dtype["NAME"] == numpy.dtype("V8")
+    raw = struct.pack(">h8s", 1, b"AB")
+    values = numpy.frombuffer(raw, dtype=np_dtype)[0]
+    assert bytes(values["NAME"]) == struct.unpack(">h8s", raw)[1] == b"AB" + bytes(6)
+
+
+def test_struct_to_dtype__field_count_error():
+    with pytest.raises(ValueError):
+        _struct_to_dtype(">hh", ["A"])
+
+
+def test_scan_records__variable_length():
+    payloads = [
+        struct.pack(">hi", 1, 10) + struct.pack(">2f", 1.5, 2.5),
+        struct.pack(">hi", 2, 20) + struct.pack(">3f", 3.5, 4.5, 5.5),
+    ]
+    buffer = _length_prefixed(*payloads)
+    offsets, lengths = _scan_records(buffer)
+    assert offsets.tolist() == [4, 4 + len(payloads[0]) + 8]
+    assert lengths.tolist() == [len(p) for p in payloads]
+    assert _check_records(buffer, offsets, lengths)
+
+    headers = _read_headers(buffer, offsets, _struct_to_dtype(">hi", ["ID", "VAL"]))
+    assert _records_to_dicts(headers) == [{"ID": 1, "VAL": 10}, {"ID": 2, "VAL": 20}]
+
+    data = _read_array(buffer, offsets[1] + 6, 3)
+    assert data.tolist() == [3.5, 4.5, 5.5]
+    assert not data.flags.owndata
+
+
+def test_check_records__inconsistent_length():
+    buffer = bytearray(_length_prefixed(b"\x00" * 8))
+    buffer[-1] = 7
+    offsets, lengths = _scan_records(bytes(buffer))
+    assert not _check_records(bytes(buffer), offsets, lengths)
+
+
+def test_check_records__negative_length():
+    # a corrupt negative length must not make the scan loop forever
+    buffer = _length_prefixed(b"\x00" * 8) + struct.pack(">i", -8) + b"\x00" * 8
+    offsets, lengths = _scan_records(buffer)
+    assert lengths.tolist() == [8, -8]
+    assert not _check_records(buffer, offsets, lengths)
+
+    fields, dtype = CALDATE_FIELDS
+    header_dtype = _struct_to_dtype(dtype, fields)
+    assert _index_records(buffer, header_dtype, _caldate_to_datetime64) is None
+
+
+def test_index_records():
+    fields, dtype = CALDATE_FIELDS
+    header_dtype = _struct_to_dtype(dtype + "h", fields + ["NFREQ"])
+    payloads = [
+        struct.pack(dtype + "h", 1994, 11, 10, 23, 59, 58, 1) + struct.pack(">f", 1.5),
+        struct.pack(dtype + "h", 1994, 11, 11, 0, 0, 5, 2) + struct.pack(">2f", 2, 3),
+    ]
+    index = _index_records(
+        _length_prefixed(*payloads), header_dtype, _caldate_to_datetime64
+    )
+    assert index["offset"].tolist() == [4, 4 + len(payloads[0]) + 8]
+    assert index["length"].tolist() == [len(p) for p in payloads]
+    assert index["NFREQ"].tolist() == [1, 2]
+    assert index["time"].astype(str).tolist() == [
+        "1994-11-10T23:59:58.000",
+        "1994-11-11T00:00:05.000",
+    ]
+
+    buffer = bytearray(_length_prefixed(*payloads))
+    buffer[-1] = 0
+    assert _index_records(bytes(buffer), header_dtype, _caldate_to_datetime64) is None
+
+
+def test_ccsds_cds_to_datetime64():
+    fields, dtype = CCSDS_CDS_FIELDS
+    # 1 day and 1 hour (3600000 ms) after the epoch
+    headers = numpy.frombuffer(
+        struct.pack(dtype, 76, 0, 0, 1, 0, 0x36, 0xEE, 0x80),
+        dtype=_struct_to_dtype(dtype, fields),
+    )
+    times = _ccsds_cds_to_datetime64(headers, "1950-01-01")
+    assert times.astype(str).tolist() == ["1950-01-02T01:00:00.000"]
@@ -5,7 +5,17 @@ from maser.data import Data
 from maser.data.cdpp import (
     VikingV4nE5BinData,
 )
+from maser.data.cdpp.viking.records import (
+    HEADER1_DTYPE,
+    HEADER1_FIELDS,
+    HEADER2_DTYPE,
+    HEADER2_FIELDS,
+    HEADER3_DTYPE,
+    HEADER3_FIELDS,
+)
+import numpy
 import pytest
+import struct
 
 TEST_FILES = {
     "cdpp_viking_v4n_e5": [BASEDIR / "cdpp" / "viking" / "V4N_0101_003"],
@@ -21,7 +31,6 @@ def test_viking_v4n_e5_bin_dataset():
 
 
 @pytest.mark.test_data_required
-@pytest.mark.skip(reason="not fully implemented yet")
 def test_viking_v4n_e5_bin_dataset__times():
     filepath = TEST_FILES["cdpp_viking_v4n_e5"][0]
     data = Data(filepath=filepath)
@@ -29,6 +38,8 @@ def test_viking_v4n_e5_bin_dataset__times():
     assert len(data.times) == 120
     assert data.times[0] == Time("1994-11-10 16:38:06.000")
     assert data.times[-1] == Time("1994-11-10 23:55:27.000")
+    # the records are read at the right offsets
+    assert numpy.all(numpy.diff(data.table["HEADER1"]["RECORD_NUMBER"]) == 1)
 
 
 @pytest.mark.test_data_required
@@ -41,3 +52,146 @@ def test_viking_v4n_e5_bin_dataset__sweeps_access_mode__error():
     with pytest.raises(ValueError):
         filepath = TEST_FILES["cdpp_viking_v4n_e5"][0]
         Data(filepath=filepath, access_mode="sweeps")
+
+
+def _pack(fmt, fields, values, length):
+    """Pack the values of a block, followed by its spare bytes."""
+    block = struct.pack(fmt, *[values.get(field, 0) for field in fields])
+    return block + bytes(length - len(block))
+
+
+def _floats(values, count):
+    """Pack float values, padded with zeros."""
+    values = list(values) + [0] * (count - len(values))
+    return struct.pack(f">{count}f", *values)
+
+
+def _viking_record(
+    header1, header2={}, header3={}, status={}, sfa={}, dft_wf=(), v2_amplitude={}
+):
+    """Write a V4N E5 record, one block after the other (as the former sequential reader read
+    them, without the bytes it skipped)."""
+    record = _pack(HEADER1_DTYPE, sum(HEADER1_FIELDS, []), header1, 128)
+    record += _pack(HEADER2_DTYPE, HEADER2_FIELDS, header2, 64)
+    record += _pack(HEADER3_DTYPE, HEADER3_FIELDS, header3, 64)
+    # status of the 16 series: G, ST8, ST9, ST10 (8 values each), ST0 to ST7
+    for i in range(16):
+        series = status.get(i, {})
+        for key in ["G", "ST8", "ST9", "ST10"]:
+            record += struct.pack(">8h", *series.get(key, [0] * 8))
+        record += struct.pack(">8h", *[series.get(f"ST{j}", 0) for j in range(8)])
+    record += bytes(2 * 36) + bytes(184)  # V1 (2 series), and spare bytes
+    record += bytes(44) + bytes(212)  # orbit, and spare bytes
+    for key in ["FREQUENCY_SFA", "ELECTRIC_SFA", "MAGNETIC_SFA"]:
+        record += _floats(sfa.get(key, []), 256)
+    record += bytes(4096)  # V4H FB
+    record += bytes(768)  # V4L FBL
+    for i in range(16):
+        record += struct.pack(">4f", v2_amplitude.get(i, 0), 0, 0, 0)
+    record += bytes(2048)  # V4L Ni
+    record += _floats(dft_wf, 4096)
+    assert len(record) == 28672
+    return record
+
+
+def _viking_records():
+    date = {
+        "CALEND_DATE_YEAR": 1994,
+        "CALEND_DATE_MONTH": 11,
+        "CALEND_DATE_DAY": 10,
+        "CALEND_DATE_HOUR": 16,
+        "CALEND_DATE_MINUTE": 38,
+        "ORBIT_NUMBER": 101,
+    }
+    return (
+        # 1st record: V4H SFA data, and V4L DFT spectra and waveforms (mode 1)
+        _viking_record(
+            dict(date, RECORD_NUMBER=1, CALEND_DATE_SECOND=6),
+            header2={"V4H_SFA_SWEEP_TYPE": 1},
+            header3={
+                "V4L_TM_MODE": 1,
+                "V4L_NUMBER_OF_DFT_SPECTRA": 2,
+                "V4L_NUMBER_OF_DFT_SAMPLES": 8,
+                "V4L_NUMBER_OF_SERIES_PER_WF_CHANNEL": 1,
+                "V4L_NUMBER_OF_SAMPLES_PER_WF_CHANNEL": 3,
+            },
+            status={3: {"ST9": [0, 0, 7, 0, 0, 0, 0, 0], "ST5": 5}},
+            sfa={"ELECTRIC_SFA": range(256)},
+            dft_wf=range(14),
+        )
+        + _viking_record(
+            dict(
+                date,
+                RECORD_NUMBER=2,
+                CALEND_DATE_SECOND=8,
+                CALEND_DATE_MILLI_SECOND=250,
+            )
+        )
+        # 3rd record: V4L DFT spectra only (mode 2)
+        + _viking_record(
+            dict(
+                date,
+                RECORD_NUMBER=3,
+                CALEND_DATE_SECOND=10,
+                CALEND_DATE_MILLI_SECOND=500,
+            ),
+            header3={
+                "V4L_TM_MODE": 2,
+                "V4L_NUMBER_OF_DFT_SPECTRA": 1,
+                "V4L_NUMBER_OF_DFT_SAMPLES": 5,
+            },
+            dft_wf=[1] * 5,
+            v2_amplitude={3: 42},
+        )
+    )
+
+
+def test_viking_v4n_e5_bin_dataset__records(tmp_path):
+    filepath = tmp_path / "V4N_0101_003"
+    filepath.write_bytes(_viking_records())
+    data = Data(filepath=filepath)
+    assert isinstance(data, VikingV4nE5BinData)
+
+    # the fixed-length blocks of the records are decoded at once
+    assert data.table["HEADER1"]["RECORD_NUMBER"].tolist() == [1, 2, 3]
+    assert data.table["HEADER1"]["ORBIT_NUMBER"].tolist() == [101, 101, 101]
+    assert data.table["VIKING_V4H_SFA"]["ELECTRIC_SFA"].shape == (3, 256)
+    assert data.times.isot.tolist() == [
+        "1994-11-10T16:38:06.000",
+        "1994-11-10T16:38:08.250",
+        "1994-11-10T16:38:10.500",
+    ]
+
+    records = list(data.records)
+    assert len(records) == 3
+    (header1, header2, header3), status, orbit, data_0 = records[0]
+    assert header1["CALEND_DATE_SECOND"] == 6
+    assert header3["V4L_TM_MODE"] == 1
+    assert status.shape == (16,)
+    assert status[3]["ST9"].tolist() == [0, 0, 7, 0, 0, 0, 0, 0]
+    assert status[3]["ST5"] == 5
+    assert data_0["VIKING_V4H_SFA"]["ELECTRIC_SFA"][255] == 255
+    assert data_0["VIKING_V4H_FB"]["MAGNETIC_FB"] is None
+    assert data_0["VIKING_V4L_DFT"]["DFT"].tolist() == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert data_0["VIKING_V4L_WF"]["WF1"].tolist() == [[8, 9, 10]]
+    assert data_0["VIKING_V4L_WF"]["WF2"].tolist() == [[11, 12, 13]]
+    assert data_0["VIKING_V4_V2"] is None
+
+    # empty data blocks
+    data_1 = records[1][3]
+    assert data_1["VIKING_V4H_SFA"]["ELECTRIC_SFA"] is None
+    assert data_1["VIKING_V4L_DFT"]["DFT"] is None
+    assert data_1["VIKING_V4_V1"]["V1_EPAR"] is None
+
+    # random access
+    data_2 = data.records[-1][3]
+    assert data_2["VIKING_V4L_DFT"]["DFT"].tolist() == [[1, 1, 1, 1, 1]]
+    assert data_2["VIKING_V4L_WF"] == {"WF1": None, "WF2": None}
+    assert data_2["VIKING_V4_V2"]["V2_AMPLITUDE"][3] == 42
+
+
+def test_viking_v4n_e5_bin_dataset__record_length_error(tmp_path):
+    filepath = tmp_path / "V4N_0101_003"
+    filepath.write_bytes(_viking_records()[:-1])
+    with pytest.raises(ValueError, match="Wrong record length"):
+        Data(filepath=filepath).times
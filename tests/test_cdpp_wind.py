@@ -15,6 +15,7 @@ from maser.data.cdpp import (
     WindWavesTnrL260sV1BinData,
 )
 from maser.data.cdpp.wind.sweeps import WindWavesL2Sweep
+import numpy
 import pytest
 from pathlib import Path
 import xarray
@@ -114,6 +115,94 @@ def test_wi_wa_rad1_l2_bin_dataset__as_xarray():
     assert set(data.dataset_keys) == set(list(xr.keys()))
 
 
+def _write_wi_wa_rad1_l2(filepath, sweeps):
+    from maser.data.cdpp.wind.data import _L2_HEADER_DTYPE
+
+    # each sweep is given by its (second of minute, frequency list), with NZPALF = 1 and
+    # the time of the i-th frequency (S, SP and Z) being 0.5 * i seconds after its start
+    content = b""
+    for second, freq in sweeps:
+        freq = numpy.array(freq, dtype=">f4")
+        header = numpy.zeros(1, dtype=_L2_HEADER_DTYPE)
+        header["CCSDS_PREAMBLE"] = 76
+        for name, value in zip(["YEAR", "MONTH", "DAY", "HOUR"], [1994, 11, 10, 16]):
+            header[f"CALEND_DATE_{name}"] = value
+        header["CALEND_DATE_SECOND"] = second
+        header["MODE"] = 3
+        header["NPALIF"], header["NSPALF"], header["NZPALF"] = len(freq), 2, 1
+        tspal = numpy.repeat(0.5 * numpy.arange(len(freq)), 2).astype(">f4")
+        tzpal = (0.5 * numpy.arange(len(freq))).astype(">f4")
+        payload = b"".join(
+            [
+                header.tobytes(),
+                freq.tobytes(),
+                numpy.repeat(freq, 2).tobytes(),
+                tspal.tobytes(),
+                (freq + second).astype(">f4").tobytes(),
+                tzpal.tobytes(),
+            ]
+        )
+        length = numpy.array([len(payload)], dtype=">i4").tobytes()
+        content += length + payload + length
+    filepath.write_bytes(content)
+
+
+def test_wi_wa_rad1_l2_bin_dataset__lazy_loading(tmp_path):
+    filepath = tmp_path / "wi_wa_rad1_l2_19941110_v01.dat"
+    _write_wi_wa_rad1_l2(filepath, [(0, [100, 200]), (10, [100, 200])])
+    data = Data(filepath=filepath, memory_map=True)
+    # the sweeps are only decoded when used
+    assert data._data_ is None
+    assert [s.header["CALEND_DATE_SECOND"] for s in data.sweeps] == [0, 10]
+    assert data._nsweep == 2
+    assert data._data_ is not None
+
+
+def test_wi_wa_rad1_l2_bin_dataset__as_xarray__degenerated_sweeps(tmp_path):
+    filepath = tmp_path / "wi_wa_rad1_l2_19941110_v01.dat"
+    # each frequency is measured twice in the first sweep: 2 times per sweep
+    _write_wi_wa_rad1_l2(
+        filepath, [(0, [100, 200, 100, 200]), (10, [100, 200, 300, 100])]
+    )
+    data = Data(filepath=filepath)
+    assert data.frequencies[0].value.tolist() == [100, 200, 300]
+    assert data.times.isot.tolist() == [
+        "1994-11-10T16:00:00.000",
+        "1994-11-10T16:00:01.000",
+        "1994-11-10T16:00:10.000",
+        "1994-11-10T16:00:11.000",
+    ]
+
+    xr = data.as_xarray(replicate=False)
+    assert xr["VZ"].shape == (3, 4)
+    assert numpy.array_equal(
+        xr["VZ"].values,
+        [[100, 100, 110, 110], [200, 200, 210, numpy.nan], [numpy.nan] * 3 + [310]],
+        equal_nan=True,
+    )
+    # times relative to the grid times
+    assert numpy.array_equal(
+        xr["TZ"].values,
+        [[0, 0, 0, 0.5], [0.5, 0.5, 0.5, numpy.nan], [numpy.nan] * 3 + [0]],
+        equal_nan=True,
+    )
+
+    # missing values are replaced by the last previous one, in the sweep or in the previous
+    # sweep
+    xr = data.as_xarray()
+    assert numpy.array_equal(
+        xr["VZ"].values,
+        [[100, 100, 110, 110], [200, 200, 210, 210], [numpy.nan] * 3 + [310]],
+        equal_nan=True,
+    )
+    assert numpy.array_equal(
+        xr["TZ"].values,
+        [[0, 0, 0, 0.5], [0.5, 0.5, 0.5, -0.5], [numpy.nan] * 3 + [0]],
+        equal_nan=True,
+    )
+    assert set(xr.keys()) == set(data.dataset_keys)
+
+
 @pytest.mark.test_data_required
 def test_wi_wa_rad1_l2_bin_dataset_quicklook():
     filepath = TEST_FILES["cdpp_wi_wa_rad1_l2"][0]
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from maser.data import DataCollection
+from maser.data.base import CdfData
+from maser.data.nancay import OrnNdaRoutineJupEdrCdfData
+from datetime import datetime, timedelta
+from pathlib import Path
+import numpy
+import pytest
+from .fixtures import skip_if_spacepy_not_available
+
+
+def _write_nda_routine_cdf(filepath, start, n_records):
+    from spacepy import pycdf
+
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "srn_nda_routine_jup_edr"
+        cdf["Epoch"] = [start + timedelta(minutes=i) for i in range(n_records)]
+        cdf["Frequency"] = 10 + numpy.arange(4, dtype=float)
+        cdf["Frequency"].attrs["UNITS"] = "MHz"
+        for key in ["LL", "RR"]:
+            cdf[key] = numpy.arange(n_records * 4, dtype=numpy.float32).reshape(
+                n_records, 4
+            )
+            cdf[key].attrs["LABLAXIS"] = key
+            cdf[key].attrs["UNITS"] = "dB"
+            cdf[key].attrs["CATDESC"] = key
+        cdf["STATUS"] = numpy.zeros((n_records, 4), dtype=numpy.int8)
+        cdf["RR_SWEEP_TIME_OFFSET"] = numpy.zeros(n_records)
+
+
+@pytest.fixture
+def nda_collection_dir(tmp_path):
+    # two granules (written in reverse time order) and a file of another kind
+    _write_nda_routine_cdf(tmp_path / "b.cdf", datetime(2020, 1, 1), 10)
+    _write_nda_routine_cdf(tmp_path / "a.cdf", datetime(2020, 1, 2), 5)
+    (tmp_path / "notes.txt").write_text("not a data file")
+    return tmp_path
+
+
+@skip_if_spacepy_not_available
+def test_data_collection(nda_collection_dir):
+    collection = DataCollection(nda_collection_dir)
+    assert collection.dataset == "orn_nda_routine_jup_edr"
+    assert len(collection) == 2
+    # the span of the granules is unknown until they are opened
+    assert numpy.isnat(collection.coverage["start"]).all()
+    assert all(isinstance(data, OrnNdaRoutineJupEdrCdfData) for data in collection)
+    assert [path.name for path in collection.coverage["filepath"]] == [
+        "b.cdf",
+        "a.cdf",
+    ]
+
+    times = collection.times
+    assert len(times) == 15
+    assert times[9].isot == "2020-01-01T00:09:00.000"
+    assert times[10].isot == "2020-01-02T00:00:00.000"
+
+    assert len(list(collection.sweeps)) == 15
+
+    dataset = collection.as_xarray()
+    assert dataset["LL"].shape == (4, 15)
+
+
+@skip_if_spacepy_not_available
+def test_data_collection__time_range(nda_collection_dir):
+    collection = DataCollection(str(nda_collection_dir / "*.cdf"))
+    time_range = ("2020-01-01T00:08", "2020-01-02T00:01")
+
+    granules = list(collection.granules(time_range))
+    assert [data.filepath.name for data in granules] == ["b.cdf", "a.cdf"]
+    assert [
+        data.filepath.name for data in collection.granules((None, "2020-01-01"))
+    ] == ["b.cdf"]
+
+    dataset = collection.as_xarray(time_range=time_range, freq_range=(11, 12))
+    assert dataset["frequency"].values.tolist() == [11.0, 12.0]
+    assert dataset["time"].values.astype("M8[s]").astype(str).tolist() == [
+        "2020-01-01T00:08:00",
+        "2020-01-01T00:09:00",
+        "2020-01-02T00:00:00",
+        "2020-01-02T00:01:00",
+    ]
+
+    with pytest.raises(ValueError):
+        collection.as_xarray(time_range=("2021-01-01", None))
+
+
+@skip_if_spacepy_not_available
+def test_data_collection__dataset(nda_collection_dir):
+    # the dataset of the granules is checked when they are opened
+    collection = DataCollection(
+        [nda_collection_dir / "a.cdf"], dataset="orn_nda_routine_sun_edr"
+    )
+    assert len(collection) == 1
+    assert list(collection.granules()) == []
+    assert len(collection.coverage) == 0
+
+    with pytest.raises(KeyError):
+        DataCollection(nda_collection_dir, dataset="toto")
+
+
+@pytest.fixture
+def opened_files(monkeypatch):
+    # record the files opened by the CDF datasets
+    opened = []
+    open_cdf = CdfData.open.__func__
+
+    def open(cls, filepath, *args, **kwargs):
+        opened.append(Path(filepath).name)
+        return open_cdf(cls, filepath, *args, **kwargs)
+
+    monkeypatch.setattr(CdfData, "open", classmethod(open))
+    return opened
+
+
+@skip_if_spacepy_not_available
+def test_data_collection__filename_dates(tmp_path, opened_files):
+    for day in range(1, 6):
+        _write_nda_routine_cdf(
+            tmp_path / f"srn_nda_routine_jup_edr_202001{day:02d}.cdf",
+            datetime(2020, 1, day, 12),
+            5,
+        )
+    collection = DataCollection(tmp_path, dataset="orn_nda_routine_jup_edr")
+    assert len(collection) == 5
+    assert not collection.coverage["exact"].any()
+    assert opened_files == []
+
+    dataset = collection.as_xarray(time_range=("2020-01-03T11:00", "2020-01-03T13:00"))
+    assert dataset["LL"].shape == (4, 5)
+    assert opened_files == ["srn_nda_routine_jup_edr_20200103.cdf"]
+    assert collection.coverage["exact"].tolist() == [False, False, True, False, False]
+
+    # a time range between the data of a granule gives an empty dataset
+    dataset = collection.as_xarray(
+        time_range=("2020-01-03T12:01:30", "2020-01-03T12:01:40")
+    )
+    assert dataset["LL"].shape == (4, 0)
+
+
+@skip_if_spacepy_not_available
+def test_data_collection__catalog(nda_collection_dir, opened_files):
+    # the span of the granules is not given by their names, they are all opened once
+    collection = DataCollection(nda_collection_dir, catalog=True)
+    assert collection.dataset == "orn_nda_routine_jup_edr"
+    assert len(list(collection.granules((None, "2020-01-01")))) == 1
+    assert sorted(set(opened_files)) == ["a.cdf", "b.cdf"]
+    assert (nda_collection_dir / ".maser_catalog.json").is_file()
+
+    # then their span and dataset are read from the catalog
+    opened_files.clear()
+    collection = DataCollection(nda_collection_dir, catalog=True)
+    assert collection.dataset == "orn_nda_routine_jup_edr"
+    assert collection.coverage["exact"].all()
+    assert collection.coverage["start"].astype(str).tolist() == [
+        "2020-01-01T00:00:00.000000000",
+        "2020-01-02T00:00:00.000000000",
+    ]
+    assert opened_files == []
+    assert [len(data.times) for data in collection.granules((None, "2020-01-01"))] == [
+        10
+    ]
+    assert opened_files == ["b.cdf"]
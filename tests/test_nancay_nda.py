@@ -8,6 +8,7 @@ from maser.data.nancay import (
     OrnNdaRoutineSunEdrCdfData,
     OrnNdaNewRoutineJupEdrFitsData,
 )
+import numpy
 import pytest
 from .fixtures import skip_if_spacepy_not_available
 import xarray
@@ -118,6 +119,64 @@ def test_srn_nda_routine_jup_edr_dataset__access_mode_error():
         )
 
 
+@skip_if_spacepy_not_available
+def test_srn_nda_routine_jup_edr_dataset__sweeps(tmp_path, monkeypatch):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+    from maser.data.nancay.nda.sweeps import OrnNdaRoutineEdrSweeps
+
+    filepath = tmp_path / "srn_nda_routine_jup_edr.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "srn_nda_routine_jup_edr"
+        cdf["Epoch"] = [datetime(2016, 1, 30) + timedelta(seconds=i) for i in range(5)]
+        cdf["Frequency"] = [10.0, 20.0, 30.0]
+        cdf["Frequency"].attrs["UNITS"] = "MHz"
+        cdf["RR"] = numpy.arange(15, dtype=numpy.uint8).reshape(5, 3)
+        cdf["LL"] = numpy.arange(15, 30, dtype=numpy.uint8).reshape(5, 3)
+        cdf["STATUS"] = numpy.zeros((5, 3), dtype=numpy.int8)
+        cdf["RR_SWEEP_TIME_OFFSET"] = numpy.arange(5) / 10
+
+    # the sweeps are read by chunks, which must not show in the iteration
+    monkeypatch.setattr(OrnNdaRoutineEdrSweeps, "chunk_size", 2)
+    with Data(filepath=filepath) as data:
+        sweeps = list(data.sweeps)
+    assert len(sweeps) == 5
+    assert sweeps[3].time == Time("2016-01-30 00:00:03")
+    assert sweeps[3].data["RR"].tolist() == [9, 10, 11]
+    assert sweeps[3].data["LL"].tolist() == [24, 25, 26]
+    assert sweeps[3].header["RR_TIME_OFFSET"] == pytest.approx(0.3)
+    assert sweeps[3].frequencies.to(Unit("MHz")).value.tolist() == [10, 20, 30]
+
+
+@skip_if_spacepy_not_available
+def test_srn_nda_routine_jup_edr_dataset__as_xarray_writeable(tmp_path):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+
+    filepath = tmp_path / "srn_nda_routine_jup_edr.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "srn_nda_routine_jup_edr"
+        cdf["Epoch"] = [datetime(2016, 1, 30) + timedelta(seconds=i) for i in range(5)]
+        cdf["Frequency"] = [10.0, 20.0, 30.0]
+        cdf["Frequency"].attrs["UNITS"] = "MHz"
+        for key in ["RR", "LL"]:
+            cdf[key] = numpy.arange(15, dtype=numpy.float32).reshape(5, 3)
+            for attr in ["LABLAXIS", "UNITS", "CATDESC"]:
+                cdf[key].attrs[attr] = key
+        cdf["STATUS"] = numpy.zeros((5, 3), dtype=numpy.int8)
+        cdf["RR_SWEEP_TIME_OFFSET"] = numpy.arange(5) / 10
+
+    with Data(filepath=filepath) as data:
+        # the variables are kept (read-only) in the cache of the data object
+        assert not data._variable("RR").flags.writeable
+        xr = data.as_xarray()
+        # the output can still be modified in place, without changing the cache
+        xr["RR"][...] *= 2
+        assert xr["RR"].values[1].tolist() == [2, 8, 14, 20, 26]
+        assert data._variable("RR")[1].tolist() == [3, 4, 5]
+        assert data.as_xarray()["RR"].values[1].tolist() == [1, 4, 7, 10, 13]
+
+
 @pytest.mark.test_data_required
 def test_orn_nda_routine_jup_edr_dataset_as_xarray():
     for filepath in TEST_FILES["orn_nda_routine_jup_edr"]:
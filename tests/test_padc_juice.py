@@ -12,6 +12,7 @@ from maser.data.base.sweeps import Sweep
 from astropy.time import Time
 from astropy.units import Quantity, Unit
 from pathlib import Path
+import numpy
 import xarray
 from .fixtures import skip_if_spacepy_not_available
 
@@ -203,10 +204,44 @@ def test_jui_rpwi_l1a_sid2__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 6
 
 
+@skip_if_spacepy_not_available
+def test_jui_rpwi_l1a_sid3__sweeps__chunks(tmp_path, monkeypatch):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+    from maser.data.padc.juice.rpwi.sweeps import JuiceCdfDataSweeps
+
+    filepath = tmp_path / "JUICE_L1a_RPWI-HF-SID3.cdf"
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf["Epoch"] = [datetime(2000, 1, 1) + timedelta(seconds=i) for i in range(5)]
+        cdf["frequency"] = numpy.tile([300.0, 100.0, 200.0, -1e31], (5, 1))
+        cdf["frequency"].attrs["UNITS"] = "kHz"
+        for k, key in enumerate(["EuEu", "EvEv", "EwEw"]):
+            cdf[key] = numpy.arange(20.0).reshape(5, 4) + 100 * k
+            cdf[key].attrs["LABLAXIS"] = key
+            cdf[key].attrs["UNITS"] = "(raw)"
+            cdf[key].attrs["CATDESC"] = key
+
+    # the sweeps are read by chunks, which must not show in the iteration
+    monkeypatch.setattr(JuiceCdfDataSweeps, "chunk_size", 2)
+    with Data(filepath=filepath, dataset="JUICE_L1a_RPWI-HF-SID3") as data:
+        sweeps = list(data.sweeps)
+        xdata = data.as_xarray()
+
+    assert len(sweeps) == 5
+    assert sweeps[3].time == Time("2000-01-01 00:00:03")
+    assert sweeps[3].frequencies.value.tolist() == [300.0, 100.0, 200.0]
+    assert sweeps[3].data["EvEv"].tolist() == [112.0, 113.0, 114.0]
+    # the xarray objects of a sweep are those of the whole file, at the sweep time
+    sweep_xdata = sweeps[3].as_xarray()
+    for key in ["EuEu", "EvEv", "EwEw"]:
+        assert sweep_xdata[key].identical(xdata[key].isel(time=[3]))
+
+
 @pytest.mark.test_data_required
 @skip_if_spacepy_not_available
 @for_each_test_file_l1asid2
@@ -304,7 +339,8 @@ def test_jui_rpwi_l1a_sid3__sweeps(filepath):
         # assert isinstance(sweep.data, Quantity)
         # assert isinstance(sweep[2], list)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
             # assert isinstance(sweep.data[key].values[0][0], Quantity)
         # assert len(sweep[2]) == 6
         # assert len(sweep[2][0]) == 126
@@ -406,7 +442,8 @@ def test_jui_rpwi_l1a_sid4__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -502,7 +539,8 @@ def test_jui_rpwi_l1a_sid20__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -594,7 +632,8 @@ def test_jui_rpwi_l1a_sid5__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 1
 
 
@@ -683,7 +722,8 @@ def test_jui_rpwi_l1a_sid21__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -774,7 +814,8 @@ def test_jui_rpwi_l1a_sid6__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -867,7 +908,8 @@ def test_jui_rpwi_l1a_sid22__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -960,7 +1002,8 @@ def test_jui_rpwi_l1a_sid7__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
@@ -1053,7 +1096,8 @@ def test_jui_rpwi_l1a_sid23__sweeps(filepath):
         assert isinstance(sweep._time, Time)
         assert isinstance(sweep.data, dict)
         for key in sweep.data.keys():
-            assert isinstance(sweep.data[key], xarray.DataArray)
+            assert isinstance(sweep.data[key], numpy.ndarray)
+            assert isinstance(sweep.as_xarray()[key], xarray.DataArray)
         assert len(sweep.data.keys()) == 3
 
 
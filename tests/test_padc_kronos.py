@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 import datetime
 
+import numpy
 import pytest
 from maser.data.padc.cassini.kronos import (
     freq_abc,
     fi_freq,
+    fi_freq_array,
     ti_datetime,
+    ti_datetime64,
     t97_datetime,
+    t97_datetime64,
     ydh_datetime,
 )
 
@@ -238,6 +242,41 @@ def test_co_rpws_hfr_kronos__t97_datetime():
     assert t97_datetime(4017) == datetime.datetime(2007, 12, 31)
 
 
+def test_co_rpws_hfr_kronos__fi_freq_array():
+    fi = numpy.array(
+        [3200, 10000800, 20001615, 31000201, 43000800, 803, 20003231], dtype="<u4"
+    )
+    freqs = fi_freq_array(fi)
+    assert freqs.tolist() == [fi_freq(int(item)) for item in fi]
+    with pytest.raises(ValueError):
+        fi_freq_array([1200])
+
+
+def test_co_rpws_hfr_kronos__ti_datetime64():
+    ti = numpy.array([100000, 100100000, 186400, 200000, 1618072000], dtype="<u4")
+    c = numpy.array([0, 0, 0, 1, 99], dtype="u1")
+    times = ti_datetime64(ti, c)
+    assert times.dtype == numpy.dtype("M8[ns]")
+    assert times.tolist() == [
+        numpy.datetime64(ti_datetime(*args), "ns").astype(int) for args in zip(ti, c)
+    ]
+
+
+def test_co_rpws_hfr_kronos__t97_datetime64():
+    t97 = numpy.array([1, 365.5, 366, 4017, 5658.8333449074])
+    times = t97_datetime64(t97)
+    assert times.dtype == numpy.dtype("M8[ns]")
+    assert times.astype("M8[us]").tolist() == [t97_datetime(item) for item in t97]
+
+
+def test_co_rpws_hfr_kronos__t97_datetime64__random():
+    rng = numpy.random.default_rng(97)
+    t97 = numpy.concatenate([rng.uniform(1, 10000, 100000), [4249.268962458258]])
+    assert t97_datetime64(t97).astype("M8[us]").tolist() == [
+        t97_datetime(item) for item in t97
+    ]
+
+
 def test_co_rpws_hfr_kronos__ydh_datetime__int():
     assert ydh_datetime(201218022) == datetime.datetime(2012, 6, 28, 22, 0)
 
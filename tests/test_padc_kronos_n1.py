@@ -3,13 +3,18 @@ from .constants import BASEDIR
 import pytest
 from maser.data import Data
 from maser.data.base import BinData
-from maser.data.padc.cassini.data import CoRpwsHfrKronosN1Data, CoRpwsHfrKronosDataSweep
+from maser.data.padc.cassini.data import (
+    CoRpwsHfrKronosN1Data,
+    CoRpwsHfrKronosDataSweep,
+    kronos_level_format,
+)
 
 from astropy.time import Time
 from astropy.units import Quantity, Unit
 
 from xarray.core.dataarray import DataArray
 from pathlib import Path
+import numpy
 import xarray
 
 TEST_FILES = {
@@ -165,3 +170,35 @@ def test_co_rpws_hfr_kronos_n1_bin_dataset_quicklook():
         data.quicklook(ql_path_tmp, keys=data.dataset_keys)
         assert ql_path_tmp.is_file()
         ql_path_tmp.unlink()
+
+
+def test_co_rpws_hfr_kronos_n1_bin_dataset__sweep_bounds(tmp_path):
+    record_def = kronos_level_format["n1"]["record_def"]
+    dtype = numpy.dtype(list(zip(record_def["fields"], record_def["np_dtype"])))
+    # 4 sweeps (2 modes): 3 + 2 + 3 + 3 records
+    modes = [[3200, 3201, 3202], [800, 801]]
+    records = []
+    for i, mode in enumerate([0, 1, 0, 0]):
+        ti = 1618072000 + 10 * i
+        records += [
+            (2012180020, 0, ti, fi, 0, 0, 0, 0, 0, 0, 0, 0, 0) for fi in modes[mode]
+        ]
+    records += [(2012180020, 0, 1618072040, 3200, 0, 0, 0, 0, 0, 0, 0, 0, 0)] * 3
+    (tmp_path / "n1").mkdir()
+    filepath = tmp_path / "n1" / "R2012180.20"
+    numpy.array(records, dtype=dtype).tofile(filepath)
+
+    data = Data(filepath=filepath)
+    assert isinstance(data, CoRpwsHfrKronosN1Data)
+    starts, stops = data.sweep_bounds
+    assert starts.tolist() == [0, 3, 5, 8, 11]
+    assert stops.tolist() == [3, 5, 8, 11, 14]
+    assert len(data) == 5
+    assert data.max_sweep_length == 3
+    assert data.times[1] == Time("2012-06-28T20:00:10")
+    assert [len(sweep.data) for sweep in data.sweeps] == [3, 2, 3, 3, 3]
+    assert sorted(mask.tolist() for mask in data.sweep_mode_masks) == [
+        [False, False, False, False, True],
+        [False, True, False, False, False],
+        [True, False, True, True, False],
+    ]
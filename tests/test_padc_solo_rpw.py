@@ -12,6 +12,7 @@ from maser.data.padc import (
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity, Unit
 from pathlib import Path
+import numpy
 import xarray
 from .fixtures import skip_if_spacepy_not_available
 
@@ -304,6 +305,122 @@ def test_rpw_tnr_surv_dataset__sweeps(filepath):
         assert len(sweep[2]) == 128
 
 
+def _write_rpw_tnr_surv_cdf(filepath, n_sweep):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+    import numpy
+
+    # sweeps of 4 records (bands A, B, C, D), with 2 channels of 32 frequencies
+    n_rec = 4 * n_sweep
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "solo_L2_rpw-tnr-surv"
+        cdf["Epoch"] = [
+            datetime(2022, 1, 1) + timedelta(seconds=10 * (i // 4) + i % 4)
+            for i in range(n_rec)
+        ]
+        cdf["TNR_BAND"] = numpy.arange(n_rec, dtype=numpy.int8) % 4
+        cdf["SWEEP_NUM"] = numpy.arange(n_rec, dtype=numpy.int32) // 4
+        cdf["SURVEY_MODE"] = numpy.zeros(n_rec, dtype=numpy.int8)
+        cdf["SENSOR_CONFIG"] = numpy.array(
+            [[4 + (i // 4) % 2, 7 if i // 4 == 1 else 9] for i in range(n_rec)],
+            dtype=numpy.int8,
+        )
+        for i, key in enumerate(
+            [
+                "AUTO1",
+                "AUTO2",
+                "FLUX_DENSITY1",
+                "FLUX_DENSITY2",
+                "MAGNETIC_SPECTRAL_POWER1",
+                "MAGNETIC_SPECTRAL_POWER2",
+            ]
+        ):
+            cdf[key] = (
+                numpy.arange(n_rec * 32, dtype=numpy.float32).reshape(n_rec, 32)
+                + 1000 * i
+            )
+        cdf["AUTO1"].attrs["FILLVAL"] = numpy.float32(-1e31)
+        cdf["AUTO1"].attrs["UNITS"] = "V^2/Hz"
+        cdf["TNR_BAND_FREQ"] = numpy.arange(128).reshape(4, 32) * 100.0 + 4000.0
+        cdf["TNR_BAND_FREQ"].attrs["UNITS"] = "Hz"
+
+
+@skip_if_spacepy_not_available
+def test_rpw_tnr_surv_dataset__sweeps__all_records(tmp_path):
+    filepath = tmp_path / "solo_L2_rpw-tnr-surv_20220101_V02.cdf"
+    _write_rpw_tnr_surv_cdf(filepath, 3)
+    with Data(filepath=filepath) as data:
+        sweeps = list(data.sweeps)
+        assert len(sweeps) == 3
+        for i, (values, time, frequencies, sensor_config, survey_mode) in enumerate(
+            sweeps
+        ):
+            assert time == Time(f"2022-01-01T00:00:{10 * i:02d}")
+            assert len(frequencies) == 128
+            assert sensor_config.tolist() == [4 + i % 2, 7 if i == 1 else 9]
+            assert survey_mode == 0
+            assert values["Epoch"].shape == (1, 4)
+            assert values["VOLTAGE_SPECTRAL_POWER1"].shape == (1, 128)
+            # the 4 records of the sweep (including the last record of the file)
+            assert values["VOLTAGE_SPECTRAL_POWER2"][0].tolist() == list(
+                range(1000 + 128 * i, 1000 + 128 * (i + 1))
+            )
+
+
+@skip_if_spacepy_not_available
+def test_rpw_tnr_surv_dataset__as_xarray__bands(tmp_path):
+    filepath = tmp_path / "solo_L2_rpw-tnr-surv_20220101_V02.cdf"
+    _write_rpw_tnr_surv_cdf(filepath, 3)
+    with Data(filepath=filepath) as data:
+        datasets = data.as_xarray()
+        assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"].shape == (128, 3)
+        for i in range(3):
+            # the 4 bands of the sweep, one after the other
+            assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"][:, i].values.tolist() == list(
+                range(128 * i, 128 * (i + 1))
+            )
+            sensor_1 = "V1-V2" if i % 2 == 0 else "V2-V3"
+            sensor_2 = "B_MF" if i == 1 else "HF_V1-V2"
+            assert set(datasets["SENSOR_CH1"][:, i].values) == {sensor_1}
+            assert set(datasets["SENSOR_CH2"][:, i].values) == {sensor_2}
+            assert numpy.array_equal(
+                datasets[sensor_1][:, i], datasets["VOLTAGE_SPECTRAL_POWER_CH1"][:, i]
+            )
+            assert numpy.array_equal(
+                datasets[sensor_2][:, i], datasets["VOLTAGE_SPECTRAL_POWER_CH2"][:, i]
+            )
+            assert numpy.isnan(datasets["V3"][:, i]).all()
+            # band D is read 3 seconds after band A
+            assert datasets["DELTA_TIMES"][:, i].values[[0, 32, 64, 96]] * 86400 == (
+                pytest.approx([0, 1, 2, 3])
+            )
+
+
+@skip_if_spacepy_not_available
+def test_rpw_tnr_surv_dataset__as_xarray__time_range(tmp_path):
+    from datetime import datetime
+
+    filepath = tmp_path / "solo_L2_rpw-tnr-surv_20220101_V02.cdf"
+    _write_rpw_tnr_surv_cdf(filepath, 3)
+    with Data(filepath=filepath) as data:
+        # the sweeps starting within the time range, with all their records
+        datasets = data.as_xarray(time_range=("2022-01-01T00:00:01", None))
+        assert datasets["time"].values.astype("M8[s]").tolist() == [
+            datetime(2022, 1, 1, 0, 0, 10),
+            datetime(2022, 1, 1, 0, 0, 20),
+        ]
+        assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"][:, 1].values.tolist() == list(
+            range(256, 384)
+        )
+        # no sweep within the time range (between two sweeps, or out of the file)
+        for time_range in [
+            ("2022-01-01T00:00:05", "2022-01-01T00:00:08"),
+            ("2023-01-01", None),
+        ]:
+            datasets = data.as_xarray(time_range=time_range)
+            assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"].shape == (128, 0)
+
+
 @pytest.mark.test_data_required
 @skip_if_spacepy_not_available
 @for_each_test_file
@@ -471,6 +588,72 @@ def test_rpw_hfr_surv_data__as_xarray(filepath):
         assert set(data.dataset_keys) == set(list(datasets.keys()))
 
 
+def _write_rpw_hfr_surv_cdf(filepath):
+    from spacepy import pycdf
+    from datetime import datetime, timedelta
+
+    # 3 sweeps of 4 frequencies, the second one in decreasing frequency order and
+    # measured on channel 1 only
+    freq = [375.0, 425.0, 3625.0, 3725.0]
+    records = [(i, f) for i in range(3) for f in (freq[::-1] if i == 1 else freq)]
+    with pycdf.CDF(str(filepath), "") as cdf:
+        cdf.attrs["Logical_source"] = "solo_L2_rpw-hfr-surv"
+        cdf["Epoch"] = [
+            datetime(2022, 1, 1) + timedelta(seconds=10 * i + j % 4)
+            for j, (i, _) in enumerate(records)
+        ]
+        cdf["SWEEP_NUM"] = numpy.array([i for i, _ in records], dtype=numpy.int32)
+        cdf["FREQUENCY"] = numpy.array([f for _, f in records], dtype=numpy.float32)
+        cdf["FREQUENCY"].attrs["UNITS"] = "kHz"
+        cdf["AGC1"] = numpy.array([f for _, f in records], dtype=numpy.float32)
+        cdf["AGC1"].attrs["UNITS"] = "V^2/Hz"
+        cdf["AGC2"] = numpy.array(
+            [numpy.nan if i == 1 else -f for i, f in records], dtype=numpy.float32
+        )
+        cdf["SENSOR_CONFIG"] = numpy.array([[4, 9]] * len(records), dtype=numpy.int8)
+        cdf["SURVEY_MODE"] = numpy.zeros(len(records), dtype=numpy.int8)
+
+
+@skip_if_spacepy_not_available
+def test_rpw_hfr_surv_dataset__as_xarray__unsorted_sweep(tmp_path):
+    filepath = tmp_path / "solo_L2_rpw-hfr-surv_20220101_V01.cdf"
+    _write_rpw_hfr_surv_cdf(filepath)
+    with Data(filepath=filepath) as data:
+        datasets = data.as_xarray()
+        assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"].shape == (4, 3)
+        # the values are sorted by frequency in each sweep
+        assert (
+            datasets["VOLTAGE_SPECTRAL_POWER_CH1"].values.T == [375, 425, 3625, 3725]
+        ).all()
+        assert numpy.isnan(datasets["VOLTAGE_SPECTRAL_POWER_CH2"][:, 1]).all()
+        assert datasets["FREQ_INDICES"][:, 1].values.tolist() == [3, 2, 1, 0]
+        # ... and so are their times
+        assert (datasets["DELTA_TIMES"].values * 86400).T == pytest.approx(
+            numpy.array([[0, 1, 2, 3], [3, 2, 1, 0], [0, 1, 2, 3]])
+        )
+        assert datasets["SENSOR"].values.tolist() == ["HF_V1-V2", "V1-V2", "HF_V1-V2"]
+        assert datasets["CHANNEL"].values.tolist() == [2, 1, 2]
+        assert numpy.isnan(datasets["V1-V2"][:, [0, 2]]).all()
+        assert (datasets["V1-V2"][:, 1] == [375, 425, 3625, 3725]).all()
+
+
+@skip_if_spacepy_not_available
+def test_rpw_hfr_surv_dataset__as_xarray__time_range(tmp_path):
+    filepath = tmp_path / "solo_L2_rpw-hfr-surv_20220101_V01.cdf"
+    _write_rpw_hfr_surv_cdf(filepath)
+    with Data(filepath=filepath) as data:
+        datasets = data.as_xarray(time_range=("2022-01-01T00:00:10", None))
+        assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"].shape == (4, 2)
+        assert datasets["FREQ_INDICES"][:, 0].values.tolist() == [3, 2, 1, 0]
+        # no sweep within the time range (between two sweeps, or out of the file)
+        for time_range in [
+            ("2022-01-01T00:00:05", "2022-01-01T00:00:08"),
+            ("2023-01-01", None),
+        ]:
+            datasets = data.as_xarray(time_range=time_range)
+            assert datasets["VOLTAGE_SPECTRAL_POWER_CH1"].shape == (4, 0)
+
+
 @pytest.mark.test_data_required
 @skip_if_spacepy_not_available
 @for_each_test_file
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from maser.data.parallel import map_files, FileResult
+from pathlib import Path
+import logging
+import numpy
+import pytest
+import time
+
+
+def _read_values(filepath):
+    values = numpy.array(Path(filepath).read_text().split(), dtype=float)
+    return {"values": values, "size": len(values), "name": Path(filepath).name}
+
+
+@pytest.fixture
+def text_files(tmp_path):
+    filepaths = []
+    for i in range(5):
+        filepath = tmp_path / f"file_{i}.txt"
+        filepath.write_text(" ".join(str(i * 10 + j) for j in range(i + 1)))
+        filepaths.append(filepath)
+    # a file which cannot be read
+    filepaths.insert(2, tmp_path / "missing.txt")
+    return filepaths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_files(text_files, workers):
+    results = list(map_files(_read_values, text_files, workers=workers, chunksize=2))
+    assert [result.filepath for result in results] == text_files
+    assert all(isinstance(result, FileResult) for result in results)
+
+    failed = results.pop(2)
+    assert failed.value is None
+    assert isinstance(failed.error, FileNotFoundError)
+
+    for i, result in enumerate(results):
+        assert result.error is None
+        assert result.value["name"] == f"file_{i}.txt"
+        assert result.value["size"] == i + 1
+        assert result.value["values"].tolist() == [i * 10 + j for j in range(i + 1)]
+
+
+def test_map_files__unordered(text_files):
+    results = list(map_files(_read_values, text_files, workers=2, ordered=False))
+    assert sorted(result.filepath for result in results) == sorted(text_files)
+    assert sum(result.error is not None for result in results) == 1
+
+
+def test_map_files__shared_memory(text_files):
+    results = [
+        result
+        for result in map_files(_read_values, text_files, workers=2)
+        if result.error is None
+    ]
+    # the arrays are views into the shared memory block, not copies
+    assert all(not result.value["values"].flags.owndata for result in results)
+    assert [result.value["values"].tolist() for result in results][-1] == [
+        40.0,
+        41.0,
+        42.0,
+        43.0,
+        44.0,
+    ]
+
+
+def _large_array(filepath):
+    time.sleep(0.05)
+    return numpy.full(20000, float(Path(filepath).name.split("_")[1]))
+
+
+def test_map_files__shared_memory_reuse(tmp_path):
+    # 12 results of 3 pages each, through a block of 16 pages
+    filepaths = [tmp_path / f"file_{i}" for i in range(12)]
+    shared = []
+    for i, result in enumerate(
+        map_files(_large_array, filepaths, workers=2, shared_size=2**20)
+    ):
+        assert result.value.tolist() == [i] * 20000
+        shared.append(not result.value.flags.owndata)
+    # the space of the released results is reused for the next ones
+    assert all(shared)
+
+
+def test_map_files__shared_memory_full(text_files, caplog):
+    # the arrays which do not fit in the shared memory block are pickled (the block holds a
+    # single page, and the results are kept)
+    with caplog.at_level(logging.WARNING, logger="maser.data.parallel"):
+        results = [
+            result
+            for result in map_files(_read_values, text_files, workers=2, shared_size=1)
+            if result.error is None
+        ]
+    assert [result.value["values"].flags.owndata for result in results].count(
+        False
+    ) == 1
+    assert [result.value["size"] for result in results] == [1, 2, 3, 4, 5]
+    assert "shared memory block of the results is full" in caplog.text
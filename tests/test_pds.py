@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from maser.data.pds.utils import PDSLabelDict
+from maser.data.pds.utils import PDSLabelDict, PDSDataTableObject
 from .constants import BASEDIR
 from maser.data import Data
 from maser.data.pds import (
@@ -9,6 +9,7 @@ from maser.data.pds import (
     Vg2NPra3RdrLowband6secV1Data,
     Vg1JPra4SummBrowse48secV1Data,
 )
+import numpy
 import pytest
 import xarray
 from pathlib import Path
@@ -41,6 +42,83 @@ def test_pds_label_dict():
     assert isinstance(label, PDSLabelDict)
 
 
+def test_pds_data_table_object__binary(tmp_path):
+    columns = [
+        {"NAME": "A", "DATA_TYPE": "MSB_INTEGER", "START_BYTE": "1", "BYTES": "2"},
+        {"NAME": "B", "DATA_TYPE": "PC_REAL", "START_BYTE": "4", "BYTES": "4"},
+        {
+            "NAME": "C",
+            "DATA_TYPE": "MSB_UNSIGNED_INTEGER",
+            "START_BYTE": "8",
+            "BYTES": "6",
+            "ITEMS": "3",
+            "ITEM_BYTES": "2",
+        },
+        {"NAME": "D", "DATA_TYPE": "CHARACTER", "START_BYTE": "14", "BYTES": "3"},
+    ]
+    label = {
+        "COLUMNS": "4",
+        "ROWS": "2",
+        "ROW_BYTES": "16",
+        "ROW_PREFIX_BYTES": "2",
+        "ROW_SUFFIX_BYTES": "1",
+        "INTERCHANGE_FORMAT": "BINARY",
+        "COLUMN": columns,
+    }
+    rows = numpy.zeros(
+        2,
+        dtype=numpy.dtype(
+            {
+                "names": ["A", "B", "C", "D"],
+                "formats": [">i2", "<f4", (">u2", 3), "S3"],
+                "offsets": [0, 3, 7, 13],
+                "itemsize": 19,
+            }
+        ),
+    )
+    rows["A"] = [-2, 3]
+    rows["B"] = [1.5, -0.25]
+    rows["C"] = [[1, 2, 3], [4, 5, 600]]
+    rows["D"] = [b"abc", b"def"]
+    filepath = tmp_path / "table.dat"
+    filepath.write_bytes(b"header" + rows.tobytes())
+
+    table = PDSDataTableObject(label, filepath, data_offset=6)
+    table.load_data()
+    assert table.row_dtype.itemsize == 19
+    assert table["A"].tolist() == [-2, 3]
+    assert table["B"].tolist() == [1.5, -0.25]
+    assert table["C"].tolist() == [[1, 2, 3], [4, 5, 600]]
+    assert table["D"].tolist() == [["a", "b", "c"], ["d", "e", "f"]]
+
+
+def test_pds_data_table_object__ascii(tmp_path):
+    columns = [
+        {"NAME": "A", "DATA_TYPE": "ASCII_INTEGER", "START_BYTE": "1", "BYTES": "4"},
+        {
+            "NAME": "B",
+            "DATA_TYPE": "ASCII_REAL",
+            "START_BYTE": "6",
+            "BYTES": "7",
+            "ITEMS": "2",
+        },
+    ]
+    label = {
+        "COLUMNS": "2",
+        "ROWS": "2",
+        "ROW_BYTES": "21",
+        "INTERCHANGE_FORMAT": "ASCII",
+        "COLUMN": columns,
+    }
+    filepath = tmp_path / "table.tab"
+    filepath.write_text("  12  1.5E+0 -0.250\r\n  -3 12.0000  1.000\r\n")
+
+    table = PDSDataTableObject(label, filepath)
+    table.load_data()
+    assert table["A"].tolist() == [12, -3]
+    assert table["B"].tolist() == [[1.5, -0.25], [12.0, 1.0]]
+
+
 @pytest.mark.test_data_required
 def test_pds3_dataset():
     data = Data(
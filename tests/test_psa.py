@@ -10,6 +10,7 @@ from maser.data.pds import Pds3Data
 import pytest
 from pathlib import Path
 from astropy.units import Quantity
+import numpy
 import xarray
 
 
@@ -97,6 +98,75 @@ def test_mex_m_marsis_3_rdr_ais_ext4_v1_0__as_xarray(mex_data):
     assert set(data.dataset_keys) == set(list(xr.keys()))
 
 
+def test_mex_m_marsis_3_rdr_ais_v1_0__sweep_mapping(tmp_path):
+    # synthetic AIS table: 3 sweeps of 4 frequency steps
+    rows = numpy.zeros(
+        12,
+        dtype=numpy.dtype(
+            {
+                "names": ["SCET_MSEC", "SCET_STRING", "PROCESS_ID", "INSTRUMENT_MODE"]
+                + ["FREQUENCY", "SPECTRAL_DENSITY"],
+                "formats": [">u4", "S24", "u1", "u1", ">f4", (">f4", 80)],
+                "offsets": [12, 24, 48, 49, 76, 80],
+                "itemsize": 400,
+            }
+        ),
+    )
+    rows["SCET_MSEC"] = numpy.repeat([1000, 8500, 1000], 4)
+    rows["SCET_STRING"] = numpy.repeat(
+        [b"2014-294T00:00:01.000", b"2014-294T00:00:08.500", b"2014-295T00:00:01.000"],
+        4,
+    )
+    rows["PROCESS_ID"] = 78
+    rows["INSTRUMENT_MODE"] = 0x17
+    rows["FREQUENCY"] = numpy.tile([1e5, 2e5, 3e5, 4e5], 3)
+    rows["SPECTRAL_DENSITY"] = numpy.arange(12 * 80).reshape(12, 80)
+    (tmp_path / "FRM_AIS_RDR.DAT").write_bytes(rows.tobytes())
+    (tmp_path / "FRM_AIS_RDR.LBL").write_text(
+        "\n".join(
+            [
+                'DATA_SET_ID = "MEX-M-MARSIS-3-RDR-AIS-V1.0"',
+                '^AIS_TABLE = "FRM_AIS_RDR.DAT"',
+                "OBJECT = AIS_TABLE",
+                "INTERCHANGE_FORMAT = BINARY",
+                "ROWS = 12",
+                "COLUMNS = 14",
+                "ROW_BYTES = 400",
+                '^STRUCTURE = "AIS_FORMAT.FMT"',
+                "END_OBJECT = AIS_TABLE",
+                "END",
+            ]
+        )
+    )
+
+    data = Data(filepath=tmp_path / "FRM_AIS_RDR.LBL")
+    assert isinstance(data, MexMMarsis3RdrAisV1Data)
+    assert data.sweep_mapping == {0: slice(0, 4), 1: slice(4, 8), 2: slice(8, 12)}
+    assert [time.isot for time in data.times] == [
+        "2014-10-21T00:00:01.000",
+        "2014-10-21T00:00:08.500",
+        "2014-10-22T00:00:01.000",
+    ]
+    assert data.frequencies.value.tolist() == [1e5, 2e5, 3e5, 4e5]
+
+    sweeps = list(data.sweeps)
+    assert len(sweeps) == 3
+    assert sweeps[1].time == data.times[1]
+    assert sweeps[1].header["process_id"] == "Active Ionospheric Sounder (AIS)"
+    assert numpy.array_equal(sweeps[1].data, rows["SPECTRAL_DENSITY"][4:8])
+
+    xr = data.as_xarray()
+    assert xr.coords.dims == {"time": 3, "frequency": 4, "sample": 80}
+    assert numpy.array_equal(
+        xr["SPECTRAL_DENSITY"].values,
+        numpy.array([sweep.data for sweep in sweeps]).transpose(1, 0, 2),
+    )
+    assert numpy.array_equal(
+        xr["SPECTRAL_DENSITY_MAX"].values,
+        rows["SPECTRAL_DENSITY"][:, -1].reshape(3, 4).T,
+    )
+
+
 @pytest.mark.test_data_required
 def test_mex_m_marsis_3_rdr_ais_ext4_v1_0_quicklook():
     for dataset in TEST_FILES.keys():
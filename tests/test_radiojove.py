@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import struct
+import numpy
+import pytest
+import xarray
+from maser.data import Data
+from maser.data.radiojove import RadioJoveSpsData, RadioJoveSpsSweep, RadioJoveSpxData
+
+
+def _spx_file(filepath, nchannels, notes, data, obsname=b"AJ4CO DPS"):
+    # primary header: start and stop dates in decimal days since 1899-12-30 (5 s apart)
+    header = struct.pack(
+        "<10s6d1h10s20s20s40s1h1i",
+        b"Version1.1",
+        42713.5,
+        42713.5 + 5 / 86400,
+        29.8,
+        -82.3,
+        1.0,
+        0.0,
+        -5,
+        b"Jupiter",
+        b"Observer",
+        obsname,
+        b"Florida",
+        nchannels,
+        len(notes),
+    )
+    filepath.write_bytes(header + notes + data)
+    return filepath
+
+
+@pytest.fixture
+def sps_values():
+    # 5 sweeps of 3 frequencies x 2 interleaved feeds, followed by the delimiter
+    values = numpy.arange(5 * 7, dtype=">u2").reshape(5, 7)
+    values[:, -1] = 0xFEFE
+    return values
+
+
+def _sps_notes():
+    items = [
+        b"SWEEPS5",
+        b"LOWF15000000",
+        b"HIF30000000",
+        b"STEPS3",
+        b"DUALSPECFILETrue",
+        b"BANNER0RCP <DATE>",
+        b"BANNER1LCP <DATE>",
+        b"COLORGAIN02.5",
+        b"COLORGAIN13.5",
+        b"COLOROFFSET0100",
+        b"COLOROFFSET1200",
+        b"ANTENNATYPEdipole",
+        b"COLORFILEcolors.txt",
+    ]
+    return b"free text*[[*" + b"\xff".join(items) + b"\xff*]]*"
+
+
+def test_radiojove_sps_dataset(tmp_path, sps_values):
+    filepath = _spx_file(
+        tmp_path / "161210000000.sps", 3, _sps_notes(), sps_values.tobytes()
+    )
+    data = Data(filepath)
+    assert isinstance(data, RadioJoveSpsData)
+    assert data.dataset == "radiojove_sps"
+    assert data.dataset_keys == ["RR", "LL"]
+    assert data.frequencies.to_value("MHz").tolist() == [30.0, 22.5, 15.0]
+    assert data.times[1].isot == "2016-12-09T12:00:01.000"
+
+    # the data are views on the file buffer
+    assert data._data["RR"].tolist() == sps_values[:, 0:6:2].tolist()
+    assert data._data["LL"].tolist() == sps_values[:, 1:6:2].tolist()
+    assert numpy.shares_memory(data._data["RR"], data.buffer)
+
+    sweeps = list(data.sweeps)
+    assert len(sweeps) == 5
+    assert isinstance(sweeps[2], RadioJoveSpsSweep)
+    assert sweeps[2].time == data.times[2]
+    assert sweeps[2].data["LL"].tolist() == [15, 17, 19]
+
+    xr = data.as_xarray()
+    assert isinstance(xr, xarray.Dataset)
+    assert xr["RR"].dims == ("frequency", "time")
+    assert xr["RR"].values.tolist() == sps_values[:, 0:6:2].T.tolist()
+    assert xr["time"].values[1] == numpy.datetime64("2016-12-09T12:00:01")
+    xr = data.as_xarray(time_range=("2016-12-09T12:00:01", "2016-12-09T12:00:03"))
+    assert xr["LL"].shape == (3, 3)
+
+
+def test_radiojove_sps_dataset__delimiter(tmp_path, sps_values):
+    sps_values[3, -1] = 0
+    filepath = _spx_file(
+        tmp_path / "161210000000.sps", 3, _sps_notes(), sps_values.tobytes()
+    )
+    with pytest.warns(UserWarning, match="1 sweep"):
+        data = Data(filepath)
+    assert len(data.times) == 5
+
+
+def test_radiojove_spd_dataset(tmp_path):
+    notes = b"*[[*" + b"\xff".join([b"CHL0Channel A", b"CHL1Channel B"]) + b"\xff*]]*"
+    records = numpy.zeros(4, dtype=[("time", "<f8"), ("data", "<f8", (2,))])
+    records["time"] = 42713.5 + numpy.arange(4) * 2 / 86400
+    records["data"] = numpy.arange(8).reshape(4, 2)
+    filepath = _spx_file(
+        tmp_path / "161210000000.spd", 2, notes, records.tobytes(), obsname=b"Obs"
+    )
+    data = Data(filepath)
+    assert data.dataset_keys == ["CH00", "CH01"]
+    assert data.notes["CHL"] == {0: "Channel A", 1: "Channel B"}
+    assert data.frequencies.to_value("MHz").tolist() == [20.1]
+    # the time stamps of the file are used
+    assert data.times[3].isot == "2016-12-09T12:00:06.000"
+    assert data._data["CH01"].tolist() == [[1.0], [3.0], [5.0], [7.0]]
+
+
+def test_radiojove_spx_read_headers(tmp_path, sps_values):
+    sps_path = _spx_file(
+        tmp_path / "161210000000.sps", 3, _sps_notes(), sps_values.tobytes()
+    )
+    notes = b"*[[*" + b"\xff".join([b"CHL0Channel A", b"No Time Stamps"]) + b"\xff*]]*"
+    spd_path = _spx_file(tmp_path / "161210000000.spd", 1, notes, b"", obsname=b"Obs")
+
+    (sps_header, sps_notes), (spd_header, spd_notes) = RadioJoveSpxData.read_headers(
+        [sps_path, spd_path]
+    )
+    data = Data(sps_path)
+    for key in ["start_time", "stop_time", "obsname", "nchannels", "note_length"]:
+        assert sps_header[key] == data.header[key]
+    assert sps_header["file_type"] == "SPS"
+    assert sps_header["file_size"] == sps_path.stat().st_size
+    assert sps_notes == data.notes
+    assert spd_header["file_type"] == "SPD"
+    assert spd_header["obsname"] == "Obs"
+    assert spd_notes["CHL"] == {0: "Channel A"}
+    assert spd_notes["No Time Stamps"]
+
+    # the header notes are truncated
+    sps_path.write_bytes(sps_path.read_bytes()[:200])
+    with pytest.raises(ValueError, match="Truncated"):
+        RadioJoveSpxData.read_headers([sps_path])
+
+
+def test_radiojove_sps_notes__keys(tmp_path, sps_values):
+    items = [
+        b"RCVR",
+        b"COLORRES8",
+        b"CAX10|Frequency (MHz)",
+        b"CLOCKMSG1 clock synchronized",
+        b"UNKNOWNKEY",
+    ]
+    notes = _sps_notes()[:-4] + b"\xff".join(items) + b"\xffCOLORRES9*]]*"
+    filepath = _spx_file(tmp_path / "161210000000.sps", 3, notes, sps_values.tobytes())
+    data = Data(filepath)
+    assert data.notes["free_text"] == "free text"
+    assert data.notes["RCVR"] == -1
+    # (the text after the last delimiter is not a note)
+    assert data.notes["COLORRES"] == 8
+    assert data.notes["CAX1"] == ["Frequency (MHz)"]
+    assert data.notes["CLOCKMSG"] == ["clock synchronized"]
+    assert data.notes["COLORGAIN"] == [2.5, 3.5]
+    assert data.notes["DUALSPECFILE"] is True
+    assert "UNKNOWNKEY" not in data.notes